@@ -1,22 +1,55 @@
 """Reminder management for voice commands.
 
 Implements scheduled reminders with recurring support and JSON persistence.
+
+Persistence uses a JSON snapshot plus an append-only journal next to it
+(``<snapshot>.log``). Each change appends the affected reminders' full records
+to the journal, one JSON object per line; loading replays the journal over
+the snapshot, later records replacing earlier ones. The journal is folded
+back into the snapshot once it grows past twice the number of reminders.
 """
 
+import bisect
 import json
 import logging
+import mmap
+import os
 import re
+import threading
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import Enum
+from operator import itemgetter
 from pathlib import Path
+from typing import Any
 from uuid import UUID
 
+from ..serialization import ORJSON_AVAILABLE, dumps, loads
+
 logger = logging.getLogger(__name__)
 
 
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file.
+
+    With orjson, files of a page or more are memory-mapped and parsed in
+    place rather than copied into a bytes buffer first.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    with open(path, "rb") as f:
+        if not ORJSON_AVAILABLE or os.fstat(f.fileno()).st_size < mmap.PAGESIZE:
+            return loads(f.read())
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            memoryview(mm) as view,
+        ):
+            return loads(view)
+
+
 class ReminderStatus(Enum):
     """Status of a reminder."""
 
@@ -35,7 +68,15 @@ class Recurrence(Enum):
     MONTHLY = "monthly"
 
 
-@dataclass
+# Value -> member lookups for parsing persisted reminders
+_STATUS_BY_VALUE: dict[str, ReminderStatus] = {s.value: s for s in ReminderStatus}
+_RECURRENCE_BY_VALUE: dict[str, Recurrence] = {r.value: r for r in Recurrence}
+
+# Rewrite the snapshot once the journal holds this many lines per reminder
+_JOURNAL_COMPACT_RATIO = 2
+
+
+@dataclass(slots=True)
 class Reminder:
     """A scheduled reminder notification.
 
@@ -67,6 +108,41 @@ class Reminder:
         return datetime.now(UTC) >= self.remind_at
 
 
+def _to_record(reminder: Reminder) -> dict[str, Any]:
+    """Serialize a reminder to its persisted JSON form."""
+    return {
+        "id": str(reminder.id),
+        "message": reminder.message,
+        "remind_at": reminder.remind_at.isoformat(),
+        "recurrence": reminder.recurrence.value,
+        "status": reminder.status.value,
+        "triggered_at": reminder.triggered_at.isoformat() if reminder.triggered_at else None,
+        "created_by_interaction": str(reminder.created_by_interaction),
+        "created_at": reminder.created_at.isoformat(),
+    }
+
+
+def _from_record(item: dict[str, Any]) -> Reminder:
+    """Parse a persisted reminder record.
+
+    Raises:
+        KeyError: If a field or enum value is missing or unknown.
+        ValueError: If an id or timestamp is malformed.
+    """
+    return Reminder(
+        id=UUID(item["id"]),
+        message=item["message"],
+        remind_at=datetime.fromisoformat(item["remind_at"]),
+        recurrence=_RECURRENCE_BY_VALUE[item["recurrence"]],
+        status=_STATUS_BY_VALUE[item["status"]],
+        triggered_at=(
+            datetime.fromisoformat(item["triggered_at"]) if item.get("triggered_at") else None
+        ),
+        created_by_interaction=UUID(item["created_by_interaction"]),
+        created_at=datetime.fromisoformat(item["created_at"]),
+    )
+
+
 class ReminderManager:
     """Manages reminders with create, cancel, query operations.
 
@@ -87,8 +163,22 @@ class ReminderManager:
                               reminders are stored in memory only.
         """
         self._reminders: dict[UUID, Reminder] = {}
+        # (remind_at, id) pairs kept sorted so listing pending reminders needs
+        # no sort and check_due() only touches the due prefix. Entries whose
+        # reminder is no longer pending are skipped, and dropped once due.
+        self._schedule: list[tuple[datetime, UUID]] = []
+        # check_due() runs on the orchestrator's background thread while
+        # commands mutate reminders on the voice thread. Reentrant because
+        # recurring reminders are re-created and _record() may call _save().
+        self._lock = threading.RLock()
         self._on_trigger = on_trigger
         self._persistence_path: Path | None = Path(persistence_path) if persistence_path else None
+        self._journal_path: Path | None = (
+            self._persistence_path.with_name(self._persistence_path.name + ".log")
+            if self._persistence_path
+            else None
+        )
+        self._journal_lines = 0
 
         # Load existing reminders from persistence
         if self._persistence_path:
@@ -112,7 +202,33 @@ class ReminderManager:
         Returns:
             The created Reminder object.
         """
-        now = datetime.now(UTC)
+        with self._lock:
+            reminder = self._add(message, remind_at, interaction_id, recurrence)
+            self._record(reminder)
+        return reminder
+
+    def create_many(self, items: Iterable[dict[str, Any]]) -> list[Reminder]:
+        """Create several reminders, persisting once at the end.
+
+        Args:
+            items: Keyword arguments for each reminder, as accepted by create().
+
+        Returns:
+            The created Reminder objects, in input order.
+        """
+        with self._lock:
+            reminders = [self._add(**item) for item in items]
+            self._record(*reminders)
+        return reminders
+
+    def _add(
+        self,
+        message: str,
+        remind_at: datetime,
+        interaction_id: UUID,
+        recurrence: Recurrence = Recurrence.NONE,
+    ) -> Reminder:
+        """Build a pending reminder and index it without saving."""
         reminder = Reminder(
             id=uuid.uuid4(),
             message=message,
@@ -121,10 +237,10 @@ class ReminderManager:
             status=ReminderStatus.PENDING,
             triggered_at=None,
             created_by_interaction=interaction_id,
-            created_at=now,
+            created_at=datetime.now(UTC),
         )
         self._reminders[reminder.id] = reminder
-        self._save()
+        bisect.insort(self._schedule, (remind_at, reminder.id))
         return reminder
 
     def cancel(self, reminder_id: UUID) -> bool:
@@ -136,12 +252,13 @@ class ReminderManager:
         Returns:
             True if cancelled, False if not found.
         """
-        reminder = self._reminders.get(reminder_id)
-        if reminder is None:
-            return False
+        with self._lock:
+            reminder = self._reminders.get(reminder_id)
+            if reminder is None:
+                return False
 
-        reminder.status = ReminderStatus.CANCELLED
-        self._save()
+            reminder.status = ReminderStatus.CANCELLED
+            self._record(reminder)
         return True
 
     def get(self, reminder_id: UUID) -> Reminder | None:
@@ -161,8 +278,12 @@ class ReminderManager:
         Returns:
             List of pending reminders, sorted by remind_at.
         """
-        pending = [r for r in self._reminders.values() if r.status == ReminderStatus.PENDING]
-        return sorted(pending, key=lambda r: r.remind_at)
+        with self._lock:
+            return [
+                reminder
+                for _, reminder_id in self._schedule
+                if (reminder := self._reminders[reminder_id]).status == ReminderStatus.PENDING
+            ]
 
     def list_all(self) -> list[Reminder]:
         """List all reminders.
@@ -170,7 +291,8 @@ class ReminderManager:
         Returns:
             List of all reminders.
         """
-        return list(self._reminders.values())
+        with self._lock:
+            return list(self._reminders.values())
 
     def check_due(self) -> list[Reminder]:
         """Check for and process due reminders.
@@ -178,22 +300,32 @@ class ReminderManager:
         Returns:
             List of newly triggered reminders.
         """
-        triggered = []
-        for reminder in list(self._reminders.values()):
-            if reminder.status == ReminderStatus.PENDING and reminder.is_due:
+        now = datetime.now(UTC)
+        with self._lock:
+            cut = bisect.bisect_right(self._schedule, now, key=itemgetter(0))
+            due = [
+                reminder
+                for _, reminder_id in self._schedule[:cut]
+                if (reminder := self._reminders[reminder_id]).status == ReminderStatus.PENDING
+            ]
+            del self._schedule[:cut]
+
+            triggered = []
+            for reminder in due:
                 reminder.status = ReminderStatus.TRIGGERED
-                reminder.triggered_at = datetime.now(UTC)
+                reminder.triggered_at = now
                 triggered.append(reminder)
 
-                if self._on_trigger:
-                    self._on_trigger(reminder)
-
                 # Create next occurrence for recurring reminders
                 if reminder.recurrence != Recurrence.NONE:
                     self._create_next_occurrence(reminder)
 
-        if triggered:
-            self._save()
+            self._record(*triggered)
+
+        # Outside the lock so a callback that uses the manager cannot deadlock
+        if self._on_trigger:
+            for reminder in triggered:
+                self._on_trigger(reminder)
 
         return triggered
 
@@ -232,12 +364,13 @@ class ReminderManager:
         Returns:
             True if dismissed, False if not found or not triggered.
         """
-        reminder = self._reminders.get(reminder_id)
-        if reminder is None or reminder.status != ReminderStatus.TRIGGERED:
-            return False
+        with self._lock:
+            reminder = self._reminders.get(reminder_id)
+            if reminder is None or reminder.status != ReminderStatus.TRIGGERED:
+                return False
 
-        reminder.status = ReminderStatus.DISMISSED
-        self._save()
+            reminder.status = ReminderStatus.DISMISSED
+            self._record(reminder)
         return True
 
     def format_reminder(self, reminder: Reminder) -> str:
@@ -263,16 +396,25 @@ class ReminderManager:
         Returns:
             Number of reminders that were cleared.
         """
-        pending = [r for r in self._reminders.values() if r.status == ReminderStatus.PENDING]
-        count = len(pending)
+        with self._lock:
+            pending = [r for r in self._reminders.values() if r.status == ReminderStatus.PENDING]
+            for reminder in pending:
+                reminder.status = ReminderStatus.CANCELLED
 
-        for reminder in pending:
-            reminder.status = ReminderStatus.CANCELLED
+            self._record(*pending)
 
-        if count > 0:
-            self._save()
+        return len(pending)
+
+    def clear(self) -> None:
+        """Remove every reminder regardless of status.
 
-        return count
+        Unlike clear_all(), which cancels pending reminders and keeps them
+        on record, this empties the manager entirely.
+        """
+        with self._lock:
+            self._reminders.clear()
+            self._schedule.clear()
+            self._save()
 
     def check_missed(self) -> list[Reminder]:
         """Check for and return reminders that were missed during system downtime.
@@ -284,88 +426,126 @@ class ReminderManager:
         Returns:
             List of missed reminders (not yet marked as triggered).
         """
-        now = datetime.now(UTC)
-        missed = []
+        with self._lock:
+            cut = bisect.bisect_left(self._schedule, datetime.now(UTC), key=itemgetter(0))
+            return [
+                reminder
+                for _, reminder_id in self._schedule[:cut]
+                if (reminder := self._reminders[reminder_id]).status == ReminderStatus.PENDING
+            ]
+
+    def _record(self, *reminders: Reminder) -> None:
+        """Append the current state of changed reminders to the journal.
+
+        Args:
+            reminders: Reminders whose state changed.
+        """
+        if not self._journal_path or not reminders:
+            return
 
-        for reminder in self._reminders.values():
-            if reminder.status == ReminderStatus.PENDING and reminder.remind_at < now:
-                missed.append(reminder)
+        with self._lock:
+            try:
+                self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self._journal_path, "ab") as f:
+                    f.writelines(dumps(_to_record(r)) + b"\n" for r in reminders)
+                self._journal_lines += len(reminders)
+            except Exception as e:
+                logger.error(f"Failed to record reminder changes: {e}")
+                return
 
-        return sorted(missed, key=lambda r: r.remind_at)
+            if self._journal_lines > _JOURNAL_COMPACT_RATIO * len(self._reminders):
+                self._save()
 
     def _save(self) -> None:
-        """Save reminders to JSON file."""
+        """Write a full snapshot of all reminders and reset the journal.
+
+        Callers that modify reminders directly use this to persist them.
+        """
         if not self._persistence_path:
             return
 
-        try:
-            # Ensure parent directory exists
-            self._persistence_path.parent.mkdir(parents=True, exist_ok=True)
-
-            data = {
-                "version": 1,
-                "reminders": [
-                    {
-                        "id": str(r.id),
-                        "message": r.message,
-                        "remind_at": r.remind_at.isoformat(),
-                        "recurrence": r.recurrence.value,
-                        "status": r.status.value,
-                        "triggered_at": r.triggered_at.isoformat() if r.triggered_at else None,
-                        "created_by_interaction": str(r.created_by_interaction),
-                        "created_at": r.created_at.isoformat(),
-                    }
-                    for r in self._reminders.values()
-                ],
-            }
-
-            with open(self._persistence_path, "w") as f:
-                json.dump(data, f, indent=2)
-
-            logger.debug(f"Saved {len(self._reminders)} reminders to {self._persistence_path}")
+        with self._lock:
+            try:
+                # Ensure parent directory exists
+                self._persistence_path.parent.mkdir(parents=True, exist_ok=True)
 
-        except Exception as e:
-            logger.error(f"Failed to save reminders: {e}")
+                data = {
+                    "version": 1,
+                    "reminders": [_to_record(r) for r in self._reminders.values()],
+                }
+
+                # Replace atomically so a crash never leaves a partial snapshot
+                tmp_path = self._persistence_path.with_name(self._persistence_path.name + ".tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(dumps(data, indent=True))
+                os.replace(tmp_path, self._persistence_path)
+
+                # Journal records are full reminder states, so replaying a stale
+                # journal over the new snapshot would be harmless if this is missed
+                if self._journal_path:
+                    self._journal_path.unlink(missing_ok=True)
+                self._journal_lines = 0
+
+                logger.debug(f"Saved {len(self._reminders)} reminders to {self._persistence_path}")
+
+            except Exception as e:
+                logger.error(f"Failed to save reminders: {e}")
 
     def _load(self) -> None:
-        """Load reminders from JSON file."""
-        if not self._persistence_path or not self._persistence_path.exists():
+        """Load reminders from the JSON snapshot and replay the journal."""
+        if not self._persistence_path:
+            return
+
+        if self._persistence_path.exists():
+            try:
+                data = _read_json(self._persistence_path)
+
+                version = data.get("version", 1)
+                if version != 1:
+                    logger.warning(f"Unknown reminders file version: {version}")
+
+                for item in data.get("reminders", []):
+                    try:
+                        reminder = _from_record(item)
+                        self._reminders[reminder.id] = reminder
+                    except (KeyError, ValueError) as e:
+                        logger.warning(f"Skipping invalid reminder: {e}")
+
+            except json.JSONDecodeError as e:
+                logger.error(f"Invalid JSON in reminders file: {e}")
+            except Exception as e:
+                logger.error(f"Failed to load reminders: {e}")
+
+        self._replay_journal()
+
+        self._schedule = sorted(
+            (r.remind_at, r.id)
+            for r in self._reminders.values()
+            if r.status == ReminderStatus.PENDING
+        )
+
+        logger.info(f"Loaded {len(self._reminders)} reminders from {self._persistence_path}")
+
+        if self._journal_lines > _JOURNAL_COMPACT_RATIO * len(self._reminders):
+            self._save()
+
+    def _replay_journal(self) -> None:
+        """Apply journal records on top of the loaded snapshot."""
+        if not self._journal_path or not self._journal_path.exists():
             return
 
         try:
-            with open(self._persistence_path) as f:
-                data = json.load(f)
-
-            version = data.get("version", 1)
-            if version != 1:
-                logger.warning(f"Unknown reminders file version: {version}")
-
-            for item in data.get("reminders", []):
-                try:
-                    reminder = Reminder(
-                        id=UUID(item["id"]),
-                        message=item["message"],
-                        remind_at=datetime.fromisoformat(item["remind_at"]),
-                        recurrence=Recurrence(item["recurrence"]),
-                        status=ReminderStatus(item["status"]),
-                        triggered_at=(
-                            datetime.fromisoformat(item["triggered_at"])
-                            if item.get("triggered_at")
-                            else None
-                        ),
-                        created_by_interaction=UUID(item["created_by_interaction"]),
-                        created_at=datetime.fromisoformat(item["created_at"]),
-                    )
-                    self._reminders[reminder.id] = reminder
-                except (KeyError, ValueError) as e:
-                    logger.warning(f"Skipping invalid reminder: {e}")
-
-            logger.info(f"Loaded {len(self._reminders)} reminders from {self._persistence_path}")
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in reminders file: {e}")
+            with open(self._journal_path, "rb") as f:
+                for line in f:
+                    self._journal_lines += 1
+                    try:
+                        reminder = _from_record(loads(line))
+                        self._reminders[reminder.id] = reminder
+                    except (KeyError, ValueError) as e:
+                        # Includes a torn final line from an interrupted write
+                        logger.warning(f"Skipping invalid reminder journal entry: {e}")
         except Exception as e:
-            logger.error(f"Failed to load reminders: {e}")
+            logger.error(f"Failed to replay reminder journal: {e}")
 
 
 def format_time_local(dt: datetime) -> str:
@@ -383,6 +563,34 @@ def format_time_local(dt: datetime) -> str:
     return local_dt.strftime("%-I:%M %p").replace(" AM", " AM").replace(" PM", " PM")
 
 
+_WORD_NUMBERS: dict[str, str] = {
+    "one": "1",
+    "two": "2",
+    "three": "3",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9",
+    "ten": "10",
+    "fifteen": "15",
+    "twenty": "20",
+    "thirty": "30",
+    "forty": "40",
+    "forty-five": "45",
+    "fortyfive": "45",
+    "fifty": "50",
+    "sixty": "60",
+    "half": "30",  # "half an hour" -> "30 minutes"
+}
+
+# Longest words first so "forty-five" wins over "forty" and "five"
+_WORD_NUMBER_PATTERN = re.compile(
+    r"\b(?:" + "|".join(sorted(_WORD_NUMBERS, key=len, reverse=True)) + r")\b"
+)
+
+
 def _word_to_number(text: str) -> str:
     """Convert word numbers to digits.
 
@@ -392,39 +600,78 @@ def _word_to_number(text: str) -> str:
     Returns:
         Text with word numbers converted to digits.
     """
-    word_numbers = {
-        "one": "1",
-        "two": "2",
-        "three": "3",
-        "four": "4",
-        "five": "5",
-        "six": "6",
-        "seven": "7",
-        "eight": "8",
-        "nine": "9",
-        "ten": "10",
-        "fifteen": "15",
-        "twenty": "20",
-        "thirty": "30",
-        "forty": "40",
-        "forty-five": "45",
-        "fortyfive": "45",
-        "fifty": "50",
-        "sixty": "60",
-        "half": "30",  # "half an hour" -> "30 minutes"
-    }
-    result = text.lower()
-    for word, digit in word_numbers.items():
-        # Use word boundary to avoid partial matches
-        result = re.sub(rf"\b{word}\b", digit, result)
+    return _WORD_NUMBER_PATTERN.sub(lambda m: _WORD_NUMBERS[m.group(0)], text.lower())
+
+
+def _at_or_next_day(now: datetime, hour: int, minute: int) -> datetime:
+    """Return today's hour:minute, or tomorrow's if that time has passed."""
+    result = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if result <= now:
+        result += timedelta(days=1)
+    return result
+
+
+def _to_24_hour(hour: int, period: str | None) -> int:
+    """Convert a 12-hour clock hour with optional am/pm to 24-hour."""
+    if period == "pm" and hour != 12:
+        return hour + 12
+    if period == "am" and hour == 12:
+        return 0
+    return hour
+
+
+def _parse_relative(match: re.Match[str], now: datetime, _text: str) -> datetime:
+    """Handle "in X seconds/minutes/hours"."""
+    amount = int(match.group(1))
+    unit = match.group(2)
+
+    if unit in ("hour", "hr"):
+        return now + timedelta(hours=amount)
+    elif unit in ("second", "sec"):
+        return now + timedelta(seconds=amount)
+    else:
+        return now + timedelta(minutes=amount)
+
+
+def _parse_decimal_time(match: re.Match[str], now: datetime, _text: str) -> datetime:
+    """Handle decimal notation like "at 8.20am"."""
+    hour = _to_24_hour(int(match.group(1)), match.group(3))
+    return _at_or_next_day(now, hour, int(match.group(2)))
+
+
+def _parse_clock_time(match: re.Match[str], now: datetime, text: str) -> datetime:
+    """Handle "at HH[:MM] [am/pm]", including a trailing "tomorrow"."""
+    hour = _to_24_hour(int(match.group(1)), match.group(3))
+    minute = int(match.group(2)) if match.group(2) else 0
+    result = _at_or_next_day(now, hour, minute)
+
+    # Check for "tomorrow" in the text
+    if "tomorrow" in text and result.date() == now.date():
+        result += timedelta(days=1)
+
     return result
 
 
-def parse_reminder_time(text: str) -> datetime | None:
+# Time expression patterns, tried in order against the normalized text.
+# Input is lowercased before matching, so no IGNORECASE is needed.
+_TIME_PARSERS: tuple[
+    tuple[re.Pattern[str], Callable[[re.Match[str], datetime, str], datetime]], ...
+] = (
+    # "in X seconds/minutes/hours" (also matches without "in")
+    (re.compile(r"(?:in\s+)?(\d+)\s*(second|sec|minute|min|hour|hr)s?"), _parse_relative),
+    # "at H.MM am/pm" (decimal notation like "8.20am")
+    (re.compile(r"(?:at\s+)?(\d{1,2})\.(\d{1,2})\s*(am|pm)"), _parse_decimal_time),
+    # "at HH:MM AM/PM", "at 3 pm" and 24-hour "at 14:00"
+    (re.compile(r"at\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)?"), _parse_clock_time),
+)
+
+
+def parse_reminder_time(text: str, now: datetime | None = None) -> datetime | None:
     """Parse a natural language time expression into a datetime.
 
     Args:
         text: Natural language time (e.g., "in 1 hour", "at 3 PM", "in one minute").
+        now: Reference time to resolve against. Defaults to the current UTC time.
 
     Returns:
         Datetime for the reminder, or None if unparseable.
@@ -441,93 +688,13 @@ def parse_reminder_time(text: str) -> datetime | None:
         return None
 
     # Convert word numbers to digits before parsing
-    text = _word_to_number(text.lower().strip())
-    now = datetime.now(UTC)
-
-    # Try "in X seconds/minutes/hours" pattern (also matches without "in")
-    relative_match = re.search(
-        r"(?:in\s+)?(\d+)\s*(second|sec|minute|min|hour|hr)s?",
-        text,
-        re.IGNORECASE,
-    )
-    if relative_match:
-        amount = int(relative_match.group(1))
-        unit = relative_match.group(2).lower()
-
-        if unit in ("hour", "hr"):
-            return now + timedelta(hours=amount)
-        elif unit in ("second", "sec"):
-            return now + timedelta(seconds=amount)
-        else:
-            return now + timedelta(minutes=amount)
-
-    # Try "at H.MM am/pm" pattern (decimal notation like "8.20am")
-    decimal_time_match = re.search(
-        r"(?:at\s+)?(\d{1,2})\.(\d{1,2})\s*(am|pm)",
-        text,
-        re.IGNORECASE,
-    )
-    if decimal_time_match:
-        hour = int(decimal_time_match.group(1))
-        minute = int(decimal_time_match.group(2))
-        period = decimal_time_match.group(3).lower()
-
-        if period == "pm" and hour != 12:
-            hour += 12
-        elif period == "am" and hour == 12:
-            hour = 0
-
-        result = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-
-        # If the time has passed today, schedule for tomorrow
-        if result <= now:
-            result += timedelta(days=1)
-
-        return result
-
-    # Try "at HH:MM AM/PM" pattern
-    time_match = re.search(
-        r"at\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)?",
-        text,
-        re.IGNORECASE,
-    )
-    if time_match:
-        hour = int(time_match.group(1))
-        minute = int(time_match.group(2)) if time_match.group(2) else 0
-        period = time_match.group(3)
-
-        if period:
-            if period.lower() == "pm" and hour != 12:
-                hour += 12
-            elif period.lower() == "am" and hour == 12:
-                hour = 0
-
-        result = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-
-        # If the time has passed today, schedule for tomorrow
-        if result <= now:
-            result += timedelta(days=1)
-
-        # Check for "tomorrow" in the text
-        if "tomorrow" in text and result.date() == now.date():
-            result += timedelta(days=1)
-
-        return result
-
-    # Try 24-hour format "at HH:MM"
-    time_24_match = re.search(r"at\s+(\d{1,2}):(\d{2})", text)
-    if time_24_match:
-        hour = int(time_24_match.group(1))
-        minute = int(time_24_match.group(2))
-
-        result = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-
-        if result <= now:
-            result += timedelta(days=1)
-
-        if "tomorrow" in text and result.date() == now.date():
-            result += timedelta(days=1)
+    text = _word_to_number(text.strip())
+    if now is None:
+        now = datetime.now(UTC)
 
-        return result
+    for pattern, parser in _TIME_PARSERS:
+        match = pattern.search(text)
+        if match:
+            return parser(match, now, text)
 
     return None
@@ -3,12 +3,15 @@
 Implements countdown timers with alert capabilities.
 """
 
+import heapq
 import re
+import threading
 import uuid
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from uuid import UUID
 
 
@@ -81,6 +84,11 @@ class TimerManager:
             on_expire: Optional callback when a timer expires.
         """
         self._timers: dict[UUID, Timer] = {}
+        # (expires_at, id) entries; stale ones are skipped lazily when popped
+        self._expiry_heap: list[tuple[datetime, UUID]] = []
+        # check_expired() runs on the orchestrator's background thread while
+        # commands create and resume timers on the voice thread
+        self._lock = threading.Lock()
         self._on_expire = on_expire
 
     def create(
@@ -110,7 +118,9 @@ class TimerManager:
             alert_played=False,
             created_by_interaction=interaction_id,
         )
-        self._timers[timer.id] = timer
+        with self._lock:
+            self._timers[timer.id] = timer
+            heapq.heappush(self._expiry_heap, (timer.expires_at, timer.id))
         return timer
 
     def cancel(self, timer_id: UUID) -> bool:
@@ -122,11 +132,12 @@ class TimerManager:
         Returns:
             True if cancelled, False if not found.
         """
-        timer = self._timers.get(timer_id)
-        if timer is None:
-            return False
+        with self._lock:
+            timer = self._timers.get(timer_id)
+            if timer is None:
+                return False
 
-        timer.status = TimerStatus.CANCELLED
+            timer.status = TimerStatus.CANCELLED
         return True
 
     def get(self, timer_id: UUID) -> Timer | None:
@@ -182,18 +193,31 @@ class TimerManager:
     def check_expired(self) -> list[Timer]:
         """Check for and process expired timers.
 
+        Only heap entries whose expiry has passed are popped, so polling costs
+        O(k log n) for k due entries rather than a scan of every timer.
+        Entries left behind by cancel, pause or resume are discarded here.
+
         Returns:
             List of newly expired timers.
         """
         expired = []
-        for timer in self._timers.values():
-            if timer.status == TimerStatus.RUNNING and timer.is_expired:
+        now = datetime.now(UTC)
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                _, timer_id = heapq.heappop(heap)
+                timer = self._timers.get(timer_id)
+                if timer is None or not timer.is_expired:
+                    continue
+
                 timer.status = TimerStatus.COMPLETED
                 timer.alert_played = True
                 expired.append(timer)
 
-                if self._on_expire:
-                    self._on_expire(timer)
+        # Outside the lock so a callback that uses the manager cannot deadlock
+        if self._on_expire:
+            for timer in expired:
+                self._on_expire(timer)
 
         return expired
 
@@ -206,13 +230,14 @@ class TimerManager:
         Returns:
             True if paused, False if not found or not running.
         """
-        timer = self._timers.get(timer_id)
-        if timer is None or timer.status != TimerStatus.RUNNING:
-            return False
-
-        timer._remaining_when_paused = timer.remaining_seconds
-        timer._paused_at = datetime.now(UTC)
-        timer.status = TimerStatus.PAUSED
+        with self._lock:
+            timer = self._timers.get(timer_id)
+            if timer is None or timer.status != TimerStatus.RUNNING:
+                return False
+
+            timer._remaining_when_paused = timer.remaining_seconds
+            timer._paused_at = datetime.now(UTC)
+            timer.status = TimerStatus.PAUSED
         return True
 
     def resume(self, timer_id: UUID) -> bool:
@@ -224,16 +249,20 @@ class TimerManager:
         Returns:
             True if resumed, False if not found or not paused.
         """
-        timer = self._timers.get(timer_id)
-        if timer is None or timer.status != TimerStatus.PAUSED:
-            return False
-
-        if timer._remaining_when_paused is not None:
-            timer.expires_at = datetime.now(UTC) + timedelta(seconds=timer._remaining_when_paused)
-
-        timer._remaining_when_paused = None
-        timer._paused_at = None
-        timer.status = TimerStatus.RUNNING
+        with self._lock:
+            timer = self._timers.get(timer_id)
+            if timer is None or timer.status != TimerStatus.PAUSED:
+                return False
+
+            if timer._remaining_when_paused is not None:
+                timer.expires_at = datetime.now(UTC) + timedelta(
+                    seconds=timer._remaining_when_paused
+                )
+                heapq.heappush(self._expiry_heap, (timer.expires_at, timer.id))
+
+            timer._remaining_when_paused = None
+            timer._paused_at = None
+            timer.status = TimerStatus.RUNNING
         return True
 
     def format_remaining(self, timer: Timer) -> str:
@@ -283,9 +312,13 @@ def _convert_words_to_numbers(text: str) -> str:
     return result
 
 
+@lru_cache(maxsize=256)
 def parse_duration(text: str) -> int | None:
     """Parse a natural language duration into seconds.
 
+    Memoized because the same few phrases ("5 minutes", "1 hour") recur and
+    each parse runs a word-to-number substitution per number word.
+
     Args:
         text: Natural language duration (e.g., "5 minutes", "1 hour", "five minutes").
 
@@ -3,23 +3,37 @@
 Provides search capabilities and result summarization for the voice assistant.
 """
 
+import importlib
+import importlib.util
+import time
+from collections import OrderedDict
+from contextlib import ExitStack
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .model import LanguageModel
 
-# Try to import ddgs (formerly duckduckgo_search), gracefully handle if not installed
-try:
-    from ddgs import DDGS
+# ddgs (formerly duckduckgo_search) is optional and slow to import, so only
+# check that it is installed here; the client class is imported on first search
+DDGS_AVAILABLE = importlib.util.find_spec("ddgs") is not None
+DDGS: Any = None
 
-    DDGS_AVAILABLE = True
-except ImportError:
-    DDGS_AVAILABLE = False
-    DDGS = None
 
+def _ddgs_class() -> Any:
+    """Get the DDGS client class, importing ddgs on first use."""
+    global DDGS
+    if DDGS is None:
+        DDGS = importlib.import_module("ddgs").DDGS
+    return DDGS
 
-@dataclass
+
+# Repeated queries within this window are answered from the result cache
+_CACHE_TTL_SECONDS = 300.0
+_CACHE_MAX_ENTRIES = 128
+
+
+@dataclass(slots=True)
 class SearchResult:
     """A single search result."""
 
@@ -36,7 +50,7 @@ class SearchResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResponse:
     """Complete search response with results and summary."""
 
@@ -60,15 +74,37 @@ class WebSearcher:
         """
         self._max_results = max_results
         self._timeout = timeout
+        # Reused DuckDuckGo session, opened on first search
+        self._session_stack = ExitStack()
+        self._ddgs: Any = None
+        # query -> (fetched at, results), least recently used first
+        self._cache: OrderedDict[str, tuple[float, list[SearchResult]]] = OrderedDict()
 
     @property
     def max_results(self) -> int:
         """Get maximum results."""
         return self._max_results
 
+    def _get_ddgs(self) -> Any:
+        """Get the DuckDuckGo session, opening it if needed."""
+        if self._ddgs is None:
+            self._ddgs = self._session_stack.enter_context(_ddgs_class()())
+        return self._ddgs
+
+    def close(self) -> None:
+        """Close the DuckDuckGo session.
+
+        A later search opens a new session.
+        """
+        self._session_stack.close()
+        self._ddgs = None
+
     def search(self, query: str) -> list[SearchResult]:
         """Perform a web search.
 
+        Successful results are cached for a few minutes, so repeating a
+        query does not hit DuckDuckGo again.
+
         Args:
             query: Search query string.
 
@@ -78,26 +114,37 @@ class WebSearcher:
         if not DDGS_AVAILABLE:
             return []
 
-        try:
-            with DDGS() as ddgs:
-                raw_results = ddgs.text(
-                    query,
-                    max_results=self._max_results,
-                )
+        now = time.monotonic()
+        cached = self._cache.get(query)
+        if cached is not None and now - cached[0] < _CACHE_TTL_SECONDS:
+            self._cache.move_to_end(query)
+            return list(cached[1])
 
-                results = []
-                for item in raw_results:
-                    results.append(
-                        SearchResult(
-                            title=item.get("title", ""),
-                            url=item.get("href", ""),
-                            snippet=item.get("body", ""),
-                        )
+        try:
+            raw_results = self._get_ddgs().text(
+                query,
+                max_results=self._max_results,
+            )
+
+            results = []
+            for item in raw_results:
+                results.append(
+                    SearchResult(
+                        title=item.get("title", ""),
+                        url=item.get("href", ""),
+                        snippet=item.get("body", ""),
                     )
+                )
 
-                return results
+            self._cache[query] = (now, results)
+            self._cache.move_to_end(query)
+            if len(self._cache) > _CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+            return list(results)
 
         except Exception:
+            # Drop the session so the next search starts with a fresh one
+            self.close()
             return []
 
     def format_results_for_llm(self, results: list[SearchResult]) -> str:
@@ -112,13 +159,10 @@ class WebSearcher:
         if not results:
             return "No search results found."
 
-        lines = ["Web search results:"]
-        for i, result in enumerate(results, 1):
-            lines.append(f"\n{i}. {result.title}")
-            lines.append(f"   URL: {result.url}")
-            lines.append(f"   {result.snippet}")
-
-        return "\n".join(lines)
+        return "Web search results:" + "".join(
+            f"\n\n{i}. {result.title}\n   URL: {result.url}\n   {result.snippet}"
+            for i, result in enumerate(results, 1)
+        )
 
 
 class SearchSummarizer:
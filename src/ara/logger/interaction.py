@@ -40,7 +40,7 @@ class SessionState(Enum):
     ENDED = "ended"
 
 
-@dataclass
+@dataclass(slots=True)
 class Interaction:
     """A single user query and system response pair.
 
@@ -5,6 +5,7 @@ Generates aggregated statistics and action items from daily interactions.
 
 import re
 import uuid
+from collections import Counter
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
@@ -14,8 +15,18 @@ from uuid import UUID
 from .interaction import Interaction
 from .storage import InteractionStorage
 
+# Common ways of phrasing a reminder, tried in order
+_REMINDER_TEXT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"remind me to (.+?)(?:\s+(?:in|at|tomorrow|on)\s|$)",
+        r"don't forget to (.+?)(?:\s+(?:in|at|tomorrow|on)\s|$)",
+        r"reminder to (.+?)(?:\s+(?:in|at|tomorrow|on)\s|$)",
+    )
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class ActionItem:
     """An action item extracted from interactions."""
 
@@ -23,7 +34,7 @@ class ActionItem:
     source_transcript: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DailySummary:
     """Aggregated statistics for a 24-hour period.
 
@@ -175,15 +186,8 @@ def _extract_reminder_text(transcript: str) -> str:
     Returns:
         Extracted reminder text.
     """
-    # Common patterns
-    patterns = [
-        r"remind me to (.+?)(?:\s+(?:in|at|tomorrow|on)\s|$)",
-        r"don't forget to (.+?)(?:\s+(?:in|at|tomorrow|on)\s|$)",
-        r"reminder to (.+?)(?:\s+(?:in|at|tomorrow|on)\s|$)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, transcript, re.IGNORECASE)
+    for pattern in _REMINDER_TEXT_PATTERNS:
+        match = pattern.search(transcript)
         if match:
             return match.group(1).strip()
 
@@ -217,44 +221,75 @@ class SummaryGenerator:
             tzinfo=UTC
         )
 
-        interactions = self._storage.sqlite.get_by_date_range(start, end)
+        interactions = self._storage.sqlite.get_by_date_range(start, end, device_id=device_id)
 
-        # Filter by device
-        interactions = [i for i in interactions if i.device_id == device_id]
+        p95_latency = self._storage.sqlite.get_latency_percentile(
+            target_date, 0.95, device_id=device_id
+        )
 
-        # Calculate statistics
-        total = len(interactions)
-        errors = sum(1 for i in interactions if i.error is not None)
-        successful = total - errors
+        return self._summarize(target_date, device_id, interactions, p95_latency)
 
-        # Latencies
-        latencies = []
-        for i in interactions:
-            if "total" in i.latency_ms:
-                latencies.append(i.latency_ms["total"])
+    def generate_all(self, target_date: date) -> list[DailySummary]:
+        """Generate daily summaries for every device active on a date.
 
-        avg_latency = int(sum(latencies) / len(latencies)) if latencies else 0
-        p95_latency = self._calculate_percentile(latencies, 0.95)
+        Reads the day's interactions and P95 latencies once for all devices,
+        rather than once per device as repeated generate() calls would.
 
-        # Mode breakdown
-        mode_breakdown: dict[str, int] = {}
-        for i in interactions:
-            mode = i.mode.value
-            mode_breakdown[mode] = mode_breakdown.get(mode, 0) + 1
+        Args:
+            target_date: Date to generate summaries for.
 
-        # Top intents
-        intent_counts: dict[str, int] = {}
+        Returns:
+            One DailySummary per device, ordered by device ID.
+        """
+        start = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=UTC)
+        end = datetime.combine(target_date + timedelta(days=1), datetime.min.time()).replace(
+            tzinfo=UTC
+        )
+
+        by_device: dict[str, list[Interaction]] = {}
+        for interaction in self._storage.sqlite.get_by_date_range(start, end):
+            by_device.setdefault(interaction.device_id, []).append(interaction)
+
+        p95_latencies = self._storage.sqlite.get_latency_percentiles_by_device(target_date, 0.95)
+
+        return [
+            self._summarize(
+                target_date, device_id, by_device[device_id], p95_latencies.get(device_id, 0)
+            )
+            for device_id in sorted(by_device)
+        ]
+
+    def _summarize(
+        self,
+        target_date: date,
+        device_id: str,
+        interactions: list[Interaction],
+        p95_latency: int,
+    ) -> DailySummary:
+        """Build a summary from one device's interactions for a date."""
+        # Calculate statistics in a single pass
+        total = len(interactions)
+        errors = 0
+        latency_sum = 0
+        latency_count = 0
+        mode_breakdown: Counter[str] = Counter()
+        intent_counts: Counter[str] = Counter()
         for i in interactions:
-            intent_counts[i.intent] = intent_counts.get(i.intent, 0) + 1
+            if i.error is not None:
+                errors += 1
+            if "total" in i.latency_ms:
+                latency_sum += i.latency_ms["total"]
+                latency_count += 1
+            mode_breakdown[i.mode.value] += 1
+            intent_counts[i.intent] += 1
+        successful = total - errors
+
+        avg_latency = int(latency_sum / latency_count) if latency_count else 0
 
-        intent_list: list[dict[str, str | int]] = [
-            {"intent": k, "count": v} for k, v in intent_counts.items()
+        # Top intents, most frequent first (ties keep first-seen order)
+        top_intents: list[dict[str, Any]] = [
+            {"intent": intent, "count": count} for intent, count in intent_counts.most_common(10)
         ]
-        top_intents = sorted(
-            intent_list,
-            key=lambda x: x["count"] if isinstance(x["count"], int) else 0,
-            reverse=True,
-        )[:10]
 
         # Extract action items
         action_items = extract_action_items(interactions)
@@ -268,32 +303,13 @@ class SummaryGenerator:
             error_count=errors,
             avg_latency_ms=avg_latency,
             p95_latency_ms=p95_latency,
-            mode_breakdown=mode_breakdown,
+            mode_breakdown=dict(mode_breakdown),
             top_intents=top_intents,
             action_items=action_items,
             notable_interactions=[],
             generated_at=datetime.now(UTC),
         )
 
-    def _calculate_percentile(self, values: list[int], percentile: float) -> int:
-        """Calculate a percentile value.
-
-        Args:
-            values: List of values.
-            percentile: Percentile to calculate (0.0-1.0).
-
-        Returns:
-            Percentile value.
-        """
-        if not values:
-            return 0
-
-        sorted_values = sorted(values)
-        index = int(len(sorted_values) * percentile)
-        index = min(index, len(sorted_values) - 1)
-
-        return sorted_values[index]
-
     def save_markdown(self, summary: DailySummary, output_path: Path) -> None:
         """Save summary as Markdown file.
 
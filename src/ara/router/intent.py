@@ -60,6 +60,24 @@ class Intent:
     raw_text: str = ""
 
 
+# Phrases that explicitly ask for a web search, bypassing the personal data check
+_EXPLICIT_WEB_TRIGGERS = ("research", "search", "google", "look up", "check online")
+
+# First-person words that mark a query as being about the user's own data
+_PERSONAL_INDICATOR_PATTERN = re.compile(r"\b(?:me|my|i|myself|i've|i'm)\b")
+
+_TIMER_NAME_PATTERN = re.compile(r"(?:called|named)\s+(\w+)", re.IGNORECASE)
+_PASSWORD_MENTION_PATTERN = re.compile(
+    r"(?:password|passcode|code)\s+(?:is\s+)?(\w+)", re.IGNORECASE
+)
+
+# "add X to action items" or "add X to to-do list" is a note capture, not a query
+_ACTION_ITEMS_CAPTURE_PATTERN = re.compile(
+    r"\b(capture|add|save|record|log|put)\b.*\b(?:action\s*items?|to-?do\s*list)\b",
+    re.IGNORECASE,
+)
+
+
 class IntentClassifier:
     """Rule-based intent classifier for voice commands.
 
@@ -683,7 +701,7 @@ class IntentClassifier:
                     entities["duration"] = groups[0].strip()
 
                 # Try to extract timer name
-                name_match = re.search(r"(?:called|named)\s+(\w+)", text, re.IGNORECASE)
+                name_match = _TIMER_NAME_PATTERN.search(text)
                 if name_match:
                     entities["name"] = name_match.group(1)
 
@@ -878,23 +896,12 @@ class IntentClassifier:
         text_lower = text.lower()
 
         # Explicit web search triggers bypass personal data check
-        explicit_web_triggers = ["research", "search", "google", "look up", "check online"]
-        has_explicit_trigger = any(trigger in text_lower for trigger in explicit_web_triggers)
+        has_explicit_trigger = any(trigger in text_lower for trigger in _EXPLICIT_WEB_TRIGGERS)
 
         # Skip web search if query is about personal data (contains "me", "my", "I")
         # UNLESS user explicitly requested web search/research
-        if not has_explicit_trigger:
-            personal_indicators = [
-                r"\bme\b",
-                r"\bmy\b",
-                r"\bi\b",
-                r"\bmyself\b",
-                r"\bi've\b",
-                r"\bi'm\b",
-            ]
-            for indicator in personal_indicators:
-                if re.search(indicator, text_lower):
-                    return None  # Let personal data handler catch this
+        if not has_explicit_trigger and _PERSONAL_INDICATOR_PATTERN.search(text_lower):
+            return None  # Let personal data handler catch this
 
         for pattern in self._web_search:
             match = pattern.search(text)
@@ -949,9 +956,7 @@ class IntentClassifier:
                     entities["name"] = name.capitalize()
 
                     # Check if password is mentioned in the text (for name change with password)
-                    password_match = re.search(
-                        r"(?:password|passcode|code)\s+(?:is\s+)?(\w+)", text, re.IGNORECASE
-                    )
+                    password_match = _PASSWORD_MENTION_PATTERN.search(text)
                     if password_match:
                         entities["password"] = password_match.group(1)
 
@@ -1261,12 +1266,7 @@ class IntentClassifier:
                   "what were my action items from yesterday?"
         """
         # Exclude capture phrases - these should be NOTE_CAPTURE instead
-        # Matches "add X to action items" or "add X to to-do list"
-        capture_verbs = re.compile(
-            r"\b(capture|add|save|record|log|put)\b.*\b(?:action\s*items?|to-?do\s*list)\b",
-            re.IGNORECASE,
-        )
-        if capture_verbs.search(text):
+        if _ACTION_ITEMS_CAPTURE_PATTERN.search(text):
             return None
 
         for pattern in self._action_items:
@@ -34,6 +34,10 @@ class OperationMode(Enum):
     ONLINE_CLOUD = "online_cloud"
 
 
+# Value -> member lookup for parsing persisted preferences
+_MODE_BY_VALUE: dict[str, OperationMode] = {m.value: m for m in OperationMode}
+
+
 class NetworkMonitor:
     """Monitors network connectivity status.
 
@@ -51,16 +55,18 @@ class NetworkMonitor:
         self,
         check_interval: int = 30,
         on_status_change: Callable[[NetworkStatus], None] | None = None,
+        initial_status: NetworkStatus = NetworkStatus.UNKNOWN,
     ) -> None:
         """Initialize the network monitor.
 
         Args:
             check_interval: Seconds between connectivity checks.
             on_status_change: Callback when status changes.
+            initial_status: Status to report before the first check.
         """
         self._check_interval = check_interval
         self._on_status_change = on_status_change
-        self._status = NetworkStatus.UNKNOWN
+        self._status = initial_status
         self._running = False
         self._thread: threading.Thread | None = None
 
@@ -120,19 +126,20 @@ class NetworkMonitor:
     def _monitor_loop(self) -> None:
         """Background monitoring loop."""
         while self._running:
-            new_status = self.check_connectivity()
-
-            if new_status != self._status:
-                self._status = new_status
-                self._notify_status_change(new_status)
-
+            self._notify_status_change(self.check_connectivity())
             time.sleep(self._check_interval)
 
     def _notify_status_change(self, new_status: NetworkStatus) -> None:
-        """Notify listeners of status change."""
-        if self._on_status_change is not None:
+        """Record the new status and notify listeners if it changed.
+
+        Enum members are singletons, so an identity check is enough to
+        detect a change.
+        """
+        old_status, self._status = self._status, new_status
+        callback = self._on_status_change
+        if old_status is not new_status and callback is not None:
             with contextlib.suppress(Exception):
-                self._on_status_change(new_status)
+                callback(new_status)
 
 
 class ModeManager:
@@ -288,19 +295,25 @@ class ModeManager:
         )
 
     def save_preferences(self) -> None:
-        """Save mode preferences to file."""
+        """Save mode preferences to file.
+
+        The file holds the mode value on a single line.
+        """
         if self._preferences_path is None:
             return
 
-        data = {"mode": self._mode.value}
         try:
             self._preferences_path.parent.mkdir(parents=True, exist_ok=True)
-            self._preferences_path.write_text(json.dumps(data, indent=2))
+            self._preferences_path.write_text(f"{self._mode.value}\n")
         except OSError:
             pass  # Fail silently on save errors
 
     def load_preferences(self) -> None:
-        """Load mode preferences from file."""
+        """Load mode preferences from file.
+
+        Files written before the plain-text format (``{"mode": ...}``) are
+        still read, and are rewritten in the new format on the next save.
+        """
         if self._preferences_path is None:
             return
 
@@ -308,15 +321,22 @@ class ModeManager:
             return
 
         try:
-            data = json.loads(self._preferences_path.read_text())
-            mode_str = data.get("mode", "")
-            # Try to find matching mode
-            for mode in OperationMode:
-                if mode.value == mode_str:
-                    self._mode = mode
-                    return
-        except (json.JSONDecodeError, OSError):
-            pass  # Keep default mode on errors
+            raw = self._preferences_path.read_text().strip()
+        except OSError:
+            return  # Keep default mode on errors
+
+        if raw.startswith("{"):
+            try:
+                legacy = json.loads(raw)
+            except json.JSONDecodeError:
+                return  # Keep default mode on errors
+            if not isinstance(legacy, dict):
+                return
+            raw = str(legacy.get("mode", ""))
+
+        mode = _MODE_BY_VALUE.get(raw)
+        if mode is not None:
+            self._mode = mode
 
     def on_network_status_change(self, new_status: NetworkStatus) -> None:
         """Handle network status change.
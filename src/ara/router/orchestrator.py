@@ -86,6 +86,49 @@ def _log_interaction_timing(event: str, transcript: str = "") -> None:
         logger.debug(f"Failed to write interaction timing log: {e}")
 
 
+def strip_stop_keyword(transcript: str, keyword: str) -> str:
+    """Remove a trailing stop keyword from a transcript.
+
+    Matching is case-insensitive. Punctuation left in front of the keyword
+    is removed as well.
+
+    Args:
+        transcript: Transcribed text.
+        keyword: Lowercase stop keyword.
+
+    Returns:
+        The transcript without the keyword, or unchanged if it does not end with it.
+    """
+    # Lowercase only the tail rather than the whole transcript
+    n = len(keyword)
+    if transcript[-n:].lower() == keyword:
+        transcript = transcript[:-n].strip()
+        transcript = transcript.rstrip(".,;:!?")
+    return transcript
+
+
+# Ordinal words accepted when referring to a reminder by position
+_ORDINAL_NUMBERS = {
+    "first": 1,
+    "second": 2,
+    "third": 3,
+    "fourth": 4,
+    "fifth": 5,
+    "sixth": 6,
+    "seventh": 7,
+    "eighth": 8,
+    "ninth": 9,
+    "tenth": 10,
+}
+
+# Spoken ordinals for positions 1-10, and numeric suffixes by last digit
+_ORDINAL_WORDS = tuple(_ORDINAL_NUMBERS)
+_ORDINAL_SUFFIXES = ("th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th")
+
+# Cardinal numbers ("reminder 3", "2, 4, and 5") or ordinal words, in one pass
+_REMINDER_NUMBER_PATTERN = re.compile(r"(\d+)|\b(" + "|".join(_ORDINAL_NUMBERS) + r")\b")
+
+
 def _get_ordinal(n: int) -> str:
     """Get ordinal representation of a number.
 
@@ -95,31 +138,13 @@ def _get_ordinal(n: int) -> str:
     Returns:
         Ordinal string (first, second, ... tenth, 11th, 12th, etc.)
     """
-    ordinals = {
-        1: "first",
-        2: "second",
-        3: "third",
-        4: "fourth",
-        5: "fifth",
-        6: "sixth",
-        7: "seventh",
-        8: "eighth",
-        9: "ninth",
-        10: "tenth",
-    }
-
-    if n in ordinals:
-        return ordinals[n]
-
-    # For numbers > 10, use numeric ordinals
-    if n % 10 == 1 and n % 100 != 11:
-        return f"{n}st"
-    elif n % 10 == 2 and n % 100 != 12:
-        return f"{n}nd"
-    elif n % 10 == 3 and n % 100 != 13:
-        return f"{n}rd"
-    else:
+    if 1 <= n <= len(_ORDINAL_WORDS):
+        return _ORDINAL_WORDS[n - 1]
+
+    # For numbers > 10, use numeric ordinals (11th, 12th, 13th are exceptions)
+    if 11 <= n % 100 <= 13:
         return f"{n}th"
+    return f"{n}{_ORDINAL_SUFFIXES[n % 10]}"
 
 
 @dataclass
@@ -244,7 +269,7 @@ class Orchestrator:
         # Recording configuration - note-taking mode (patient, no interruption)
         self._note_silence_timeout_ms = 10000  # 10s silence for notes (user can pause to think)
         self._note_max_recording_ms = 180000  # 3 minute max for notes
-        self._note_trigger_phrases = ["take note", "take a note", "note that", "remember that"]
+        self._note_trigger_phrases = ("take note", "take a note", "note that", "remember that")
         self._stop_keyword = "porcupine"  # Say wake word to end note recording early
         self._note_stop_phrase = "done ara"  # Phrase to end continuous note recording
 
@@ -669,10 +694,8 @@ class Orchestrator:
                     follow_up_result = self._transcriber.transcribe(follow_up_audio, 16000)
                     follow_up_text = follow_up_result.text.strip()
 
-                    # Strip stop keyword if present
-                    if follow_up_text.lower().endswith(self._stop_keyword):
-                        follow_up_text = follow_up_text[: -len(self._stop_keyword)].strip()
-                        follow_up_text = follow_up_text.rstrip(".,;:!?")
+                    # The stop keyword also ends a follow-up early, so strip it
+                    follow_up_text = strip_stop_keyword(follow_up_text, self._stop_keyword)
 
                     if follow_up_text:
                         logger.info(f"Follow-up: '{follow_up_text}'")
@@ -1267,38 +1290,12 @@ class Orchestrator:
         Returns:
             List of 1-based reminder indices.
         """
-        import re
-
-        text_lower = text.lower()
-        numbers = []
-
-        # Ordinal word to number mapping
-        ordinal_words = {
-            "first": 1,
-            "second": 2,
-            "third": 3,
-            "fourth": 4,
-            "fifth": 5,
-            "sixth": 6,
-            "seventh": 7,
-            "eighth": 8,
-            "ninth": 9,
-            "tenth": 10,
+        numbers = {
+            int(digits) if digits else _ORDINAL_NUMBERS[word]
+            for digits, word in _REMINDER_NUMBER_PATTERN.findall(text.lower())
         }
-
-        # Extract ordinal words
-        for word, num in ordinal_words.items():
-            if word in text_lower:
-                numbers.append(num)
-
-        # Extract cardinal numbers (including "reminder number N" and "reminder N")
-        cardinal_matches = re.findall(r"(?:reminder\s+(?:number\s+)?)?(\d+)", text_lower)
-        for match in cardinal_matches:
-            num = int(match)
-            if num not in numbers and num > 0:
-                numbers.append(num)
-
-        return sorted(set(numbers))
+        numbers.discard(0)
+        return sorted(numbers)
 
     def _handle_reminder_query(self) -> str:
         """Handle reminder query intent with concise numbered format."""
@@ -1409,10 +1406,11 @@ class Orchestrator:
             return None
 
         messages = []
+        now = datetime.now(UTC)
         for reminder in self._missed_reminders:
             # Mark as triggered
             reminder.status = ReminderStatus.TRIGGERED
-            reminder.triggered_at = datetime.now(UTC)
+            reminder.triggered_at = now
             messages.append(
                 f"Oops! I meant to remind you earlier but I was rebooting. "
                 f"You wanted me to remind you to {reminder.message}."
@@ -2824,9 +2822,10 @@ class Orchestrator:
                     self._feedback.play(FeedbackType.REMINDER_ALERT)
 
                 # Mark reminders as triggered so check_due doesn't announce again
+                now = datetime.now(UTC)
                 for reminder in reminders:
                     reminder.status = ReminderStatus.TRIGGERED
-                    reminder.triggered_at = datetime.now(UTC)
+                    reminder.triggered_at = now
                 self._reminder_manager._save()
 
         finally:
@@ -3087,7 +3086,7 @@ class Orchestrator:
             True if text indicates note-taking mode
         """
         text_lower = text.lower().strip()
-        return any(text_lower.startswith(phrase) for phrase in self._note_trigger_phrases)
+        return text_lower.startswith(self._note_trigger_phrases)
 
     def _contains_stop_phrase(self, transcript: str) -> bool:
         """Check if transcript contains 'Done Ara' stop phrase.
@@ -8,8 +8,9 @@ Classifies queries and routes them to the most appropriate data source:
 
 import logging
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,7 @@ class DataSource(Enum):
     LLM = "llm"  # Ollama
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoutingDecision:
     """Result of query classification with routing information.
 
@@ -48,7 +49,7 @@ class RoutingDecision:
     primary_source: DataSource
     fallback_source: DataSource | None = None
     confidence: float = 0.5
-    indicators_matched: list[str] = field(default_factory=list)
+    indicators_matched: tuple[str, ...] = ()
     should_caveat: bool = False
 
 
@@ -83,6 +84,166 @@ GENERAL_INDICATORS = {
     "math": ["calculate", "plus", "minus", "percent", "divided"],
 }
 
+# Explicit general-knowledge phrasings checked before personal indicators.
+# These should never be routed to personal data even if they contain "I".
+_GENERAL_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = tuple(
+    (re.compile(pattern, re.IGNORECASE), indicator)
+    for pattern, indicator in [
+        (r"how do I", "how_to"),
+        (r"how can I", "how_to"),
+        (r"how should I", "how_to"),
+        (r"what is\b", "definition"),
+        (r"what does\b", "definition"),
+        (r"define\b", "definition"),
+        (r"explain\b", "explanation"),
+        (r"tell me about", "explanation"),
+    ]
+)
+
+# General-knowledge phrasings that exclude a query from personal routing
+_GENERAL_EXCLUSIONS = re.compile(
+    r"how do I|how can I|how should I|what is|what does|define|explain|tell me about",
+    re.IGNORECASE,
+)
+
+# Pronouns only count as personal when paired with past tense or possessive patterns
+_PERSONAL_CONTEXT = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in [
+            r"\bmy\s+\w+",  # "my workout", "my meeting"
+            r"\bwhen did I\b",
+            r"\bwhat did I\b",
+            r"\bdid I\b",
+            r"\bhave I\b",
+            r"\bwas I\b",
+            r"\bI\s+(?:went|did|had|said|asked|mentioned|ate|drank|exercised|worked)\b",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+_PERSONAL_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
+    re.compile(p, re.IGNORECASE) for p in PERSONAL_INDICATORS["patterns"]
+)
+_PERSONAL_PRONOUNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (pronoun, re.compile(rf"\b{pronoun}\b"))
+    for pronoun in {p.lower() for p in PERSONAL_INDICATORS["pronouns"]}
+)
+_PERSONAL_TIME_REFS = frozenset(t.lower() for t in PERSONAL_INDICATORS["time_refs"])
+_FACTUAL_KEYWORDS = frozenset(k.lower() for kws in FACTUAL_INDICATORS.values() for k in kws)
+_GENERAL_KEYWORDS = frozenset(k.lower() for kws in GENERAL_INDICATORS.values() for k in kws)
+
+
+def _has_personal_indicators(query_lower: str) -> bool:
+    """Check a normalized query for personal indicators."""
+    # Exclude general knowledge patterns that happen to contain "I"
+    # "How do I" is a how-to question, not personal data
+    if _GENERAL_EXCLUSIONS.search(query_lower):
+        return False
+
+    # Check for personal patterns (more specific than pronouns)
+    for pattern in _PERSONAL_PATTERNS:
+        if pattern.search(query_lower):
+            return True
+
+    # Check for personal pronouns with personal context
+    # Only match pronouns when paired with past tense or possessive patterns.
+    # Time references only count alongside the same personal context, so
+    # they cannot change the outcome beyond this check.
+    return _PERSONAL_CONTEXT.search(query_lower) is not None
+
+
+def _has_factual_indicators(query_lower: str) -> bool:
+    """Check a normalized query for factual/time-sensitive keywords."""
+    return any(keyword in query_lower for keyword in _FACTUAL_KEYWORDS)
+
+
+@lru_cache(maxsize=1024)
+def _classify_by_indicators(query_lower: str) -> RoutingDecision | None:
+    """Classify a normalized query from its indicators alone.
+
+    Depends only on the query text and module constants, so results are
+    memoized process-wide. The returned decision is shared and must not be
+    mutated.
+
+    Args:
+        query_lower: Lowercased, stripped query text
+
+    Returns:
+        RoutingDecision, or None if no indicator matched
+    """
+    indicators_matched: list[str] = []
+
+    # Stage 0: Check for explicit general knowledge patterns FIRST
+    # These should never be routed to personal data even if they contain "I"
+    for pattern, indicator in _GENERAL_PATTERNS:
+        if pattern.search(query_lower):
+            indicators_matched.append(f"general:{indicator}")
+            return RoutingDecision(
+                query_type=QueryType.GENERAL_KNOWLEDGE,
+                primary_source=DataSource.LLM,
+                fallback_source=None,
+                confidence=0.85,
+                indicators_matched=tuple(indicators_matched),
+                should_caveat=False,
+            )
+
+    # Stage 1: Check for personal indicators
+    if _has_personal_indicators(query_lower):
+        # Collect matched indicators
+        for pattern in _PERSONAL_PATTERNS:
+            if pattern.search(query_lower):
+                indicators_matched.append(f"pattern:{pattern.pattern}")
+        for pronoun, pronoun_pattern in _PERSONAL_PRONOUNS:
+            if pronoun_pattern.search(query_lower):
+                indicators_matched.append(f"pronoun:{pronoun}")
+        for time_ref in _PERSONAL_TIME_REFS:
+            if time_ref in query_lower:
+                indicators_matched.append(f"time_ref:{time_ref}")
+
+        return RoutingDecision(
+            query_type=QueryType.PERSONAL_DATA,
+            primary_source=DataSource.DATABASE,
+            fallback_source=None,  # Never hallucinate personal data
+            confidence=0.9 if len(indicators_matched) > 1 else 0.8,
+            indicators_matched=tuple(indicators_matched),
+            should_caveat=False,
+        )
+
+    # Stage 2: Check for factual/time-sensitive indicators
+    if _has_factual_indicators(query_lower):
+        for keyword in _FACTUAL_KEYWORDS:
+            if keyword in query_lower:
+                indicators_matched.append(f"factual:{keyword}")
+
+        return RoutingDecision(
+            query_type=QueryType.FACTUAL_CURRENT,
+            primary_source=DataSource.WEB_SEARCH,
+            fallback_source=DataSource.LLM,  # With caveat
+            confidence=0.85 if len(indicators_matched) > 1 else 0.75,
+            indicators_matched=tuple(indicators_matched),
+            should_caveat=True,  # Caveat if falling back to LLM
+        )
+
+    # Stage 3: Check for general knowledge indicators
+    for keyword in _GENERAL_KEYWORDS:
+        if keyword in query_lower:
+            indicators_matched.append(f"general:{keyword}")
+
+    if indicators_matched:
+        return RoutingDecision(
+            query_type=QueryType.GENERAL_KNOWLEDGE,
+            primary_source=DataSource.LLM,
+            fallback_source=None,
+            confidence=0.8,
+            indicators_matched=tuple(indicators_matched),
+            should_caveat=False,
+        )
+
+    return None
+
+
 # Response message templates
 NOT_FOUND_MESSAGES = {
     "exercise": "I don't have any exercise records.",
@@ -105,25 +266,6 @@ class QueryRouter:
     or directly to the LLM (general knowledge).
     """
 
-    def __init__(self) -> None:
-        """Initialize the QueryRouter with compiled patterns."""
-        # Compile personal patterns
-        self._personal_patterns = [
-            re.compile(p, re.IGNORECASE) for p in PERSONAL_INDICATORS["patterns"]
-        ]
-        self._personal_pronouns = {p.lower() for p in PERSONAL_INDICATORS["pronouns"]}
-        self._personal_time_refs = {t.lower() for t in PERSONAL_INDICATORS["time_refs"]}
-
-        # Build factual keyword set
-        self._factual_keywords: set[str] = set()
-        for keywords in FACTUAL_INDICATORS.values():
-            self._factual_keywords.update(k.lower() for k in keywords)
-
-        # Build general keyword set
-        self._general_keywords: set[str] = set()
-        for keywords in GENERAL_INDICATORS.values():
-            self._general_keywords.update(k.lower() for k in keywords)
-
     def classify(self, query: str, context: dict | None = None) -> RoutingDecision:
         """Classify a query and determine routing.
 
@@ -135,103 +277,15 @@ class QueryRouter:
             RoutingDecision with query type and source routing
         """
         query_lower = query.lower().strip()
-        indicators_matched: list[str] = []
-
-        # Stage 0: Check for explicit general knowledge patterns FIRST
-        # These should never be routed to personal data even if they contain "I"
-        general_patterns = [
-            (r"how do I", "how_to"),
-            (r"how can I", "how_to"),
-            (r"how should I", "how_to"),
-            (r"what is\b", "definition"),
-            (r"what does\b", "definition"),
-            (r"define\b", "definition"),
-            (r"explain\b", "explanation"),
-            (r"tell me about", "explanation"),
-        ]
-        for pattern, indicator in general_patterns:
-            if re.search(pattern, query_lower, re.IGNORECASE):
-                indicators_matched.append(f"general:{indicator}")
-                logger.debug(
-                    "Query classified as GENERAL_KNOWLEDGE (explicit): %s (indicators: %s)",
-                    query[:50],
-                    indicators_matched,
-                )
-                return RoutingDecision(
-                    query_type=QueryType.GENERAL_KNOWLEDGE,
-                    primary_source=DataSource.LLM,
-                    fallback_source=None,
-                    confidence=0.85,
-                    indicators_matched=indicators_matched,
-                    should_caveat=False,
-                )
-
-        # Stage 1: Check for personal indicators
-        if self.is_personal_query(query):
-            # Collect matched indicators
-            for pattern in self._personal_patterns:
-                if pattern.search(query):
-                    indicators_matched.append(f"pattern:{pattern.pattern}")
-            for pronoun in self._personal_pronouns:
-                if re.search(rf"\b{pronoun}\b", query_lower):
-                    indicators_matched.append(f"pronoun:{pronoun}")
-            for time_ref in self._personal_time_refs:
-                if time_ref in query_lower:
-                    indicators_matched.append(f"time_ref:{time_ref}")
-
+        decision = _classify_by_indicators(query_lower)
+        if decision is not None:
             logger.debug(
-                "Query classified as PERSONAL_DATA: %s (indicators: %s)",
+                "Query classified as %s: %s (indicators: %s)",
+                decision.query_type.name,
                 query[:50],
-                indicators_matched,
-            )
-            return RoutingDecision(
-                query_type=QueryType.PERSONAL_DATA,
-                primary_source=DataSource.DATABASE,
-                fallback_source=None,  # Never hallucinate personal data
-                confidence=0.9 if len(indicators_matched) > 1 else 0.8,
-                indicators_matched=indicators_matched,
-                should_caveat=False,
-            )
-
-        # Stage 2: Check for factual/time-sensitive indicators
-        if self.is_factual_query(query):
-            for keyword in self._factual_keywords:
-                if keyword in query_lower:
-                    indicators_matched.append(f"factual:{keyword}")
-
-            logger.debug(
-                "Query classified as FACTUAL_CURRENT: %s (indicators: %s)",
-                query[:50],
-                indicators_matched,
-            )
-            return RoutingDecision(
-                query_type=QueryType.FACTUAL_CURRENT,
-                primary_source=DataSource.WEB_SEARCH,
-                fallback_source=DataSource.LLM,  # With caveat
-                confidence=0.85 if len(indicators_matched) > 1 else 0.75,
-                indicators_matched=indicators_matched,
-                should_caveat=True,  # Caveat if falling back to LLM
-            )
-
-        # Stage 3: Check for general knowledge indicators
-        for keyword in self._general_keywords:
-            if keyword in query_lower:
-                indicators_matched.append(f"general:{keyword}")
-
-        if indicators_matched:
-            logger.debug(
-                "Query classified as GENERAL_KNOWLEDGE: %s (indicators: %s)",
-                query[:50],
-                indicators_matched,
-            )
-            return RoutingDecision(
-                query_type=QueryType.GENERAL_KNOWLEDGE,
-                primary_source=DataSource.LLM,
-                fallback_source=None,
-                confidence=0.8,
-                indicators_matched=indicators_matched,
-                should_caveat=False,
+                decision.indicators_matched,
             )
+            return decision
 
         # Default: Ambiguous or general knowledge
         # If we have context, try to resolve
@@ -249,7 +303,7 @@ class QueryRouter:
             primary_source=DataSource.LLM,
             fallback_source=None,
             confidence=0.5,
-            indicators_matched=["default"],
+            indicators_matched=("default",),
             should_caveat=False,
         )
 
@@ -260,55 +314,9 @@ class QueryRouter:
             query: The user's query text
 
         Returns:
-            True if query contains personal indicators
+            True if the query is classified as PERSONAL_DATA
         """
-        query_lower = query.lower()
-
-        # Exclude general knowledge patterns that happen to contain "I"
-        # "How do I" is a how-to question, not personal data
-        general_exclusions = [
-            r"how do I",
-            r"how can I",
-            r"how should I",
-            r"what is",
-            r"what does",
-            r"define",
-            r"explain",
-            r"tell me about",
-        ]
-        for exclusion in general_exclusions:
-            if re.search(exclusion, query_lower, re.IGNORECASE):
-                return False
-
-        # Check for personal patterns (more specific than pronouns)
-        for pattern in self._personal_patterns:
-            if pattern.search(query):
-                return True
-
-        # Check for personal pronouns with personal context
-        # Only match pronouns when paired with past tense or possessive patterns
-        personal_context_patterns = [
-            r"\bmy\s+\w+",  # "my workout", "my meeting"
-            r"\bwhen did I\b",
-            r"\bwhat did I\b",
-            r"\bdid I\b",
-            r"\bhave I\b",
-            r"\bwas I\b",
-            r"\bI\s+(?:went|did|had|said|asked|mentioned|ate|drank|exercised|worked)\b",
-        ]
-        for pattern in personal_context_patterns:
-            if re.search(pattern, query, re.IGNORECASE):
-                return True
-
-        # Check for time references with personal context
-        for time_ref in self._personal_time_refs:
-            if time_ref in query_lower:
-                # Only count time refs if there's also a personal pronoun in a personal context
-                for pattern in personal_context_patterns:
-                    if re.search(pattern, query, re.IGNORECASE):
-                        return True
-
-        return False
+        return self.classify(query).query_type == QueryType.PERSONAL_DATA
 
     def is_factual_query(self, query: str) -> bool:
         """Check if query requires factual/current data.
@@ -317,10 +325,9 @@ class QueryRouter:
             query: The user's query text
 
         Returns:
-            True if query contains factual indicators
+            True if the query is classified as FACTUAL_CURRENT
         """
-        query_lower = query.lower()
-        return any(keyword in query_lower for keyword in self._factual_keywords)
+        return self.classify(query).query_type == QueryType.FACTUAL_CURRENT
 
     def _can_resolve_from_context(self, _query: str, context: dict) -> bool:
         """Check if query can be resolved using conversation context."""
@@ -340,7 +347,7 @@ class QueryRouter:
                     primary_source=DataSource.DATABASE,
                     fallback_source=None,
                     confidence=0.6,
-                    indicators_matched=["context:follow_up"],
+                    indicators_matched=("context:follow_up",),
                     should_caveat=False,
                 )
 
@@ -350,6 +357,6 @@ class QueryRouter:
             primary_source=DataSource.LLM,
             fallback_source=None,
             confidence=0.5,
-            indicators_matched=["context:default"],
+            indicators_matched=("context:default",),
             should_caveat=False,
         )
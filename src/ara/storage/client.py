@@ -5,7 +5,7 @@ Provides connection management, retry logic, and repository access.
 
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime
 from functools import wraps
 from typing import Any, TypeVar
@@ -13,7 +13,7 @@ from typing import Any, TypeVar
 from pymongo import DESCENDING, TEXT, MongoClient
 from pymongo.collection import Collection
 from pymongo.database import Database
-from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+from pymongo.errors import BulkWriteError, ConnectionFailure, ServerSelectionTimeoutError
 
 from .models import InteractionDTO
 
@@ -21,6 +21,8 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+_DUPLICATE_KEY_ERROR = 11000
+
 
 def retry_on_connection_failure(
     max_retries: int = 5,
@@ -35,6 +37,8 @@ def retry_on_connection_failure(
     Returns:
         Decorated function with retry logic.
     """
+    # Backoff schedule, computed once per decorator rather than per failure
+    delays = tuple(base_delay * (2**attempt) for attempt in range(max_retries - 1))
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
@@ -46,8 +50,8 @@ def retry_on_connection_failure(
                     return func(*args, **kwargs)
                 except (ConnectionFailure, ServerSelectionTimeoutError) as e:
                     last_exception = e
-                    if attempt < max_retries - 1:
-                        delay = base_delay * (2**attempt)
+                    if attempt < len(delays):
+                        delay = delays[attempt]
                         logger.warning(
                             "Connection failed (attempt %d/%d), retrying in %.1fs: %s",
                             attempt + 1,
@@ -106,6 +110,49 @@ class InteractionRepository:
         result = self._collection.insert_one(doc)
         return str(result.inserted_id)
 
+    def save_many(self, interactions: Iterable[InteractionDTO]) -> list[str]:
+        """Save several interactions in one round trip.
+
+        The documents are built, with their IDs, before the first attempt so a
+        retry resends the same batch even when ``interactions`` is a generator.
+
+        Args:
+            interactions: The interactions to save.
+
+        Returns:
+            The generated document IDs, in input order.
+        """
+        from bson import ObjectId
+
+        created_at = datetime.now(UTC)
+        docs = [
+            {"_id": ObjectId(), **interaction.to_dict(), "created_at": created_at}
+            for interaction in interactions
+        ]
+        if not docs:
+            return []
+        self._insert_many(docs)
+        return [str(doc["_id"]) for doc in docs]
+
+    @retry_on_connection_failure()
+    def _insert_many(self, docs: list[dict[str, Any]]) -> None:
+        """Insert a prepared batch, tolerating documents a failed attempt already wrote.
+
+        Args:
+            docs: Documents carrying their own ``_id``.
+        """
+        try:
+            self._collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            # An unordered insert may have committed part of the batch before the
+            # connection dropped; on retry those documents fail as duplicate keys.
+            details = e.details
+            if details.get("writeConcernErrors") or any(
+                error.get("code") != _DUPLICATE_KEY_ERROR
+                for error in details.get("writeErrors", [])
+            ):
+                raise
+
     @retry_on_connection_failure()
     def get_by_id(self, interaction_id: str) -> InteractionDTO | None:
         """Retrieve an interaction by ID.
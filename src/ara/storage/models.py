@@ -35,7 +35,7 @@ class TimeQueryType(Enum):
     POINT_SEARCH = "point_search"
 
 
-@dataclass
+@dataclass(slots=True)
 class InteractionDTO:
     """Data transfer object for voice interactions."""
 
@@ -99,7 +99,7 @@ class InteractionDTO:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EventDTO:
     """Data transfer object for extracted events."""
 
@@ -147,7 +147,7 @@ class EventDTO:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityDTO:
     """Data transfer object for paired activities."""
 
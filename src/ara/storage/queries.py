@@ -9,6 +9,8 @@ from typing import Protocol
 from .events import ActivityRepository, EventRepository
 from .models import ActivityStatus, TimeQueryResultDTO
 
+_ONE_MS = timedelta(milliseconds=1)
+
 
 class StorageFacade(Protocol):
     """Protocol for storage access."""
@@ -53,12 +55,9 @@ class TimeQueryHandler:
         total_seconds = duration_ms // 1000
 
         # Calculate components
-        days = total_seconds // (24 * 60 * 60)
-        remaining = total_seconds % (24 * 60 * 60)
-        hours = remaining // (60 * 60)
-        remaining = remaining % (60 * 60)
-        minutes = remaining // 60
-        seconds = remaining % 60
+        days, remaining = divmod(total_seconds, 24 * 60 * 60)
+        hours, remaining = divmod(remaining, 60 * 60)
+        minutes, seconds = divmod(remaining, 60)
 
         parts: list[str] = []
 
@@ -97,8 +96,9 @@ class TimeQueryHandler:
         Raises:
             ValueError: If end is before start.
         """
-        duration = end - start
-        duration_ms = int(duration.total_seconds() * 1000)
+        # Truncate toward zero like int(); floor division would turn a
+        # sub-millisecond negative span into -1 and reject it
+        duration_ms = int((end - start) / _ONE_MS)
 
         if duration_ms < 0:
             raise ValueError("Duration cannot be negative (end is before start)")
@@ -51,7 +51,7 @@ class MockTranscriber:
         """
         self._latency_ms = latency_ms
 
-    def transcribe(self, audio: bytes, sample_rate: int) -> TranscriptionResult:
+    def transcribe(self, audio: bytes | memoryview, sample_rate: int) -> TranscriptionResult:
         """Return preset transcription result."""
         self._call_count += 1
 
@@ -46,11 +46,12 @@ class Transcriber(Protocol):
     Implementations convert audio to text using various STT engines.
     """
 
-    def transcribe(self, audio: bytes, sample_rate: int) -> TranscriptionResult:
+    def transcribe(self, audio: bytes | memoryview, sample_rate: int) -> TranscriptionResult:
         """Transcribe audio buffer to text.
 
         Args:
-            audio: Raw PCM audio bytes (16-bit, mono)
+            audio: Raw PCM audio bytes (16-bit, mono), or a view of them
+                so callers can pass a slice of a larger buffer without copying
             sample_rate: Audio sample rate in Hz
 
         Returns:
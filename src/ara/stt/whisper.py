@@ -88,11 +88,11 @@ class WhisperTranscriber:
         load_time = (time.time() - start) * 1000
         logger.info(f"Whisper model loaded in {load_time:.0f}ms")
 
-    def transcribe(self, audio: bytes, sample_rate: int) -> TranscriptionResult:
+    def transcribe(self, audio: bytes | memoryview, sample_rate: int) -> TranscriptionResult:
         """Transcribe audio to text.
 
         Args:
-            audio: Raw PCM audio bytes (16-bit, mono)
+            audio: Raw PCM audio bytes (16-bit, mono), or a view of them
             sample_rate: Audio sample rate (should be 16000 for Whisper)
 
         Returns:
@@ -5,6 +5,7 @@ Detects the current platform to select the optimal TTS engine.
 
 import platform as platform_module
 from enum import Enum, auto
+from functools import lru_cache
 
 
 class Platform(Enum):
@@ -15,6 +16,7 @@ class Platform(Enum):
     OTHER = auto()
 
 
+@lru_cache(maxsize=1)
 def detect_platform() -> Platform:
     """Detect the current platform for TTS engine selection.
 
@@ -24,6 +26,9 @@ def detect_platform() -> Platform:
         - RASPBERRY_PI for Linux on ARM (aarch64, armv7l)
         - OTHER for all other platforms
 
+    The result is cached for the lifetime of the process; call
+    ``detect_platform.cache_clear()`` to force re-detection.
+
     This function never raises exceptions.
     """
     system = platform_module.system()
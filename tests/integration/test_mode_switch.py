@@ -46,8 +46,7 @@ class TestModeSwitchingViaVoice:
         assert intent.entities.get("command") == "online"
 
         # Execute command with network available
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.ONLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.ONLINE)
         manager = ModeManager(network_monitor=monitor)
         manager.go_offline()
 
@@ -96,8 +95,7 @@ class TestModeAndNetworkIntegration:
         def on_mode_change(old: OperationMode, new: OperationMode) -> None:
             mode_changes.append((old, new))
 
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.ONLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.ONLINE)
         manager = ModeManager(
             network_monitor=monitor,
             on_mode_change=on_mode_change,
@@ -141,8 +139,7 @@ class TestSystemCommandHandling:
             OperationMode,
         )
 
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.ONLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.ONLINE)
         manager = ModeManager(network_monitor=monitor)
 
         handler = SystemCommandHandler(mode_manager=manager)
@@ -9,6 +9,8 @@ from ara.tts.mock import MockSynthesizer
 from ara.tts.platform import Platform, detect_platform
 from ara.tts.synthesizer import SynthesisResult, Synthesizer
 
+_ALL_PLATFORMS = frozenset(Platform)
+
 
 class TestPlatformTTSSelection:
     """Test automatic TTS engine selection based on platform."""
@@ -139,7 +141,7 @@ class TestActualPlatformDetection:
         """detect_platform should work on current system."""
         platform = detect_platform()
         assert isinstance(platform, Platform)
-        assert platform in list(Platform)
+        assert platform in _ALL_PLATFORMS
 
     @pytest.mark.skipif(
         detect_platform() != Platform.MACOS,
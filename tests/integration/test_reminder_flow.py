@@ -1,6 +1,5 @@
 """Integration tests for reminder flow (T011, T019, T059)."""
 
-import tempfile
 import uuid
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -17,6 +16,9 @@ from ara.stt.mock import MockTranscriber
 from ara.tts.mock import MockSynthesizer
 from ara.wake_word.mock import MockWakeWordDetector
 
+# Offsets for the Nth reminder in multi-reminder tests (1 hour, 2 hours, ...)
+_HOUR_DELTAS = tuple(timedelta(hours=i + 1) for i in range(16))
+
 
 class TestReminderSetFlow:
     """Integration tests for reminder set flow (T011)."""
@@ -138,10 +140,11 @@ class TestConcurrentReminderHandling:
     def test_query_multiple_reminders(self, orchestrator: Orchestrator) -> None:
         """Test querying multiple reminders shows all."""
         # Create multiple reminders
+        base = datetime.now(UTC)
         for i in range(3):
             orchestrator.reminder_manager.create(
                 message=f"task {i}",
-                remind_at=datetime.now(UTC) + timedelta(hours=i + 1),
+                remind_at=base + _HOUR_DELTAS[i],
                 interaction_id=uuid.uuid4(),
             )
 
@@ -154,10 +157,9 @@ class TestConcurrentReminderHandling:
 class TestMissedReminderDelivery:
     """Integration tests for missed reminder delivery (T059)."""
 
-    def test_missed_reminders_detected_on_startup(self) -> None:
+    def test_missed_reminders_detected_on_startup(self, tmp_path: Path) -> None:
         """Test that missed reminders are detected when manager starts."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "reminders.json"
 
         # Create a manager and add a past reminder
         manager1 = ReminderManager(persistence_path=temp_path)
@@ -174,18 +176,18 @@ class TestMissedReminderDelivery:
         assert len(missed) == 1
         assert missed[0].message == "missed task"
 
-    def test_missed_reminders_with_multiple_past(self) -> None:
+    def test_missed_reminders_with_multiple_past(self, tmp_path: Path) -> None:
         """Test detection of multiple missed reminders."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "reminders.json"
 
         manager1 = ReminderManager(persistence_path=temp_path)
 
         # Create multiple past reminders
+        base = datetime.now(UTC)
         for i in range(3):
             manager1.create(
                 message=f"missed {i}",
-                remind_at=datetime.now(UTC) - timedelta(minutes=10 * (i + 1)),
+                remind_at=base - timedelta(minutes=10 * (i + 1)),
                 interaction_id=uuid.uuid4(),
             )
 
@@ -203,10 +205,9 @@ class TestMissedReminderDelivery:
         # Should find 3 missed, not the future one
         assert len(missed) == 3
 
-    def test_missed_reminders_not_double_counted(self) -> None:
+    def test_missed_reminders_not_double_counted(self, tmp_path: Path) -> None:
         """Test that missed reminders aren't counted twice."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "reminders.json"
 
         manager = ReminderManager(persistence_path=temp_path)
         manager.create(
@@ -230,10 +231,9 @@ class TestMissedReminderDelivery:
 class TestReminderFlowWithPersistence:
     """Integration tests for reminder flow with persistence."""
 
-    def test_set_query_restart_query(self) -> None:
+    def test_set_query_restart_query(self, tmp_path: Path) -> None:
         """Test full flow: set, query, restart, query again."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "reminders.json"
 
         # First session
         mock_llm = MagicMock()
@@ -282,10 +282,11 @@ class TestTenPlusConcurrentReminders:
 
     def test_ten_plus_reminders_created(self, orchestrator: Orchestrator) -> None:
         """Test creating 10+ reminders."""
+        base = datetime.now(UTC)
         for i in range(15):
             orchestrator.reminder_manager.create(
                 message=f"reminder {i}",
-                remind_at=datetime.now(UTC) + timedelta(hours=i + 1),
+                remind_at=base + _HOUR_DELTAS[i],
                 interaction_id=uuid.uuid4(),
             )
 
@@ -294,10 +295,11 @@ class TestTenPlusConcurrentReminders:
 
     def test_ten_plus_reminders_query_response(self, orchestrator: Orchestrator) -> None:
         """Test querying 10+ reminders produces valid response."""
+        base = datetime.now(UTC)
         for i in range(12):
             orchestrator.reminder_manager.create(
                 message=f"task {i}",
-                remind_at=datetime.now(UTC) + timedelta(hours=i + 1),
+                remind_at=base + _HOUR_DELTAS[i],
                 interaction_id=uuid.uuid4(),
             )
 
@@ -309,17 +311,17 @@ class TestTenPlusConcurrentReminders:
         # Should use numeric ordinals for 11th and 12th
         assert "11th" in response or "eleventh" in response.lower()
 
-    def test_ten_plus_reminders_persist_correctly(self) -> None:
+    def test_ten_plus_reminders_persist_correctly(self, tmp_path: Path) -> None:
         """Test that 10+ reminders persist and load correctly."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "reminders.json"
 
         manager1 = ReminderManager(persistence_path=temp_path)
 
+        base = datetime.now(UTC)
         for i in range(15):
             manager1.create(
                 message=f"reminder {i}",
-                remind_at=datetime.now(UTC) + timedelta(hours=i + 1),
+                remind_at=base + _HOUR_DELTAS[i],
                 interaction_id=uuid.uuid4(),
             )
 
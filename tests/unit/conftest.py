@@ -0,0 +1,190 @@
+"""Shared fixtures for unit tests."""
+
+import itertools
+import sys
+import threading
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from ara.commands.reminder import Reminder, ReminderManager
+from ara.logger.interaction import Interaction, OperationMode, ResponseSource
+from ara.router.intent import IntentClassifier
+from ara.router.orchestrator import Orchestrator
+from ara.router.query_router import QueryRouter
+
+# Signature of the make_reminders fixture, for test annotations
+ReminderFactory = Callable[..., list[Reminder]]
+
+# Signature of the uid fixture, for test annotations
+UuidFactory = Callable[[], uuid.UUID]
+
+# Signature of the make_interaction fixture, for test annotations
+InteractionFactory = Callable[..., Interaction]
+
+# Signature of the run_concurrently fixture, for test annotations
+ConcurrentRunner = Callable[[list[Callable[[], None]], Callable[[], None], int], None]
+
+
+@pytest.fixture(scope="session")
+def router() -> QueryRouter:
+    """Create a QueryRouter instance shared by all unit tests.
+
+    The router holds no per-query state, so one instance is enough.
+    """
+    return QueryRouter()
+
+
+@pytest.fixture(scope="session")
+def classifier() -> IntentClassifier:
+    """Create an IntentClassifier instance shared by all unit tests.
+
+    classify() does not mutate the classifier, so one instance is enough.
+    """
+    return IntentClassifier()
+
+
+@pytest.fixture
+def temp_path(tmp_path: Path) -> Path:
+    """Return a reminders persistence path inside the test's tmp dir."""
+    return tmp_path / "reminders.json"
+
+
+@pytest.fixture
+def orchestrator() -> Orchestrator:
+    """Create a minimal orchestrator with isolated reminder state.
+
+    Built per test because the orchestrator carries mutable state (note
+    mode, timers, mode manager, pending queries) that would otherwise leak
+    between tests; construction takes a couple of milliseconds.
+    """
+    mock_llm = MagicMock()
+    mock_llm.generate.return_value = MagicMock(text="OK")
+    mock_feedback = MagicMock()
+
+    orch = Orchestrator(
+        llm=mock_llm,
+        feedback=mock_feedback,
+    )
+    # Replace with isolated in-memory manager
+    orch._reminder_manager = ReminderManager()
+    return orch
+
+
+@pytest.fixture(scope="session")
+def make_reminders() -> ReminderFactory:
+    """Provide a factory that seeds a manager with hourly reminders.
+
+    ``make_reminders(manager, 3, "task")`` creates "task 0".."task 2" due
+    one, two and three hours after the session started, persisting once.
+    Each batch is attributed to a single interaction, as if one request
+    set them all.
+
+    The slots are read off the real clock once rather than fixed to a
+    calendar date, because the manager compares against the current time
+    and the reminders must still be in the future.
+    """
+    base = datetime.now(UTC)
+    slots = tuple(base + timedelta(hours=h) for h in range(1, 25))
+
+    def make(manager: ReminderManager, count: int, prefix: str = "reminder") -> list[Reminder]:
+        interaction_id = uuid.uuid4()
+        return manager.create_many(
+            {"message": f"{prefix} {i}", "remind_at": slots[i], "interaction_id": interaction_id}
+            for i in range(count)
+        )
+
+    return make
+
+
+@pytest.fixture
+def uid() -> UuidFactory:
+    """Provide a factory of deterministic, per-test unique UUIDs.
+
+    Sequential ids avoid reading urandom, and a fresh counter per test keeps
+    ids independent of test order.
+    """
+    counter = itertools.count(1)
+    return lambda: uuid.UUID(int=next(counter))
+
+
+@pytest.fixture
+def make_interaction(uid: UuidFactory) -> InteractionFactory:
+    """Provide a factory of sample interactions.
+
+    ``make_interaction(**overrides)`` builds an interaction with fresh ids,
+    the current time and its own ``entities`` and ``latency_ms`` dicts, so
+    mutating one instance never affects another. Any field can be overridden.
+    """
+
+    def make(**overrides: Any) -> Interaction:
+        fields: dict[str, Any] = {
+            "id": uid(),
+            "session_id": uid(),
+            "timestamp": datetime.now(UTC),
+            "device_id": "test-device",
+            "wake_word_confidence": 0.95,
+            "audio_duration_ms": 2500,
+            "transcript": "what time is it",
+            "transcript_confidence": 0.9,
+            "intent": "general_question",
+            "intent_confidence": 0.85,
+            "entities": {},
+            "response": "It's 3:30 PM",
+            "response_source": ResponseSource.LOCAL_LLM,
+            "latency_ms": {"stt": 450, "llm": 800, "total": 1250},
+            "mode": OperationMode.OFFLINE,
+            "error": None,
+            **overrides,
+        }
+        return Interaction(**fields)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def run_concurrently() -> ConcurrentRunner:
+    """Provide a runner that races producer threads against polling threads.
+
+    ``run_concurrently(producers, poll, pollers)`` starts one thread per
+    producer and ``pollers`` threads that call ``poll`` in a loop, releases
+    them together, and returns once the producers are done and the pollers
+    have stopped. The thread switch interval is lowered for the run so that
+    interleavings happen far more often than with the default 5 ms.
+    """
+
+    def run(producers: list[Callable[[], None]], poll: Callable[[], None], pollers: int) -> None:
+        barrier = threading.Barrier(len(producers) + pollers)
+        producing = threading.Event()
+        producing.set()
+
+        def produce(producer: Callable[[], None]) -> None:
+            barrier.wait()
+            producer()
+
+        def keep_polling() -> None:
+            barrier.wait()
+            while producing.is_set():
+                poll()
+
+        producer_threads = [threading.Thread(target=produce, args=(p,)) for p in producers]
+        poller_threads = [threading.Thread(target=keep_polling) for _ in range(pollers)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in producer_threads + poller_threads:
+                thread.start()
+            for thread in producer_threads:
+                thread.join()
+            producing.clear()
+            for thread in poller_threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+    return run
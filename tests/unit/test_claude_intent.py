@@ -3,19 +3,12 @@
 Tests the CLAUDE_QUERY, CLAUDE_SUMMARY, and CLAUDE_RESET intent patterns.
 """
 
-import pytest
-
 from ara.router.intent import IntentClassifier, IntentType
 
 
 class TestClaudeQueryIntent:
     """Tests for CLAUDE_QUERY intent recognition."""
 
-    @pytest.fixture
-    def classifier(self) -> IntentClassifier:
-        """Create intent classifier instance."""
-        return IntentClassifier()
-
     def test_ask_claude_basic_question(self, classifier: IntentClassifier) -> None:
         """Test 'ask Claude what is X' pattern."""
         result = classifier.classify("ask Claude what is the capital of France")
@@ -59,11 +52,6 @@ class TestClaudeQueryIntent:
 class TestClaudeSummaryIntent:
     """Tests for CLAUDE_SUMMARY intent recognition."""
 
-    @pytest.fixture
-    def classifier(self) -> IntentClassifier:
-        """Create intent classifier instance."""
-        return IntentClassifier()
-
     def test_summarize_claude_conversations_today(
         self, classifier: IntentClassifier
     ) -> None:
@@ -115,11 +103,6 @@ class TestClaudeSummaryIntent:
 class TestClaudeResetIntent:
     """Tests for CLAUDE_RESET intent recognition."""
 
-    @pytest.fixture
-    def classifier(self) -> IntentClassifier:
-        """Create intent classifier instance."""
-        return IntentClassifier()
-
     def test_new_conversation_pattern(self, classifier: IntentClassifier) -> None:
         """Test 'new conversation' pattern."""
         result = classifier.classify("new conversation")
@@ -1,7 +1,5 @@
 """Unit tests for intent classification."""
 
-import pytest
-
 from ara.router.intent import (
     Intent,
     IntentClassifier,
@@ -55,11 +53,6 @@ class TestIntent:
 class TestIntentClassifier:
     """Tests for IntentClassifier."""
 
-    @pytest.fixture
-    def classifier(self) -> IntentClassifier:
-        """Create an IntentClassifier instance."""
-        return IntentClassifier()
-
     # Timer intents
     def test_classify_timer_set(self, classifier: IntentClassifier) -> None:
         """Test classifying timer set intent."""
@@ -203,11 +196,6 @@ class TestIntentClassifier:
 class TestIntentEntityExtraction:
     """Tests for entity extraction from intents."""
 
-    @pytest.fixture
-    def classifier(self) -> IntentClassifier:
-        """Create an IntentClassifier instance."""
-        return IntentClassifier()
-
     def test_extract_timer_duration(self, classifier: IntentClassifier) -> None:
         """Test extracting duration from timer intent."""
         intent = classifier.classify("set a timer for 5 minutes")
@@ -1,6 +1,5 @@
 """Unit tests for ModeManager and mode persistence (T105)."""
 
-import json
 import tempfile
 from pathlib import Path
 
@@ -13,7 +12,7 @@ class TestModeManagerPersistence:
         from ara.router.mode import ModeManager, NetworkMonitor, OperationMode
 
         with tempfile.TemporaryDirectory() as tmpdir:
-            prefs_path = Path(tmpdir) / "preferences.json"
+            prefs_path = Path(tmpdir) / "preferences"
 
             monitor = NetworkMonitor()
             manager = ModeManager(
@@ -25,16 +24,15 @@ class TestModeManagerPersistence:
             manager.save_preferences()
 
             assert prefs_path.exists()
-            data = json.loads(prefs_path.read_text())
-            assert data["mode"] == "online_cloud"
+            assert prefs_path.read_text() == "online_cloud\n"
 
     def test_load_mode_preference(self) -> None:
         """Test mode preference is loaded from file."""
         from ara.router.mode import ModeManager, NetworkMonitor, OperationMode
 
         with tempfile.TemporaryDirectory() as tmpdir:
-            prefs_path = Path(tmpdir) / "preferences.json"
-            prefs_path.write_text(json.dumps({"mode": "online_local"}))
+            prefs_path = Path(tmpdir) / "preferences"
+            prefs_path.write_text("online_local\n")
 
             monitor = NetworkMonitor()
             manager = ModeManager(
@@ -45,12 +43,29 @@ class TestModeManagerPersistence:
 
             assert manager.mode == OperationMode.ONLINE_LOCAL
 
+    def test_load_legacy_json_preference(self) -> None:
+        """Test a preferences file in the old JSON format is still loaded."""
+        from ara.router.mode import ModeManager, NetworkMonitor, OperationMode
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            prefs_path = Path(tmpdir) / "preferences"
+            prefs_path.write_text('{"mode": "online_cloud"}')
+
+            monitor = NetworkMonitor()
+            manager = ModeManager(
+                network_monitor=monitor,
+                preferences_path=prefs_path,
+            )
+            manager.load_preferences()
+
+            assert manager.mode == OperationMode.ONLINE_CLOUD
+
     def test_load_preferences_file_not_exists(self) -> None:
         """Test graceful handling when preferences file doesn't exist."""
         from ara.router.mode import ModeManager, NetworkMonitor, OperationMode
 
         with tempfile.TemporaryDirectory() as tmpdir:
-            prefs_path = Path(tmpdir) / "nonexistent.json"
+            prefs_path = Path(tmpdir) / "nonexistent"
 
             monitor = NetworkMonitor()
             manager = ModeManager(
@@ -62,13 +77,13 @@ class TestModeManagerPersistence:
             # Should keep default mode
             assert manager.mode == OperationMode.OFFLINE
 
-    def test_load_preferences_invalid_json(self) -> None:
-        """Test graceful handling of invalid JSON."""
+    def test_load_preferences_invalid_content(self) -> None:
+        """Test graceful handling of unparseable file content."""
         from ara.router.mode import ModeManager, NetworkMonitor, OperationMode
 
         with tempfile.TemporaryDirectory() as tmpdir:
-            prefs_path = Path(tmpdir) / "preferences.json"
-            prefs_path.write_text("not valid json")
+            prefs_path = Path(tmpdir) / "preferences"
+            prefs_path.write_text("not a valid mode\nline two")
 
             monitor = NetworkMonitor()
             manager = ModeManager(
@@ -85,8 +100,8 @@ class TestModeManagerPersistence:
         from ara.router.mode import ModeManager, NetworkMonitor, OperationMode
 
         with tempfile.TemporaryDirectory() as tmpdir:
-            prefs_path = Path(tmpdir) / "preferences.json"
-            prefs_path.write_text(json.dumps({"mode": "invalid_mode"}))
+            prefs_path = Path(tmpdir) / "preferences"
+            prefs_path.write_text("invalid_mode\n")
 
             monitor = NetworkMonitor()
             manager = ModeManager(
@@ -111,8 +126,7 @@ class TestModeManagerStatusInfo:
             OperationMode,
         )
 
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.ONLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.ONLINE)
         manager = ModeManager(network_monitor=monitor)
         manager._mode = OperationMode.ONLINE_LOCAL
 
@@ -130,8 +144,7 @@ class TestModeManagerStatusInfo:
             NetworkStatus,
         )
 
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.ONLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.ONLINE)
         manager = ModeManager(network_monitor=monitor)
         manager.go_offline()
 
@@ -214,8 +227,7 @@ class TestModeManagerAutoSwitch:
             OperationMode,
         )
 
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.ONLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.ONLINE)
         manager = ModeManager(
             network_monitor=monitor,
             auto_mode_switching=True,
@@ -237,8 +249,7 @@ class TestModeManagerAutoSwitch:
             OperationMode,
         )
 
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.OFFLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.OFFLINE)
         manager = ModeManager(
             network_monitor=monitor,
             auto_mode_switching=True,
@@ -262,8 +273,7 @@ class TestModeManagerAutoSwitch:
             OperationMode,
         )
 
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.ONLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.ONLINE)
         manager = ModeManager(
             network_monitor=monitor,
             auto_mode_switching=False,
@@ -62,8 +62,7 @@ class TestNetworkMonitor:
         """Test is_online convenience property."""
         from ara.router.mode import NetworkMonitor, NetworkStatus
 
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.ONLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.ONLINE)
         assert monitor.is_online is True
 
         monitor._status = NetworkStatus.OFFLINE
@@ -73,8 +72,7 @@ class TestNetworkMonitor:
         """Test status property returns current status."""
         from ara.router.mode import NetworkMonitor, NetworkStatus
 
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.ONLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.ONLINE)
         assert monitor.status == NetworkStatus.ONLINE
 
     @patch("socket.create_connection")
@@ -102,10 +100,12 @@ class TestNetworkMonitor:
         def on_change(new_status: NetworkStatus) -> None:
             callback_data.append(new_status)
 
-        monitor = NetworkMonitor(on_status_change=on_change)
+        monitor = NetworkMonitor(
+            on_status_change=on_change,
+            initial_status=NetworkStatus.OFFLINE,
+        )
 
         # Simulate status change
-        monitor._status = NetworkStatus.OFFLINE
         monitor._notify_status_change(NetworkStatus.ONLINE)
 
         assert len(callback_data) == 1
@@ -175,8 +175,7 @@ class TestModeManager:
             OperationMode,
         )
 
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.ONLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.ONLINE)
         manager = ModeManager(network_monitor=monitor)
         manager._mode = OperationMode.OFFLINE
 
@@ -192,8 +191,7 @@ class TestModeManager:
             OperationMode,
         )
 
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.OFFLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.OFFLINE)
         manager = ModeManager(network_monitor=monitor)
 
         manager.go_online()
@@ -208,8 +206,7 @@ class TestModeManager:
             OperationMode,
         )
 
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.ONLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.ONLINE)
         manager = ModeManager(network_monitor=monitor)
 
         # Offline mode - never use cloud
@@ -233,8 +230,7 @@ class TestModeManager:
             OperationMode,
         )
 
-        monitor = NetworkMonitor()
-        monitor._status = NetworkStatus.ONLINE
+        monitor = NetworkMonitor(initial_status=NetworkStatus.ONLINE)
         manager = ModeManager(network_monitor=monitor)
         manager._mode = OperationMode.ONLINE_LOCAL
 
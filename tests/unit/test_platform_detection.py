@@ -1,11 +1,23 @@
 """Unit tests for platform detection."""
 
-from unittest.mock import patch
+from collections.abc import Iterator
 
 import pytest
 
 from ara.tts.platform import Platform, detect_platform
 
+_SYSTEM = "ara.tts.platform.platform_module.system"
+_MACHINE = "ara.tts.platform.platform_module.machine"
+_ALL_PLATFORMS = frozenset(Platform)
+
+
+@pytest.fixture(autouse=True)
+def _clear_platform_cache() -> Iterator[None]:
+    """Reset the cached detection result around each test."""
+    detect_platform.cache_clear()
+    yield
+    detect_platform.cache_clear()
+
 
 class TestPlatformEnum:
     """Test Platform enum values."""
@@ -31,80 +43,51 @@ class TestPlatformEnum:
 class TestDetectPlatform:
     """Test detect_platform function."""
 
-    def test_detect_macos_on_darwin(self) -> None:
-        """Should return MACOS on Darwin (macOS)."""
-        with (
-            patch("ara.tts.platform.platform_module.system", return_value="Darwin"),
-            patch("ara.tts.platform.platform_module.machine", return_value="arm64"),
-        ):
-            result = detect_platform()
-            assert result == Platform.MACOS
-
-    def test_detect_macos_on_intel_mac(self) -> None:
-        """Should return MACOS on Intel Mac."""
-        with (
-            patch("ara.tts.platform.platform_module.system", return_value="Darwin"),
-            patch("ara.tts.platform.platform_module.machine", return_value="x86_64"),
-        ):
-            result = detect_platform()
-            assert result == Platform.MACOS
-
-    def test_detect_raspberry_pi_aarch64(self) -> None:
-        """Should return RASPBERRY_PI on Linux aarch64."""
-        with (
-            patch("ara.tts.platform.platform_module.system", return_value="Linux"),
-            patch("ara.tts.platform.platform_module.machine", return_value="aarch64"),
-        ):
-            result = detect_platform()
-            assert result == Platform.RASPBERRY_PI
-
-    def test_detect_raspberry_pi_armv7l(self) -> None:
-        """Should return RASPBERRY_PI on Linux armv7l."""
-        with (
-            patch("ara.tts.platform.platform_module.system", return_value="Linux"),
-            patch("ara.tts.platform.platform_module.machine", return_value="armv7l"),
-        ):
-            result = detect_platform()
-            assert result == Platform.RASPBERRY_PI
-
-    def test_detect_other_on_linux_x86(self) -> None:
-        """Should return OTHER on Linux x86_64."""
-        with (
-            patch("ara.tts.platform.platform_module.system", return_value="Linux"),
-            patch("ara.tts.platform.platform_module.machine", return_value="x86_64"),
-        ):
-            result = detect_platform()
-            assert result == Platform.OTHER
-
-    def test_detect_other_on_windows(self) -> None:
-        """Should return OTHER on Windows."""
-        with (
-            patch("ara.tts.platform.platform_module.system", return_value="Windows"),
-            patch("ara.tts.platform.platform_module.machine", return_value="AMD64"),
-        ):
-            result = detect_platform()
-            assert result == Platform.OTHER
-
-    def test_detect_never_raises(self) -> None:
-        """detect_platform should never raise exceptions."""
-        # Test with unusual values that might cause issues
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("system", "machine", "expected"),
+        [
+            ("Darwin", "arm64", Platform.MACOS),
+            ("Darwin", "x86_64", Platform.MACOS),
+            ("Linux", "aarch64", Platform.RASPBERRY_PI),
+            ("Linux", "armv7l", Platform.RASPBERRY_PI),
+            ("Linux", "x86_64", Platform.OTHER),
+            ("Windows", "AMD64", Platform.OTHER),
+        ],
+    )
+    def test_detect(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        system: str,
+        machine: str,
+        expected: Platform,
+    ) -> None:
+        """Should map system/machine pairs to the expected platform.
+
+        Darwin on any architecture is MACOS, Linux on ARM is RASPBERRY_PI,
+        and everything else is OTHER.
+        """
+        monkeypatch.setattr(_SYSTEM, lambda: system)
+        monkeypatch.setattr(_MACHINE, lambda: machine)
+        assert detect_platform() == expected
+
+    @pytest.mark.parametrize(
+        ("system", "machine"),
+        [
             ("", ""),
             ("Unknown", "unknown"),
             ("DARWIN", "ARM64"),  # Wrong case
-        ]
-
-        for system, machine in test_cases:
-            with (
-                patch("ara.tts.platform.platform_module.system", return_value=system),
-                patch("ara.tts.platform.platform_module.machine", return_value=machine),
-            ):
-                # Should not raise
-                result = detect_platform()
-                assert isinstance(result, Platform)
+        ],
+    )
+    def test_detect_never_raises(
+        self, monkeypatch: pytest.MonkeyPatch, system: str, machine: str
+    ) -> None:
+        """detect_platform should never raise on unusual values."""
+        monkeypatch.setattr(_SYSTEM, lambda: system)
+        monkeypatch.setattr(_MACHINE, lambda: machine)
+        assert isinstance(detect_platform(), Platform)
 
     def test_returns_valid_platform_enum(self) -> None:
         """detect_platform should always return a valid Platform enum."""
         result = detect_platform()
         assert isinstance(result, Platform)
-        assert result in list(Platform)
+        assert result in _ALL_PLATFORMS
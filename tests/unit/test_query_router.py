@@ -3,6 +3,8 @@
 Tests query classification and routing decisions.
 """
 
+import logging
+
 import pytest
 
 from ara.router.query_router import (
@@ -13,12 +15,6 @@ from ara.router.query_router import (
 )
 
 
-@pytest.fixture
-def router() -> QueryRouter:
-    """Create a QueryRouter instance for testing."""
-    return QueryRouter()
-
-
 class TestQueryType:
     """Tests for QueryType enum."""
 
@@ -51,7 +47,7 @@ class TestRoutingDecision:
         )
         assert decision.fallback_source is None
         assert decision.confidence == 0.5
-        assert decision.indicators_matched == []
+        assert decision.indicators_matched == ()
         assert decision.should_caveat is False
 
     def test_routing_decision_full(self) -> None:
@@ -61,14 +57,14 @@ class TestRoutingDecision:
             primary_source=DataSource.WEB_SEARCH,
             fallback_source=DataSource.LLM,
             confidence=0.85,
-            indicators_matched=["weather", "temperature"],
+            indicators_matched=("weather", "temperature"),
             should_caveat=True,
         )
         assert decision.query_type == QueryType.FACTUAL_CURRENT
         assert decision.primary_source == DataSource.WEB_SEARCH
         assert decision.fallback_source == DataSource.LLM
         assert decision.confidence == 0.85
-        assert decision.indicators_matched == ["weather", "temperature"]
+        assert decision.indicators_matched == ("weather", "temperature")
         assert decision.should_caveat is True
 
 
@@ -194,6 +190,37 @@ class TestAmbiguousQueryClassification:
         assert decision.query_type == QueryType.PERSONAL_DATA
 
 
+class TestClassificationCache:
+    """Tests for memoized classification."""
+
+    def test_repeated_query_reuses_decision(self, router: QueryRouter) -> None:
+        """Test the same query (modulo case/whitespace) hits the cache."""
+        first = router.classify("When did I last exercise?")
+        second = router.classify("  when did i last exercise?  ")
+        assert second is first
+
+    def test_cache_is_shared_across_routers(self) -> None:
+        """Test separate routers reuse one process-wide cache."""
+        first = QueryRouter().classify("What did I eat yesterday?")
+        assert QueryRouter().classify("what did i eat yesterday?") is first
+
+    def test_cached_decision_is_still_logged(
+        self, router: QueryRouter, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test the classification debug log fires on cache hits too."""
+        router.classify("What is the capital of France?")
+        with caplog.at_level(logging.DEBUG, logger="ara.router.query_router"):
+            router.classify("What is the capital of France?")
+        assert "GENERAL_KNOWLEDGE" in caplog.text
+
+    def test_ambiguous_query_still_uses_context(self, router: QueryRouter) -> None:
+        """Test context resolution is not bypassed by a cached result."""
+        assert router.classify("What about that?").confidence == 0.5
+        context = {"recent_queries": [{"query_type": QueryType.PERSONAL_DATA}]}
+        decision = router.classify("What about that?", context)
+        assert decision.query_type == QueryType.PERSONAL_DATA
+
+
 class TestHelperMethods:
     """Tests for is_personal_query and is_factual_query helpers."""
 
@@ -218,3 +245,10 @@ class TestHelperMethods:
         """Test is_factual_query returns False for non-factual queries."""
         assert router.is_factual_query("What is photosynthesis?") is False
         assert router.is_factual_query("When did I exercise?") is False
+
+    def test_helpers_agree_with_classify(self, router: QueryRouter) -> None:
+        """Test helpers report the same type that classify routes to."""
+        query = "What did I say about the weather?"
+        assert router.classify(query).query_type == QueryType.PERSONAL_DATA
+        assert router.is_personal_query(query) is True
+        assert router.is_factual_query(query) is False
@@ -1,7 +1,8 @@
 """Unit tests for Reminder entity and ReminderManager."""
 
-import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 
 import pytest
 
@@ -12,70 +13,88 @@ from ara.commands.reminder import (
     ReminderStatus,
     parse_reminder_time,
 )
+from tests.unit.conftest import ConcurrentRunner, UuidFactory
+
+
+@pytest.fixture(scope="session")
+def times() -> SimpleNamespace:
+    """Capture the current UTC time once per session, with common offsets.
+
+    The offsets only need to stay on the right side of the wall clock, which
+    they do for any realistic session length.
+    """
+    now = datetime.now(UTC)
+    return SimpleNamespace(
+        now=now,
+        plus_hour=now + timedelta(hours=1),
+        plus_two_hours=now + timedelta(hours=2),
+        minus_minute=now - timedelta(minutes=1),
+        minus_two_minutes=now - timedelta(minutes=2),
+    )
 
 
 class TestReminderEntity:
     """Tests for Reminder dataclass."""
 
-    def test_create_reminder(self) -> None:
+    def test_create_reminder(self, times: SimpleNamespace, uid: UuidFactory) -> None:
         """Test creating a reminder with all fields."""
-        remind_at = datetime.now(UTC) + timedelta(hours=1)
+        remind_at = times.plus_hour
         reminder = Reminder(
-            id=uuid.uuid4(),
+            id=uid(),
             message="call mom",
             remind_at=remind_at,
             recurrence=Recurrence.NONE,
             status=ReminderStatus.PENDING,
             triggered_at=None,
-            created_by_interaction=uuid.uuid4(),
-            created_at=datetime.now(UTC),
+            created_by_interaction=uid(),
+            created_at=times.now,
         )
         assert reminder.message == "call mom"
         assert reminder.recurrence == Recurrence.NONE
         assert reminder.status == ReminderStatus.PENDING
         assert reminder.triggered_at is None
 
-    def test_reminder_with_recurrence(self) -> None:
+    def test_reminder_with_recurrence(self, times: SimpleNamespace, uid: UuidFactory) -> None:
         """Test creating a recurring reminder."""
         reminder = Reminder(
-            id=uuid.uuid4(),
+            id=uid(),
             message="take medication",
-            remind_at=datetime.now(UTC) + timedelta(hours=1),
+            remind_at=times.plus_hour,
             recurrence=Recurrence.DAILY,
             status=ReminderStatus.PENDING,
             triggered_at=None,
-            created_by_interaction=uuid.uuid4(),
-            created_at=datetime.now(UTC),
+            created_by_interaction=uid(),
+            created_at=times.now,
         )
         assert reminder.recurrence == Recurrence.DAILY
 
-    def test_reminder_is_due(self) -> None:
+    def test_reminder_is_due(self, times: SimpleNamespace, uid: UuidFactory) -> None:
         """Test checking if reminder is due."""
-        past = datetime.now(UTC) - timedelta(minutes=1)
+        past = times.minus_minute
         reminder = Reminder(
-            id=uuid.uuid4(),
+            id=uid(),
             message="test",
             remind_at=past,
             recurrence=Recurrence.NONE,
             status=ReminderStatus.PENDING,
             triggered_at=None,
-            created_by_interaction=uuid.uuid4(),
-            created_at=datetime.now(UTC),
+            created_by_interaction=uid(),
+            created_at=times.now,
         )
         assert reminder.is_due is True
 
-    def test_reminder_not_due(self) -> None:
+    def test_reminder_not_due(self, times: SimpleNamespace, uid: UuidFactory) -> None:
         """Test reminder is not due yet."""
-        future = datetime.now(UTC) + timedelta(hours=1)
+        future = times.plus_hour
         reminder = Reminder(
-            id=uuid.uuid4(),
+            id=uid(),
             message="test",
             remind_at=future,
             recurrence=Recurrence.NONE,
             status=ReminderStatus.PENDING,
             triggered_at=None,
-            created_by_interaction=uuid.uuid4(),
-            created_at=datetime.now(UTC),
+            created_by_interaction=uid(),
+            created_at=times.now,
         )
         assert reminder.is_due is False
 
@@ -102,18 +121,27 @@ class TestRecurrence:
         assert Recurrence.MONTHLY.value == "monthly"
 
 
+@pytest.fixture(scope="session")
+def shared_manager() -> ReminderManager:
+    """Create a single in-memory ReminderManager for the session."""
+    return ReminderManager()
+
+
 class TestReminderManager:
     """Tests for ReminderManager."""
 
     @pytest.fixture
-    def manager(self) -> ReminderManager:
-        """Create a ReminderManager instance."""
-        return ReminderManager()
-
-    def test_create_reminder(self, manager: ReminderManager) -> None:
+    def manager(self, shared_manager: ReminderManager) -> ReminderManager:
+        """Provide the shared ReminderManager with all reminders cleared."""
+        shared_manager.clear()
+        return shared_manager
+
+    def test_create_reminder(
+        self, manager: ReminderManager, times: SimpleNamespace, uid: UuidFactory
+    ) -> None:
         """Test creating a reminder through manager."""
-        remind_at = datetime.now(UTC) + timedelta(hours=1)
-        interaction_id = uuid.uuid4()
+        remind_at = times.plus_hour
+        interaction_id = uid()
         reminder = manager.create(
             message="call mom",
             remind_at=remind_at,
@@ -123,59 +151,67 @@ class TestReminderManager:
         assert reminder.status == ReminderStatus.PENDING
         assert reminder.created_by_interaction == interaction_id
 
-    def test_create_recurring_reminder(self, manager: ReminderManager) -> None:
+    def test_create_recurring_reminder(
+        self, manager: ReminderManager, times: SimpleNamespace, uid: UuidFactory
+    ) -> None:
         """Test creating a recurring reminder."""
         reminder = manager.create(
             message="take medication",
-            remind_at=datetime.now(UTC) + timedelta(hours=1),
-            interaction_id=uuid.uuid4(),
+            remind_at=times.plus_hour,
+            interaction_id=uid(),
             recurrence=Recurrence.DAILY,
         )
         assert reminder.recurrence == Recurrence.DAILY
 
-    def test_cancel_reminder(self, manager: ReminderManager) -> None:
+    def test_cancel_reminder(
+        self, manager: ReminderManager, times: SimpleNamespace, uid: UuidFactory
+    ) -> None:
         """Test cancelling a reminder."""
         reminder = manager.create(
             message="test",
-            remind_at=datetime.now(UTC) + timedelta(hours=1),
-            interaction_id=uuid.uuid4(),
+            remind_at=times.plus_hour,
+            interaction_id=uid(),
         )
         result = manager.cancel(reminder.id)
         assert result is True
         assert reminder.status == ReminderStatus.CANCELLED
 
-    def test_cancel_nonexistent_reminder(self, manager: ReminderManager) -> None:
+    def test_cancel_nonexistent_reminder(self, manager: ReminderManager, uid: UuidFactory) -> None:
         """Test cancelling a reminder that doesn't exist."""
-        result = manager.cancel(uuid.uuid4())
+        result = manager.cancel(uid())
         assert result is False
 
-    def test_get_reminder(self, manager: ReminderManager) -> None:
+    def test_get_reminder(
+        self, manager: ReminderManager, times: SimpleNamespace, uid: UuidFactory
+    ) -> None:
         """Test getting a reminder by ID."""
         reminder = manager.create(
             message="test",
-            remind_at=datetime.now(UTC) + timedelta(hours=1),
-            interaction_id=uuid.uuid4(),
+            remind_at=times.plus_hour,
+            interaction_id=uid(),
         )
         retrieved = manager.get(reminder.id)
         assert retrieved is not None
         assert retrieved.id == reminder.id
 
-    def test_get_nonexistent_reminder(self, manager: ReminderManager) -> None:
+    def test_get_nonexistent_reminder(self, manager: ReminderManager, uid: UuidFactory) -> None:
         """Test getting a reminder that doesn't exist."""
-        result = manager.get(uuid.uuid4())
+        result = manager.get(uid())
         assert result is None
 
-    def test_list_pending_reminders(self, manager: ReminderManager) -> None:
+    def test_list_pending_reminders(
+        self, manager: ReminderManager, times: SimpleNamespace, uid: UuidFactory
+    ) -> None:
         """Test listing pending reminders."""
         r1 = manager.create(
             message="r1",
-            remind_at=datetime.now(UTC) + timedelta(hours=1),
-            interaction_id=uuid.uuid4(),
+            remind_at=times.plus_hour,
+            interaction_id=uid(),
         )
         r2 = manager.create(
             message="r2",
-            remind_at=datetime.now(UTC) + timedelta(hours=2),
-            interaction_id=uuid.uuid4(),
+            remind_at=times.plus_two_hours,
+            interaction_id=uid(),
         )
         manager.cancel(r1.id)
 
@@ -183,53 +219,121 @@ class TestReminderManager:
         assert len(pending) == 1
         assert pending[0].id == r2.id
 
-    def test_list_all_reminders(self, manager: ReminderManager) -> None:
+    def test_list_all_reminders(
+        self, manager: ReminderManager, times: SimpleNamespace, uid: UuidFactory
+    ) -> None:
         """Test listing all reminders."""
         manager.create(
             message="r1",
-            remind_at=datetime.now(UTC) + timedelta(hours=1),
-            interaction_id=uuid.uuid4(),
+            remind_at=times.plus_hour,
+            interaction_id=uid(),
         )
         manager.create(
             message="r2",
-            remind_at=datetime.now(UTC) + timedelta(hours=2),
-            interaction_id=uuid.uuid4(),
+            remind_at=times.plus_two_hours,
+            interaction_id=uid(),
         )
 
         all_reminders = manager.list_all()
         assert len(all_reminders) == 2
 
-    def test_check_due_reminders(self, manager: ReminderManager) -> None:
+    def test_check_due_reminders(
+        self, manager: ReminderManager, times: SimpleNamespace, uid: UuidFactory
+    ) -> None:
         """Test checking for due reminders."""
         # Create a reminder that is already due
         reminder = manager.create(
             message="test",
-            remind_at=datetime.now(UTC) - timedelta(minutes=1),
-            interaction_id=uuid.uuid4(),
+            remind_at=times.minus_minute,
+            interaction_id=uid(),
         )
 
         due = manager.check_due()
         assert len(due) == 1
         assert due[0].id == reminder.id
 
-    def test_due_reminder_marked_triggered(self, manager: ReminderManager) -> None:
+    def test_check_due_skips_cancelled_and_future(
+        self, manager: ReminderManager, times: SimpleNamespace, uid: UuidFactory
+    ) -> None:
+        """Test only pending reminders whose time has passed are triggered."""
+        cancelled = manager.create(
+            message="cancelled",
+            remind_at=times.minus_two_minutes,
+            interaction_id=uid(),
+        )
+        due = manager.create(
+            message="due",
+            remind_at=times.minus_minute,
+            interaction_id=uid(),
+        )
+        manager.create(
+            message="future",
+            remind_at=times.plus_hour,
+            interaction_id=uid(),
+        )
+        manager.cancel(cancelled.id)
+
+        assert [r.id for r in manager.check_due()] == [due.id]
+        assert manager.check_due() == []
+        assert cancelled.status == ReminderStatus.CANCELLED
+
+    def test_concurrent_create_and_check_due(
+        self, times: SimpleNamespace, uid: UuidFactory, run_concurrently: ConcurrentRunner
+    ) -> None:
+        """Test reminders created while other threads poll each fire exactly once."""
+        manager = ReminderManager()
+        creators, per_creator = 4, 1000
+        created: list[Reminder] = []
+        triggered: list[Reminder] = []
+
+        def creator(n: int) -> Callable[[], None]:
+            def create() -> None:
+                interaction_id = uid()
+                for i in range(per_creator):
+                    # Spread due times so new reminders sort into the due prefix
+                    remind_at = times.minus_minute - timedelta(seconds=i * creators + n)
+                    if i % 2:
+                        created.append(manager.create(f"{n}-{i}", remind_at, interaction_id))
+                    else:
+                        item = {
+                            "message": f"{n}-{i}",
+                            "remind_at": remind_at,
+                            "interaction_id": interaction_id,
+                        }
+                        created.extend(manager.create_many([item]))
+
+            return create
+
+        run_concurrently(
+            [creator(n) for n in range(creators)], lambda: triggered.extend(manager.check_due()), 4
+        )
+        triggered.extend(manager.check_due())
+
+        assert len(created) == creators * per_creator
+        assert sorted(r.id for r in triggered) == sorted(r.id for r in created)
+
+    def test_due_reminder_marked_triggered(
+        self, manager: ReminderManager, times: SimpleNamespace, uid: UuidFactory
+    ) -> None:
         """Test that due reminders are marked as triggered."""
         reminder = manager.create(
             message="test",
-            remind_at=datetime.now(UTC) - timedelta(minutes=1),
-            interaction_id=uuid.uuid4(),
+            remind_at=times.minus_minute,
+            interaction_id=uid(),
         )
 
         manager.check_due()
         assert reminder.status == ReminderStatus.TRIGGERED
         assert reminder.triggered_at is not None
 
-    def test_dismiss_reminder(self, manager: ReminderManager) -> None:
+    def test_dismiss_reminder(
+        self, manager: ReminderManager, times: SimpleNamespace, uid: UuidFactory
+    ) -> None:
         """Test dismissing a triggered reminder."""
         reminder = manager.create(
             message="test",
-            remind_at=datetime.now(UTC) - timedelta(minutes=1),
-            interaction_id=uuid.uuid4(),
+            remind_at=times.minus_minute,
+            interaction_id=uid(),
         )
         manager.check_due()
 
@@ -237,12 +341,14 @@ class TestReminderManager:
         assert result is True
         assert reminder.status == ReminderStatus.DISMISSED
 
-    def test_recurring_reminder_creates_next(self, manager: ReminderManager) -> None:
+    def test_recurring_reminder_creates_next(
+        self, manager: ReminderManager, times: SimpleNamespace, uid: UuidFactory
+    ) -> None:
         """Test that triggering a recurring reminder creates the next one."""
         manager.create(
             message="daily task",
-            remind_at=datetime.now(UTC) - timedelta(minutes=1),
-            interaction_id=uuid.uuid4(),
+            remind_at=times.minus_minute,
+            interaction_id=uid(),
             recurrence=Recurrence.DAILY,
         )
 
@@ -256,7 +362,51 @@ class TestReminderManager:
         assert len(pending) == 1
         assert pending[0].message == "daily task"
         # Next reminder should be ~24 hours later
-        assert pending[0].remind_at > datetime.now(UTC)
+        assert pending[0].remind_at > times.now
+
+    def test_create_many_reminders(
+        self, manager: ReminderManager, times: SimpleNamespace, uid: UuidFactory
+    ) -> None:
+        """Test creating several reminders in one call."""
+        created = manager.create_many(
+            [
+                {"message": "later", "remind_at": times.plus_two_hours, "interaction_id": uid()},
+                {
+                    "message": "daily",
+                    "remind_at": times.plus_hour,
+                    "interaction_id": uid(),
+                    "recurrence": Recurrence.DAILY,
+                },
+            ]
+        )
+        assert [r.message for r in created] == ["later", "daily"]
+        assert created[1].recurrence == Recurrence.DAILY
+        assert [r.message for r in manager.list_pending()] == ["daily", "later"]
+
+    def test_clear_removes_all_reminders(
+        self, manager: ReminderManager, times: SimpleNamespace, uid: UuidFactory
+    ) -> None:
+        """Test clear() drops reminders of every status."""
+        r1 = manager.create(
+            message="r1",
+            remind_at=times.plus_hour,
+            interaction_id=uid(),
+        )
+        manager.create(
+            message="r2",
+            remind_at=times.plus_two_hours,
+            interaction_id=uid(),
+        )
+        manager.cancel(r1.id)
+
+        manager.clear()
+
+        assert manager.list_all() == []
+        assert manager.get(r1.id) is None
+
+
+# Fixed reference time for deterministic time parsing
+_FROZEN_NOW = datetime(2024, 1, 15, 12, 0, tzinfo=UTC)
 
 
 class TestParseReminderTime:
@@ -264,45 +414,46 @@ class TestParseReminderTime:
 
     def test_parse_relative_time(self) -> None:
         """Test parsing relative time expressions."""
-        now = datetime.now(UTC)
-
-        result = parse_reminder_time("in 1 hour")
-        assert result is not None
-        assert result > now
-        # Should be approximately 1 hour from now
-        diff = (result - now).total_seconds()
-        assert 3500 <= diff <= 3700
+        result = parse_reminder_time("in 1 hour", now=_FROZEN_NOW)
+        assert result == datetime(2024, 1, 15, 13, 0, tzinfo=UTC)
 
     def test_parse_relative_minutes(self) -> None:
         """Test parsing relative minutes."""
-        now = datetime.now(UTC)
+        result = parse_reminder_time("in 30 minutes", now=_FROZEN_NOW)
+        assert result == datetime(2024, 1, 15, 12, 30, tzinfo=UTC)
 
-        result = parse_reminder_time("in 30 minutes")
-        assert result is not None
-        diff = (result - now).total_seconds()
-        assert 1700 <= diff <= 1900
+    def test_parse_hyphenated_word_number(self) -> None:
+        """Test hyphenated word numbers are converted as a whole."""
+        result = parse_reminder_time("in forty-five minutes", now=_FROZEN_NOW)
+        assert result == datetime(2024, 1, 15, 12, 45, tzinfo=UTC)
 
     def test_parse_at_time(self) -> None:
         """Test parsing specific time."""
-        result = parse_reminder_time("at 3:30 PM")
-        assert result is not None
-        assert result.hour == 15
-        assert result.minute == 30
+        result = parse_reminder_time("at 3:30 PM", now=_FROZEN_NOW)
+        assert result == datetime(2024, 1, 15, 15, 30, tzinfo=UTC)
 
     def test_parse_at_time_24h(self) -> None:
         """Test parsing 24-hour time."""
-        result = parse_reminder_time("at 14:00")
-        assert result is not None
-        assert result.hour == 14
-        assert result.minute == 0
+        result = parse_reminder_time("at 14:00", now=_FROZEN_NOW)
+        assert result == datetime(2024, 1, 15, 14, 0, tzinfo=UTC)
+
+    def test_parse_past_time_rolls_to_tomorrow(self) -> None:
+        """Test a time already passed today is scheduled for tomorrow."""
+        result = parse_reminder_time("at 8.20am", now=_FROZEN_NOW)
+        assert result == datetime(2024, 1, 16, 8, 20, tzinfo=UTC)
 
     def test_parse_tomorrow(self) -> None:
         """Test parsing 'tomorrow' expressions."""
-        now = datetime.now(UTC)
-        result = parse_reminder_time("tomorrow at 9 AM")
+        result = parse_reminder_time("tomorrow at 9 AM", now=_FROZEN_NOW)
+        assert result == datetime(2024, 1, 16, 9, 0, tzinfo=UTC)
+
+    def test_parse_defaults_to_current_time(self) -> None:
+        """Test relative times resolve against the clock when now is omitted."""
+        before = datetime.now(UTC)
+        result = parse_reminder_time("in 1 hour")
+        after = datetime.now(UTC)
         assert result is not None
-        assert result.day != now.day or result.month != now.month
-        assert result.hour == 9
+        assert before + timedelta(hours=1) <= result <= after + timedelta(hours=1)
 
     def test_parse_invalid(self) -> None:
         """Test parsing invalid input returns None."""
@@ -2,26 +2,27 @@
 
 from ara.router.orchestrator import _get_ordinal
 
+# Expected spoken ordinals for positions 1-10
+_ORDINAL_PAIRS = (
+    (1, "first"),
+    (2, "second"),
+    (3, "third"),
+    (4, "fourth"),
+    (5, "fifth"),
+    (6, "sixth"),
+    (7, "seventh"),
+    (8, "eighth"),
+    (9, "ninth"),
+    (10, "tenth"),
+)
+
 
 class TestGetOrdinal:
     """Tests for _get_ordinal function."""
 
     def test_ordinal_first_through_tenth(self) -> None:
         """Test ordinal words for 1 through 10."""
-        expected = {
-            1: "first",
-            2: "second",
-            3: "third",
-            4: "fourth",
-            5: "fifth",
-            6: "sixth",
-            7: "seventh",
-            8: "eighth",
-            9: "ninth",
-            10: "tenth",
-        }
-
-        for num, word in expected.items():
+        for num, word in _ORDINAL_PAIRS:
             assert _get_ordinal(num) == word, f"Expected {word} for {num}"
 
     def test_ordinal_11th_through_13th(self) -> None:
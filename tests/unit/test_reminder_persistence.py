@@ -1,13 +1,11 @@
 """Unit tests for reminder persistence (T010, T018, T037, T058)."""
 
 import json
-import tempfile
+import mmap
 import uuid
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
-import pytest
-
 from ara.commands.reminder import (
     Recurrence,
     ReminderManager,
@@ -15,15 +13,20 @@ from ara.commands.reminder import (
 )
 
 
+def _journal_path(snapshot_path: Path) -> Path:
+    """Return the journal file kept alongside a reminders snapshot."""
+    return snapshot_path.with_name(snapshot_path.name + ".log")
+
+
+def _read_journal(snapshot_path: Path) -> list[dict]:
+    """Read the journal records kept alongside a reminders snapshot."""
+    with open(_journal_path(snapshot_path)) as f:
+        return [json.loads(line) for line in f]
+
+
 class TestReminderCreationWithPersistence:
     """Tests for reminder creation with persistence (T010)."""
 
-    @pytest.fixture
-    def temp_path(self) -> Path:
-        """Create a temporary file path for persistence."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            return Path(f.name)
-
     def test_create_reminder_saves_to_file(self, temp_path: Path) -> None:
         """Test that creating a reminder saves it to the persistence file."""
         manager = ReminderManager(persistence_path=temp_path)
@@ -34,13 +37,9 @@ class TestReminderCreationWithPersistence:
             interaction_id=uuid.uuid4(),
         )
 
-        # Verify file was created and contains data
-        assert temp_path.exists()
-        with open(temp_path) as f:
-            data = json.load(f)
-        assert "reminders" in data
-        assert len(data["reminders"]) == 1
-        assert data["reminders"][0]["message"] == "test reminder"
+        # Verify the reminder is on disk by reading it back
+        saved = ReminderManager(persistence_path=temp_path).list_all()
+        assert [r.message for r in saved] == ["test reminder"]
 
     def test_load_reminder_on_init(self, temp_path: Path) -> None:
         """Test that reminders are loaded from file on initialization."""
@@ -84,6 +83,59 @@ class TestReminderCreationWithPersistence:
         assert loaded.status == original.status
         assert loaded.created_by_interaction == original.created_by_interaction
 
+    def test_load_skips_reminder_with_unknown_status(self, temp_path: Path) -> None:
+        """Test that entries with unknown enum values are skipped on load."""
+        now = datetime.now(UTC)
+        manager1 = ReminderManager(persistence_path=temp_path)
+        kept = manager1.create(
+            message="valid",
+            remind_at=now + timedelta(hours=1),
+            interaction_id=uuid.uuid4(),
+        )
+        manager1.create(
+            message="corrupted",
+            remind_at=now + timedelta(hours=2),
+            interaction_id=uuid.uuid4(),
+        )
+        records = _read_journal(temp_path)
+        records[1]["status"] = "snoozed"
+        _journal_path(temp_path).write_text("".join(json.dumps(r) + "\n" for r in records))
+
+        manager2 = ReminderManager(persistence_path=temp_path)
+
+        assert [r.id for r in manager2.list_all()] == [kept.id]
+
+    def test_load_skips_torn_journal_line(self, temp_path: Path) -> None:
+        """Test that a partially written last journal line is ignored."""
+        manager1 = ReminderManager(persistence_path=temp_path)
+        kept = manager1.create(
+            message="complete",
+            remind_at=datetime.now(UTC) + timedelta(hours=1),
+            interaction_id=uuid.uuid4(),
+        )
+        with open(_journal_path(temp_path), "a") as f:
+            f.write('{"id": "')
+
+        manager2 = ReminderManager(persistence_path=temp_path)
+
+        assert [r.id for r in manager2.list_all()] == [kept.id]
+
+    def test_journal_compacts_into_snapshot(self, temp_path: Path) -> None:
+        """Test that the journal is folded into the snapshot once it grows."""
+        manager = ReminderManager(persistence_path=temp_path)
+        reminder = manager.create(
+            message="toggle",
+            remind_at=datetime.now(UTC) + timedelta(hours=1),
+            interaction_id=uuid.uuid4(),
+        )
+        manager.cancel(reminder.id)
+        manager.cancel(reminder.id)
+
+        assert not _journal_path(temp_path).exists()
+        with open(temp_path) as f:
+            data = json.load(f)
+        assert [r["status"] for r in data["reminders"]] == ["cancelled"]
+
     def test_in_memory_only_without_persistence_path(self) -> None:
         """Test that reminders work in memory-only mode."""
         manager = ReminderManager()  # No persistence path
@@ -101,28 +153,38 @@ class TestReminderCreationWithPersistence:
 class TestMultipleReminderPersistence:
     """Tests for multiple reminder persistence (T018)."""
 
-    @pytest.fixture
-    def temp_path(self) -> Path:
-        """Create a temporary file path for persistence."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            return Path(f.name)
-
     def test_save_multiple_reminders(self, temp_path: Path) -> None:
         """Test saving multiple reminders to persistence."""
         manager = ReminderManager(persistence_path=temp_path)
 
         # Create 5 reminders
+        base = datetime.now(UTC)
         for i in range(5):
             manager.create(
                 message=f"reminder {i}",
-                remind_at=datetime.now(UTC) + timedelta(hours=i + 1),
+                remind_at=base + timedelta(hours=i + 1),
                 interaction_id=uuid.uuid4(),
             )
 
         # Verify all saved
-        with open(temp_path) as f:
-            data = json.load(f)
-        assert len(data["reminders"]) == 5
+        assert len(ReminderManager(persistence_path=temp_path).list_all()) == 5
+
+    def test_create_many_saves_all_reminders(self, temp_path: Path) -> None:
+        """Test that a batch of reminders is persisted together."""
+        manager = ReminderManager(persistence_path=temp_path)
+        base = datetime.now(UTC)
+
+        manager.create_many(
+            {
+                "message": f"reminder {i}",
+                "remind_at": base + timedelta(hours=i + 1),
+                "interaction_id": uuid.uuid4(),
+            }
+            for i in range(4)
+        )
+
+        manager2 = ReminderManager(persistence_path=temp_path)
+        assert [r.message for r in manager2.list_pending()] == [f"reminder {i}" for i in range(4)]
 
     def test_load_multiple_reminders(self, temp_path: Path) -> None:
         """Test loading multiple reminders from persistence."""
@@ -130,10 +192,11 @@ class TestMultipleReminderPersistence:
 
         # Create multiple reminders
         ids = []
+        base = datetime.now(UTC)
         for i in range(3):
             reminder = manager1.create(
                 message=f"reminder {i}",
-                remind_at=datetime.now(UTC) + timedelta(hours=i + 1),
+                remind_at=base + timedelta(hours=i + 1),
                 interaction_id=uuid.uuid4(),
             )
             ids.append(reminder.id)
@@ -147,15 +210,34 @@ class TestMultipleReminderPersistence:
 
         assert len(manager2.list_pending()) == 3
 
+    def test_load_snapshot_larger_than_page(self, temp_path: Path) -> None:
+        """Test loading a snapshot big enough to be memory-mapped."""
+        manager1 = ReminderManager(persistence_path=temp_path)
+        base = datetime.now(UTC)
+        manager1.create_many(
+            {
+                "message": f"reminder {i}",
+                "remind_at": base + timedelta(minutes=i + 1),
+                "interaction_id": uuid.uuid4(),
+            }
+            for i in range(100)
+        )
+        manager1._save()
+        assert temp_path.stat().st_size >= mmap.PAGESIZE
+
+        manager2 = ReminderManager(persistence_path=temp_path)
+        assert len(manager2.list_pending()) == 100
+
     def test_concurrent_reminders_preserve_order(self, temp_path: Path) -> None:
         """Test that reminder order is preserved through persistence."""
+        now = datetime.now(UTC)
         manager1 = ReminderManager(persistence_path=temp_path)
 
         # Create reminders with different times
         times = [
-            datetime.now(UTC) + timedelta(hours=3),
-            datetime.now(UTC) + timedelta(hours=1),
-            datetime.now(UTC) + timedelta(hours=2),
+            now + timedelta(hours=3),
+            now + timedelta(hours=1),
+            now + timedelta(hours=2),
         ]
 
         for i, t in enumerate(times):
@@ -172,17 +254,12 @@ class TestMultipleReminderPersistence:
         # Should be sorted by remind_at
         assert len(pending) == 3
         assert pending[0].remind_at <= pending[1].remind_at <= pending[2].remind_at
+        assert [r.message for r in pending] == ["reminder 1", "reminder 2", "reminder 0"]
 
 
 class TestCancelByDescriptionPersistence:
     """Tests for cancel by description with persistence (T037)."""
 
-    @pytest.fixture
-    def temp_path(self) -> Path:
-        """Create a temporary file path for persistence."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            return Path(f.name)
-
     def test_cancel_persists_status_change(self, temp_path: Path) -> None:
         """Test that cancelling a reminder persists the status change."""
         manager1 = ReminderManager(persistence_path=temp_path)
@@ -205,16 +282,17 @@ class TestCancelByDescriptionPersistence:
 
     def test_cancelled_reminder_not_in_pending(self, temp_path: Path) -> None:
         """Test that cancelled reminders are not in pending list after reload."""
+        now = datetime.now(UTC)
         manager1 = ReminderManager(persistence_path=temp_path)
 
         r1 = manager1.create(
             message="keep me",
-            remind_at=datetime.now(UTC) + timedelta(hours=1),
+            remind_at=now + timedelta(hours=1),
             interaction_id=uuid.uuid4(),
         )
         r2 = manager1.create(
             message="cancel me",
-            remind_at=datetime.now(UTC) + timedelta(hours=2),
+            remind_at=now + timedelta(hours=2),
             interaction_id=uuid.uuid4(),
         )
 
@@ -231,12 +309,6 @@ class TestCancelByDescriptionPersistence:
 class TestMissedReminderDetection:
     """Tests for missed reminder detection (T058)."""
 
-    @pytest.fixture
-    def temp_path(self) -> Path:
-        """Create a temporary file path for persistence."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            return Path(f.name)
-
     def test_check_missed_finds_past_reminders(self, temp_path: Path) -> None:
         """Test that check_missed finds reminders with past remind_at times."""
         manager = ReminderManager(persistence_path=temp_path)
@@ -288,22 +360,23 @@ class TestMissedReminderDetection:
 
     def test_check_missed_returns_sorted_by_time(self, temp_path: Path) -> None:
         """Test that missed reminders are returned sorted by remind_at."""
+        now = datetime.now(UTC)
         manager = ReminderManager(persistence_path=temp_path)
 
         # Create multiple past reminders
         manager.create(
             message="later missed",
-            remind_at=datetime.now(UTC) - timedelta(minutes=1),
+            remind_at=now - timedelta(minutes=1),
             interaction_id=uuid.uuid4(),
         )
         manager.create(
             message="earlier missed",
-            remind_at=datetime.now(UTC) - timedelta(minutes=10),
+            remind_at=now - timedelta(minutes=10),
             interaction_id=uuid.uuid4(),
         )
         manager.create(
             message="middle missed",
-            remind_at=datetime.now(UTC) - timedelta(minutes=5),
+            remind_at=now - timedelta(minutes=5),
             interaction_id=uuid.uuid4(),
         )
 
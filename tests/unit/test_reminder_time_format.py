@@ -1,10 +1,27 @@
 """Unit tests for time-aware response formatting (T009)."""
 
+import time
+from collections.abc import Callable, Iterator
 from datetime import UTC, datetime, timedelta
 
+import pytest
+
 from ara.commands.reminder import format_time_local
 
 
+@pytest.fixture
+def set_timezone(monkeypatch: pytest.MonkeyPatch) -> Iterator[Callable[[str], None]]:
+    """Switch the process time zone, restoring it after the test."""
+
+    def _set(name: str) -> None:
+        monkeypatch.setenv("TZ", name)
+        time.tzset()
+
+    yield _set
+    monkeypatch.undo()
+    time.tzset()
+
+
 class TestFormatTimeLocal:
     """Tests for format_time_local function."""
 
@@ -55,6 +72,12 @@ class TestFormatTimeLocal:
         result = format_time_local(noon)
         assert ":" in result
 
+    def test_format_time_local_ignores_seconds(self) -> None:
+        """Test that times within the same minute format identically."""
+        start = datetime(2024, 1, 15, 9, 30, 0, tzinfo=UTC)
+        end = datetime(2024, 1, 15, 9, 30, 59, 999999, tzinfo=UTC)
+        assert format_time_local(start) == format_time_local(end)
+
     def test_format_time_local_different_times(self) -> None:
         """Test that different times produce different outputs."""
         time1 = datetime(2024, 1, 15, 9, 0, 0, tzinfo=UTC)
@@ -98,3 +121,15 @@ class TestTimeAwareResponseFormat:
         # Both should have colon for time
         assert ":" in current
         assert ":" in future
+
+    def test_format_time_local_follows_timezone_change(
+        self, set_timezone: Callable[[str], None]
+    ) -> None:
+        """Test that a time zone change takes effect immediately."""
+        dt = datetime(2024, 1, 15, 14, 30, 0, tzinfo=UTC)
+
+        set_timezone("UTC")
+        assert format_time_local(dt) == "2:30 PM"
+
+        set_timezone("Asia/Tokyo")
+        assert format_time_local(dt) == "11:30 PM"
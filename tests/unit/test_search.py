@@ -4,15 +4,42 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from ara.llm.mock import MockLanguageModel
+from ara.llm.search import SearchResponse, SearchResult, SearchSummarizer, WebSearcher
+from ara.router.intent import IntentType
+from ara.search.tavily import MockTavilySearch, create_search_client
+from ara.search.tavily import SearchResult as TavilySearchResult
+
+
+@pytest.fixture
+def mock_ddgs(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the DDGS client class with a mock and mark ddgs as available."""
+    mock = MagicMock()
+    monkeypatch.setattr("ara.llm.search.DDGS", mock)
+    monkeypatch.setattr("ara.llm.search.DDGS_AVAILABLE", True)
+    return mock
+
+
+@pytest.fixture
+def ddgs_session(mock_ddgs: MagicMock) -> MagicMock:
+    """The mock DuckDuckGo session that WebSearcher gets from the mocked DDGS."""
+    return mock_ddgs.return_value.__enter__.return_value
+
+
+@pytest.fixture
+def mock_llm() -> MockLanguageModel:
+    """Create a mock language model without its simulated latency."""
+    llm = MockLanguageModel()
+    llm.set_latency(0)
+    return llm
+
 
 class TestTavilySearchResult:
     """Tests for Tavily SearchResult dataclass."""
 
     def test_successful_result(self):
         """Test creating a successful search result."""
-        from ara.search.tavily import SearchResult
-
-        result = SearchResult(
+        result = TavilySearchResult(
             query="test query",
             answer="This is the answer",
             results=[{"title": "Test", "url": "https://example.com", "content": "Content"}],
@@ -26,9 +53,7 @@ class TestTavilySearchResult:
 
     def test_failed_result(self):
         """Test creating a failed search result."""
-        from ara.search.tavily import SearchResult
-
-        result = SearchResult(
+        result = TavilySearchResult(
             query="test query",
             answer=None,
             results=[],
@@ -44,8 +69,6 @@ class TestMockTavilySearch:
 
     def test_mock_search_returns_results(self):
         """Test that mock search returns valid results."""
-        from ara.search.tavily import MockTavilySearch
-
         client = MockTavilySearch()
         result = client.search("test query")
 
@@ -57,8 +80,6 @@ class TestMockTavilySearch:
 
     def test_mock_quick_answer(self):
         """Test that mock quick answer returns a response."""
-        from ara.search.tavily import MockTavilySearch
-
         client = MockTavilySearch()
         answer = client.quick_answer("What is Python?")
 
@@ -67,8 +88,6 @@ class TestMockTavilySearch:
 
     def test_mock_search_includes_query_in_results(self):
         """Test that mock results reference the query."""
-        from ara.search.tavily import MockTavilySearch
-
         client = MockTavilySearch()
         result = client.search("Python programming")
 
@@ -81,15 +100,11 @@ class TestCreateSearchClient:
 
     def test_create_mock_client(self):
         """Test creating a mock client explicitly."""
-        from ara.search.tavily import MockTavilySearch, create_search_client
-
         client = create_search_client(use_mock=True)
         assert isinstance(client, MockTavilySearch)
 
     def test_create_client_without_api_key_returns_mock(self):
         """Test that missing API key falls back to mock."""
-        from ara.search.tavily import create_search_client
-
         # This should fall back to mock since no API key is set
         client = create_search_client(api_key=None, use_mock=False)
         # Should be either TavilySearch or MockTavilySearch depending on env
@@ -99,37 +114,30 @@ class TestCreateSearchClient:
 class TestWebSearchIntentPatterns:
     """Tests for web search intent classification patterns."""
 
-    @pytest.fixture
-    def classifier(self):
-        """Create intent classifier."""
-        from ara.router.intent import IntentClassifier
-
-        return IntentClassifier()
-
-    def test_news_query_classified_as_web_search(self, classifier):
-        """Test that news queries trigger web search."""
-        from ara.router.intent import IntentType
-
-        queries = [
+    @pytest.mark.parametrize(
+        "query",
+        [
             "What's the latest news?",
             "What's the top news today?",
             "What's in the news?",
-        ]
-        for query in queries:
-            intent = classifier.classify(query)
-            assert intent.type == IntentType.WEB_SEARCH, f"Failed for: {query}"
-
-    def test_weather_query_classified_as_web_search(self, classifier):
-        """Test that weather queries trigger web search."""
-        from ara.router.intent import IntentType
+        ],
+    )
+    def test_news_query_classified_as_web_search(self, classifier, query):
+        """Test that news queries trigger web search."""
+        intent = classifier.classify(query)
+        assert intent.type == IntentType.WEB_SEARCH
 
-        queries = [
+    @pytest.mark.parametrize(
+        "query",
+        [
             "What's the weather in Austin?",
             "How's the weather in New York?",
-        ]
-        for query in queries:
-            intent = classifier.classify(query)
-            assert intent.type == IntentType.WEB_SEARCH, f"Failed for: {query}"
+        ],
+    )
+    def test_weather_query_classified_as_web_search(self, classifier, query):
+        """Test that weather queries trigger web search."""
+        intent = classifier.classify(query)
+        assert intent.type == IntentType.WEB_SEARCH
 
     def test_local_news_extracts_location(self, classifier):
         """Test that local news queries extract the location."""
@@ -145,8 +153,6 @@ class TestSearchResult:
 
     def test_create_search_result(self) -> None:
         """Test creating a SearchResult."""
-        from ara.llm.search import SearchResult
-
         result = SearchResult(
             title="Test Title",
             url="https://example.com",
@@ -159,8 +165,6 @@ class TestSearchResult:
 
     def test_search_result_to_dict(self) -> None:
         """Test SearchResult serialization."""
-        from ara.llm.search import SearchResult
-
         result = SearchResult(
             title="Test",
             url="https://example.com",
@@ -178,8 +182,6 @@ class TestSearchResponse:
 
     def test_create_search_response(self) -> None:
         """Test creating a SearchResponse."""
-        from ara.llm.search import SearchResponse, SearchResult
-
         results = [
             SearchResult("Title 1", "https://example1.com", "Snippet 1"),
             SearchResult("Title 2", "https://example2.com", "Snippet 2"),
@@ -197,8 +199,6 @@ class TestSearchResponse:
 
     def test_search_response_empty_results(self) -> None:
         """Test SearchResponse with no results."""
-        from ara.llm.search import SearchResponse
-
         response = SearchResponse(
             query="obscure query",
             results=[],
@@ -214,27 +214,17 @@ class TestWebSearcher:
 
     def test_create_web_searcher(self) -> None:
         """Test creating a WebSearcher instance."""
-        from ara.llm.search import WebSearcher
-
         searcher = WebSearcher()
         assert searcher is not None
 
     def test_create_with_custom_max_results(self) -> None:
         """Test creating searcher with custom max results."""
-        from ara.llm.search import WebSearcher
-
         searcher = WebSearcher(max_results=5)
         assert searcher.max_results == 5
 
-    @patch("ara.llm.search.DDGS")
-    @patch("ara.llm.search.DDGS_AVAILABLE", True)
-    def test_search_returns_results(self, mock_ddgs: MagicMock) -> None:
+    def test_search_returns_results(self, ddgs_session: MagicMock) -> None:
         """Test search returns search results."""
-        from ara.llm.search import WebSearcher
-
-        # Mock DuckDuckGo response using context manager
-        mock_instance = MagicMock()
-        mock_instance.text.return_value = [
+        ddgs_session.text.return_value = [
             {
                 "title": "Raspberry Pi 5",
                 "href": "https://raspberrypi.org/pi5",
@@ -246,8 +236,6 @@ class TestWebSearcher:
                 "body": "Our review of the Pi 5",
             },
         ]
-        mock_ddgs.return_value.__enter__.return_value = mock_instance
-        mock_ddgs.return_value.__exit__.return_value = None
 
         searcher = WebSearcher(max_results=3)
         results = searcher.search("Raspberry Pi 5")
@@ -256,40 +244,58 @@ class TestWebSearcher:
         assert results[0].title == "Raspberry Pi 5"
         assert results[0].url == "https://raspberrypi.org/pi5"
 
-    @patch("ara.llm.search.DDGS")
-    def test_search_handles_empty_results(self, mock_ddgs: MagicMock) -> None:
+    def test_search_handles_empty_results(self, ddgs_session: MagicMock) -> None:
         """Test search handles empty results gracefully."""
-        from ara.llm.search import WebSearcher
-
-        mock_instance = MagicMock()
-        mock_instance.text.return_value = []
-        mock_ddgs.return_value.__enter__ = MagicMock(return_value=mock_instance)
-        mock_ddgs.return_value.__exit__ = MagicMock()
+        ddgs_session.text.return_value = []
 
         searcher = WebSearcher()
         results = searcher.search("xyznonexistent12345")
 
         assert len(results) == 0
 
-    @patch("ara.llm.search.DDGS")
-    def test_search_handles_error(self, mock_ddgs: MagicMock) -> None:
+    def test_search_handles_error(self, ddgs_session: MagicMock) -> None:
         """Test search handles errors gracefully."""
-        from ara.llm.search import WebSearcher
-
-        mock_instance = MagicMock()
-        mock_instance.text.side_effect = Exception("Network error")
-        mock_ddgs.return_value.__enter__ = MagicMock(return_value=mock_instance)
-        mock_ddgs.return_value.__exit__ = MagicMock(return_value=None)  # Don't suppress exception
+        ddgs_session.text.side_effect = Exception("Network error")
 
         searcher = WebSearcher()
         results = searcher.search("test query")
 
         assert results == []
 
+    def test_search_reuses_session(self, mock_ddgs: MagicMock, ddgs_session: MagicMock) -> None:
+        """Test consecutive searches share one DuckDuckGo session until closed."""
+        ddgs_session.text.return_value = []
+
+        searcher = WebSearcher()
+        searcher.search("first query")
+        searcher.search("second query")
+        assert mock_ddgs.call_count == 1
+
+        searcher.close()
+        mock_ddgs.return_value.__exit__.assert_called_once()
+
+        searcher.search("third query")
+        assert mock_ddgs.call_count == 2
+
+    def test_search_caches_repeated_query(self, ddgs_session: MagicMock) -> None:
+        """Test a repeated query is served from cache until the entry expires."""
+        ddgs_session.text.return_value = [
+            {"title": "Pi 5", "href": "https://example.com", "body": "Pi 5 specs"},
+        ]
+
+        searcher = WebSearcher()
+        with patch("ara.llm.search.time.monotonic", return_value=1000.0):
+            first = searcher.search("Raspberry Pi 5")
+            second = searcher.search("Raspberry Pi 5")
+        assert second == first
+        assert ddgs_session.text.call_count == 1
+
+        with patch("ara.llm.search.time.monotonic", return_value=2000.0):
+            searcher.search("Raspberry Pi 5")
+        assert ddgs_session.text.call_count == 2
+
     def test_format_results_for_llm(self) -> None:
         """Test formatting search results for LLM context."""
-        from ara.llm.search import SearchResult, WebSearcher
-
         results = [
             SearchResult("Title 1", "https://example1.com", "First snippet"),
             SearchResult("Title 2", "https://example2.com", "Second snippet"),
@@ -302,30 +308,25 @@ class TestWebSearcher:
         assert "First snippet" in formatted
         assert "Title 2" in formatted
         assert "Second snippet" in formatted
+        assert formatted.startswith(
+            "Web search results:\n\n1. Title 1\n   URL: https://example1.com\n   First snippet"
+        )
 
 
 class TestSearchSummarizer:
     """Tests for SearchSummarizer class."""
 
-    def test_create_summarizer(self) -> None:
+    def test_create_summarizer(self, mock_llm: MockLanguageModel) -> None:
         """Test creating a SearchSummarizer."""
-        from ara.llm.mock import MockLanguageModel
-        from ara.llm.search import SearchSummarizer
-
-        llm = MockLanguageModel()
-        summarizer = SearchSummarizer(llm=llm)
+        summarizer = SearchSummarizer(llm=mock_llm)
 
         assert summarizer is not None
 
-    def test_summarize_results(self) -> None:
+    def test_summarize_results(self, mock_llm: MockLanguageModel) -> None:
         """Test summarizing search results."""
-        from ara.llm.mock import MockLanguageModel
-        from ara.llm.search import SearchResult, SearchSummarizer
-
-        llm = MockLanguageModel()
-        llm.set_response("The Raspberry Pi 5 is a powerful single-board computer.")
+        mock_llm.set_response("The Raspberry Pi 5 is a powerful single-board computer.")
 
-        summarizer = SearchSummarizer(llm=llm)
+        summarizer = SearchSummarizer(llm=mock_llm)
         results = [
             SearchResult("Pi 5", "https://example.com", "Pi 5 specs"),
         ]
@@ -335,13 +336,9 @@ class TestSearchSummarizer:
         assert "Raspberry Pi 5" in summary
         assert "single-board computer" in summary
 
-    def test_summarize_empty_results(self) -> None:
+    def test_summarize_empty_results(self, mock_llm: MockLanguageModel) -> None:
         """Test summarizing when no results."""
-        from ara.llm.mock import MockLanguageModel
-        from ara.llm.search import SearchSummarizer
-
-        llm = MockLanguageModel()
-        summarizer = SearchSummarizer(llm=llm)
+        summarizer = SearchSummarizer(llm=mock_llm)
 
         summary = summarizer.summarize("obscure query", [])
 
@@ -351,40 +348,24 @@ class TestSearchSummarizer:
 class TestSearchIntentDetection:
     """Tests for detecting search intent in queries."""
 
-    def test_detect_search_intent(self) -> None:
+    def test_detect_search_intent(self, classifier) -> None:
         """Test detecting explicit search requests."""
-        from ara.router.intent import IntentClassifier, IntentType
-
-        classifier = IntentClassifier()
-
         # Explicit search requests
         intent = classifier.classify("search for Raspberry Pi 5")
         assert intent.type == IntentType.WEB_SEARCH
         assert "Raspberry Pi 5" in intent.entities.get("query", "")
 
-    def test_detect_with_internet_trigger(self) -> None:
+    def test_detect_with_internet_trigger(self, classifier) -> None:
         """Test detecting 'with internet' trigger."""
-        from ara.router.intent import IntentClassifier, IntentType
-
-        classifier = IntentClassifier()
-
         intent = classifier.classify("with internet, what is the weather today")
         assert intent.type == IntentType.WEB_SEARCH
 
-    def test_detect_look_up(self) -> None:
+    def test_detect_look_up(self, classifier) -> None:
         """Test detecting 'look up' trigger."""
-        from ara.router.intent import IntentClassifier, IntentType
-
-        classifier = IntentClassifier()
-
         intent = classifier.classify("look up the latest news about AI")
         assert intent.type == IntentType.WEB_SEARCH
 
-    def test_regular_question_not_search(self) -> None:
+    def test_regular_question_not_search(self, classifier) -> None:
         """Test regular questions are not classified as search."""
-        from ara.router.intent import IntentClassifier, IntentType
-
-        classifier = IntentClassifier()
-
         intent = classifier.classify("what time is it")
         assert intent.type != IntentType.WEB_SEARCH
@@ -1,49 +1,44 @@
 """Unit tests for storage layer."""
 
 import json
+import mmap
 import uuid
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
 
 import pytest
 
-from ara.logger.interaction import Interaction, OperationMode, ResponseSource
+from ara.logger.interaction import Interaction
 from ara.logger.storage import (
     InteractionStorage,
     JSONLWriter,
     SQLiteStorage,
 )
+from tests.unit.conftest import InteractionFactory, UuidFactory
+
+
+@pytest.fixture
+def now() -> datetime:
+    """A single timestamp for a test's interactions."""
+    return datetime.now(UTC)
+
+
+@pytest.fixture
+def sample_interaction(make_interaction: InteractionFactory) -> Interaction:
+    """Create a sample interaction."""
+    return make_interaction()
 
 
 class TestSQLiteStorage:
     """Tests for SQLite storage backend."""
 
     @pytest.fixture
-    def storage(self, tmp_path) -> SQLiteStorage:
+    def storage(self, tmp_path) -> Iterator[SQLiteStorage]:
         """Create a SQLite storage instance."""
         db_path = tmp_path / "test.db"
-        return SQLiteStorage(db_path)
-
-    @pytest.fixture
-    def sample_interaction(self) -> Interaction:
-        """Create a sample interaction."""
-        return Interaction(
-            id=uuid.uuid4(),
-            session_id=uuid.uuid4(),
-            timestamp=datetime.now(UTC),
-            device_id="test-device",
-            wake_word_confidence=0.95,
-            audio_duration_ms=2500,
-            transcript="what time is it",
-            transcript_confidence=0.9,
-            intent="general_question",
-            intent_confidence=0.85,
-            entities={},
-            response="It's 3:30 PM",
-            response_source=ResponseSource.LOCAL_LLM,
-            latency_ms={"stt": 450, "llm": 800, "total": 1250},
-            mode=OperationMode.OFFLINE,
-            error=None,
-        )
+        storage = SQLiteStorage(db_path)
+        yield storage
+        storage.close()
 
     def test_save_interaction(
         self, storage: SQLiteStorage, sample_interaction: Interaction
@@ -61,30 +56,21 @@ class TestSQLiteStorage:
         result = storage.get(uuid.uuid4())
         assert result is None
 
-    def test_get_by_session(self, storage: SQLiteStorage, sample_interaction: Interaction) -> None:
+    def test_get_by_session(
+        self,
+        storage: SQLiteStorage,
+        sample_interaction: Interaction,
+        make_interaction: InteractionFactory,
+    ) -> None:
         """Test getting interactions by session."""
         # Save multiple interactions in same session
         session_id = sample_interaction.session_id
 
         storage.save(sample_interaction)
 
-        interaction2 = Interaction(
-            id=uuid.uuid4(),
+        interaction2 = make_interaction(
             session_id=session_id,
-            timestamp=datetime.now(UTC),
-            device_id="test-device",
-            wake_word_confidence=0.95,
-            audio_duration_ms=2000,
             transcript="another question",
-            transcript_confidence=0.9,
-            intent="general_question",
-            intent_confidence=0.85,
-            entities={},
-            response="Another answer",
-            response_source=ResponseSource.LOCAL_LLM,
-            latency_ms={"total": 1000},
-            mode=OperationMode.OFFLINE,
-            error=None,
         )
         storage.save(interaction2)
 
@@ -103,6 +89,21 @@ class TestSQLiteStorage:
         results = storage.get_by_date_range(start, end)
         assert len(results) >= 1
 
+    def test_get_by_date_range_for_device(
+        self, storage: SQLiteStorage, now: datetime, make_interaction: InteractionFactory
+    ) -> None:
+        """Test narrowing a date range to one device."""
+        storage.save_many(
+            make_interaction(timestamp=now, device_id=device_id)
+            for device_id in ["test-device", "other-device", "test-device"]
+        )
+
+        results = storage.get_by_date_range(
+            now - timedelta(hours=1), now + timedelta(hours=1), device_id="test-device"
+        )
+        assert len(results) == 2
+        assert all(r.device_id == "test-device" for r in results)
+
     def test_get_by_device(self, storage: SQLiteStorage, sample_interaction: Interaction) -> None:
         """Test getting interactions by device."""
         storage.save(sample_interaction)
@@ -111,33 +112,28 @@ class TestSQLiteStorage:
         assert len(results) >= 1
         assert all(r.device_id == "test-device" for r in results)
 
-    def test_get_recent(self, storage: SQLiteStorage) -> None:
+    def test_get_recent(
+        self,
+        storage: SQLiteStorage,
+        now: datetime,
+        make_interaction: InteractionFactory,
+        uid: UuidFactory,
+    ) -> None:
         """Test getting recent interactions."""
-        session_id = uuid.uuid4()
+        session_id = uid()
 
-        for i in range(10):
-            interaction = Interaction(
-                id=uuid.uuid4(),
+        storage.save_many(
+            make_interaction(
                 session_id=session_id,
-                timestamp=datetime.now(UTC),
-                device_id="test-device",
-                wake_word_confidence=0.95,
-                audio_duration_ms=2000,
+                timestamp=now + timedelta(milliseconds=i),
                 transcript=f"question {i}",
-                transcript_confidence=0.9,
-                intent="general_question",
-                intent_confidence=0.85,
-                entities={},
-                response=f"answer {i}",
-                response_source=ResponseSource.LOCAL_LLM,
-                latency_ms={"total": 1000},
-                mode=OperationMode.OFFLINE,
-                error=None,
             )
-            storage.save(interaction)
+            for i in range(10)
+        )
 
         recent = storage.get_recent(limit=5)
         assert len(recent) == 5
+        assert [r.transcript for r in recent] == [f"question {i}" for i in range(9, 4, -1)]
 
     def test_count_by_date(self, storage: SQLiteStorage, sample_interaction: Interaction) -> None:
         """Test counting interactions by date."""
@@ -147,9 +143,15 @@ class TestSQLiteStorage:
         count = storage.count_by_date(today)
         assert count >= 1
 
-    def test_get_intent_counts(self, storage: SQLiteStorage) -> None:
+    def test_get_intent_counts(
+        self,
+        storage: SQLiteStorage,
+        now: datetime,
+        make_interaction: InteractionFactory,
+        uid: UuidFactory,
+    ) -> None:
         """Test getting intent counts."""
-        session_id = uuid.uuid4()
+        session_id = uid()
 
         intents = [
             "general_question",
@@ -158,137 +160,204 @@ class TestSQLiteStorage:
             "timer_set",
             "general_question",
         ]
-        for i, intent in enumerate(intents):
-            interaction = Interaction(
-                id=uuid.uuid4(),
+        storage.save_many(
+            make_interaction(
                 session_id=session_id,
-                timestamp=datetime.now(UTC),
-                device_id="test-device",
-                wake_word_confidence=0.95,
-                audio_duration_ms=2000,
+                timestamp=now + timedelta(milliseconds=i),
                 transcript=f"q{i}",
-                transcript_confidence=0.9,
                 intent=intent,
-                intent_confidence=0.85,
-                entities={},
-                response=f"a{i}",
-                response_source=ResponseSource.LOCAL_LLM,
-                latency_ms={"total": 1000},
-                mode=OperationMode.OFFLINE,
-                error=None,
             )
-            storage.save(interaction)
+            for i, intent in enumerate(intents)
+        )
 
-        today = datetime.now(UTC).date()
+        today = now.date()
         counts = storage.get_intent_counts(today)
 
         assert counts.get("general_question", 0) >= 3
         assert counts.get("timer_set", 0) >= 2
 
-    def test_get_average_latency(self, storage: SQLiteStorage) -> None:
+    def test_get_average_latency(
+        self,
+        storage: SQLiteStorage,
+        now: datetime,
+        make_interaction: InteractionFactory,
+        uid: UuidFactory,
+    ) -> None:
         """Test getting average latency."""
-        session_id = uuid.uuid4()
+        session_id = uid()
 
-        for latency in [1000, 1200, 1400, 1600, 1800]:
-            interaction = Interaction(
-                id=uuid.uuid4(),
+        storage.save_many(
+            make_interaction(
                 session_id=session_id,
-                timestamp=datetime.now(UTC),
-                device_id="test-device",
-                wake_word_confidence=0.95,
-                audio_duration_ms=2000,
+                timestamp=now,
                 transcript="q",
-                transcript_confidence=0.9,
-                intent="general_question",
-                intent_confidence=0.85,
-                entities={},
-                response="a",
-                response_source=ResponseSource.LOCAL_LLM,
                 latency_ms={"total": latency},
-                mode=OperationMode.OFFLINE,
-                error=None,
             )
-            storage.save(interaction)
+            for latency in [1000, 1200, 1400, 1600, 1800]
+        )
 
-        today = datetime.now(UTC).date()
+        today = now.date()
         avg = storage.get_average_latency(today)
 
         # Average of 1000, 1200, 1400, 1600, 1800 = 1400
         assert 1300 <= avg <= 1500
 
+    def test_average_latency_ignores_missing_total(
+        self,
+        storage: SQLiteStorage,
+        now: datetime,
+        make_interaction: InteractionFactory,
+        uid: UuidFactory,
+    ) -> None:
+        """Test that interactions without a total latency are left out of the average."""
+        session_id = uid()
+
+        storage.save_many(
+            make_interaction(
+                session_id=session_id,
+                timestamp=now,
+                transcript="q",
+                latency_ms=latency,
+            )
+            for latency in [{"total": 1000}, {"stt": 300}, {"total": 2000}]
+        )
+
+        today = now.date()
+        assert storage.get_average_latency(today) == 1500.0
+
+    def test_average_latency_without_interactions(self, storage: SQLiteStorage) -> None:
+        """Test that a day with no interactions averages to zero."""
+        assert storage.get_average_latency(datetime.now(UTC).date()) == 0.0
+
+    def test_get_latency_percentile(
+        self, storage: SQLiteStorage, now: datetime, make_interaction: InteractionFactory
+    ) -> None:
+        """Test picking a latency percentile for one device."""
+        storage.save_many(
+            make_interaction(timestamp=now, latency_ms={"total": 1000 + i * 100}) for i in range(10)
+        )
+        storage.save(make_interaction(timestamp=now, latency_ms={"stt": 300}))
+        storage.save(
+            make_interaction(timestamp=now, device_id="other-device", latency_ms={"total": 9000})
+        )
+
+        today = now.date()
+        assert storage.get_latency_percentile(today, 0.5, device_id="test-device") == 1500
+        assert storage.get_latency_percentile(today, 0.95, device_id="test-device") == 1900
+        assert storage.get_latency_percentile(today, 0.95) == 9000
+
+    def test_get_latency_percentiles_by_device(
+        self, storage: SQLiteStorage, now: datetime, make_interaction: InteractionFactory
+    ) -> None:
+        """Test picking a latency percentile for every device at once."""
+        storage.save_many(
+            make_interaction(timestamp=now, latency_ms={"total": 1000 + i * 100}) for i in range(10)
+        )
+        storage.save_many(
+            make_interaction(timestamp=now, device_id="other-device", latency_ms=latency)
+            for latency in [{"total": 9000}, {"stt": 300}]
+        )
+        storage.save(make_interaction(timestamp=now, device_id="quiet-device", latency_ms={}))
+
+        percentiles = storage.get_latency_percentiles_by_device(now.date(), 0.95)
+
+        assert percentiles == {
+            "test-device": storage.get_latency_percentile(now.date(), 0.95, "test-device"),
+            "other-device": 9000,
+        }
+        assert percentiles["test-device"] == 1900
+
+    def test_latency_percentile_without_interactions(self, storage: SQLiteStorage) -> None:
+        """Test that a day with no interactions has a zero percentile."""
+        assert storage.get_latency_percentile(datetime.now(UTC).date(), 0.95) == 0
+
+    def test_migrates_database_without_latency_total_column(
+        self, tmp_path, now: datetime, make_interaction: InteractionFactory
+    ) -> None:
+        """Test that older databases gain and backfill the latency total column."""
+        db_path = tmp_path / "old.db"
+        old = SQLiteStorage(db_path)
+        old.save_many(
+            make_interaction(timestamp=now, latency_ms={"total": latency})
+            for latency in [1000, 2000]
+        )
+        old._conn.execute("ALTER TABLE interactions DROP COLUMN latency_total_ms")
+        old.close()
+
+        storage = SQLiteStorage(db_path)
+        try:
+            assert storage.get_average_latency(now.date()) == 1500.0
+        finally:
+            storage.close()
+
+    def test_migration_drops_superseded_indexes(self, tmp_path) -> None:
+        """Test that older single-column interaction indexes are removed."""
+        db_path = tmp_path / "old.db"
+        old = SQLiteStorage(db_path)
+        old._conn.execute("CREATE INDEX idx_interactions_device ON interactions(device_id)")
+        old._conn.execute("CREATE INDEX idx_interactions_timestamp ON interactions(timestamp)")
+        old.close()
+
+        storage = SQLiteStorage(db_path)
+        try:
+            indexes = {
+                row["name"] for row in storage._conn.execute("PRAGMA index_list(interactions)")
+            }
+        finally:
+            storage.close()
+        assert "idx_interactions_device" not in indexes
+        assert "idx_interactions_timestamp" not in indexes
+        assert {
+            "idx_interactions_device_timestamp",
+            "idx_interactions_timestamp_intent",
+        } <= indexes
+
     def test_database_uses_wal_mode(self, storage: SQLiteStorage) -> None:
         """Test that database uses WAL mode."""
         # WAL mode should be enabled for better concurrent access
         assert storage.is_wal_mode_enabled()
 
+    def test_database_uses_normal_synchronous(self, storage: SQLiteStorage) -> None:
+        """Test that commits do not fsync under WAL (synchronous=NORMAL)."""
+        assert storage.synchronous_mode() == "NORMAL"
+
 
 class TestJSONLWriter:
     """Tests for JSONL file writer."""
 
     @pytest.fixture
-    def writer(self, tmp_path) -> JSONLWriter:
+    def writer(self, tmp_path) -> Iterator[JSONLWriter]:
         """Create a JSONL writer instance."""
-        return JSONLWriter(tmp_path / "logs")
-
-    @pytest.fixture
-    def sample_interaction(self) -> Interaction:
-        """Create a sample interaction."""
-        return Interaction(
-            id=uuid.uuid4(),
-            session_id=uuid.uuid4(),
-            timestamp=datetime.now(UTC),
-            device_id="test-device",
-            wake_word_confidence=0.95,
-            audio_duration_ms=2500,
-            transcript="what time is it",
-            transcript_confidence=0.9,
-            intent="general_question",
-            intent_confidence=0.85,
-            entities={},
-            response="It's 3:30 PM",
-            response_source=ResponseSource.LOCAL_LLM,
-            latency_ms={"stt": 450, "llm": 800, "total": 1250},
-            mode=OperationMode.OFFLINE,
-            error=None,
-        )
+        writer = JSONLWriter(tmp_path / "logs")
+        yield writer
+        writer.close()
 
     def test_write_interaction(self, writer: JSONLWriter, sample_interaction: Interaction) -> None:
         """Test writing an interaction to JSONL."""
         writer.write(sample_interaction)
 
         # Check file was created
-        today = datetime.now(UTC).strftime("%Y-%m-%d")
+        today = datetime.now(UTC).date().isoformat()
         log_file = writer.log_dir / f"{today}.jsonl"
         assert log_file.exists()
 
     def test_append_to_existing_file(
-        self, writer: JSONLWriter, sample_interaction: Interaction
+        self,
+        writer: JSONLWriter,
+        sample_interaction: Interaction,
+        make_interaction: InteractionFactory,
     ) -> None:
         """Test appending to existing JSONL file."""
         writer.write(sample_interaction)
 
-        interaction2 = Interaction(
-            id=uuid.uuid4(),
+        interaction2 = make_interaction(
             session_id=sample_interaction.session_id,
-            timestamp=datetime.now(UTC),
-            device_id="test-device",
-            wake_word_confidence=0.95,
-            audio_duration_ms=2000,
             transcript="another question",
-            transcript_confidence=0.9,
-            intent="general_question",
-            intent_confidence=0.85,
-            entities={},
-            response="Another answer",
-            response_source=ResponseSource.LOCAL_LLM,
-            latency_ms={"total": 1000},
-            mode=OperationMode.OFFLINE,
-            error=None,
         )
         writer.write(interaction2)
 
         # Check both lines exist
-        today = datetime.now(UTC).strftime("%Y-%m-%d")
+        today = datetime.now(UTC).date().isoformat()
         log_file = writer.log_dir / f"{today}.jsonl"
 
         with open(log_file) as f:
@@ -296,6 +365,20 @@ class TestJSONLWriter:
 
         assert len(lines) == 2
 
+    def test_switches_file_when_date_changes(
+        self,
+        writer: JSONLWriter,
+        sample_interaction: Interaction,
+        make_interaction: InteractionFactory,
+    ) -> None:
+        """Test that interactions from another day go to that day's file."""
+        writer.write(sample_interaction)
+        earlier = make_interaction(timestamp=sample_interaction.timestamp - timedelta(days=1))
+        writer.write(earlier)
+
+        assert len(writer.read(sample_interaction.timestamp.date())) == 1
+        assert writer.read(earlier.timestamp.date())[0].id == earlier.id
+
     def test_read_interactions(self, writer: JSONLWriter, sample_interaction: Interaction) -> None:
         """Test reading interactions from JSONL."""
         writer.write(sample_interaction)
@@ -306,6 +389,40 @@ class TestJSONLWriter:
         assert len(interactions) == 1
         assert interactions[0].transcript == sample_interaction.transcript
 
+    def test_read_log_larger_than_page(
+        self, writer: JSONLWriter, now: datetime, make_interaction: InteractionFactory
+    ) -> None:
+        """Test reading a daily log big enough to be memory-mapped."""
+        for i in range(20):
+            writer.write(make_interaction(timestamp=now, transcript=f"question {i}"))
+
+        today = now.date()
+        assert (writer.log_dir / f"{today}.jsonl").stat().st_size >= mmap.PAGESIZE
+
+        interactions = writer.read(today)
+        assert [i.transcript for i in interactions] == [f"question {i}" for i in range(20)]
+
+    @pytest.mark.parametrize("count", [1, 20])
+    def test_read_skips_blank_lines(
+        self,
+        writer: JSONLWriter,
+        now: datetime,
+        make_interaction: InteractionFactory,
+        count: int,
+    ) -> None:
+        """Test whitespace-only lines are skipped for small and memory-mapped logs."""
+        for i in range(count):
+            writer.write(make_interaction(timestamp=now, transcript=f"question {i}"))
+        writer.close()
+
+        today = now.date()
+        log_file = writer.log_dir / f"{today}.jsonl"
+        lines = log_file.read_bytes().splitlines(keepends=True)
+        log_file.write_bytes(b"  \t\n" + b"\n".join(lines) + b"\n \n")
+
+        interactions = writer.read(today)
+        assert [i.transcript for i in interactions] == [f"question {i}" for i in range(count)]
+
     def test_read_nonexistent_date(self, writer: JSONLWriter) -> None:
         """Test reading from nonexistent date."""
         from datetime import date
@@ -317,7 +434,7 @@ class TestJSONLWriter:
         """Test that written JSON is valid."""
         writer.write(sample_interaction)
 
-        today = datetime.now(UTC).strftime("%Y-%m-%d")
+        today = datetime.now(UTC).date().isoformat()
         log_file = writer.log_dir / f"{today}.jsonl"
 
         with open(log_file) as f:
@@ -332,34 +449,14 @@ class TestInteractionStorage:
     """Tests for combined storage interface."""
 
     @pytest.fixture
-    def storage(self, tmp_path) -> InteractionStorage:
+    def storage(self, tmp_path) -> Iterator[InteractionStorage]:
         """Create an InteractionStorage instance."""
-        return InteractionStorage(
+        storage = InteractionStorage(
             db_path=tmp_path / "test.db",
             log_dir=tmp_path / "logs",
         )
-
-    @pytest.fixture
-    def sample_interaction(self) -> Interaction:
-        """Create a sample interaction."""
-        return Interaction(
-            id=uuid.uuid4(),
-            session_id=uuid.uuid4(),
-            timestamp=datetime.now(UTC),
-            device_id="test-device",
-            wake_word_confidence=0.95,
-            audio_duration_ms=2500,
-            transcript="what time is it",
-            transcript_confidence=0.9,
-            intent="general_question",
-            intent_confidence=0.85,
-            entities={},
-            response="It's 3:30 PM",
-            response_source=ResponseSource.LOCAL_LLM,
-            latency_ms={"stt": 450, "llm": 800, "total": 1250},
-            mode=OperationMode.OFFLINE,
-            error=None,
-        )
+        yield storage
+        storage.close()
 
     def test_save_to_both_backends(
         self, storage: InteractionStorage, sample_interaction: Interaction
@@ -376,6 +473,15 @@ class TestInteractionStorage:
         jsonl_data = storage.jsonl.read(today)
         assert len(jsonl_data) >= 1
 
+    def test_save_many_to_both_backends(
+        self, storage: InteractionStorage, now: datetime, make_interaction: InteractionFactory
+    ) -> None:
+        """Test save_many writes every interaction to both SQLite and JSONL."""
+        storage.save_many(make_interaction(timestamp=now) for _ in range(3))
+
+        assert storage.sqlite.count_by_date(now.date()) == 3
+        assert len(storage.jsonl.read(now.date())) == 3
+
     def test_query_from_sqlite(
         self, storage: InteractionStorage, sample_interaction: Interaction
     ) -> None:
@@ -17,6 +17,22 @@ from ara.storage.models import (
 )
 
 
+def _make_dto(i: int) -> InteractionDTO:
+    """Build a distinct InteractionDTO for batch tests."""
+    return InteractionDTO(
+        session_id="session-123",
+        timestamp=datetime(2024, 1, 15, 10, 30, i, tzinfo=UTC),
+        device_id="device-1",
+        transcript=f"question {i}",
+        transcript_confidence=0.95,
+        intent_type="general_question",
+        intent_confidence=0.9,
+        response_text=f"answer {i}",
+        response_source="local",
+        latency_ms={"total": 150},
+    )
+
+
 class TestInteractionDTO:
     """Tests for InteractionDTO serialization."""
 
@@ -86,6 +102,83 @@ class TestInteractionDTO:
         assert dto.events_extracted == ["event-1"]
 
 
+class TestInteractionRepository:
+    """Tests for InteractionRepository writes."""
+
+    def test_save_many_batches(self) -> None:
+        """Test save_many inserts all interactions with a single call."""
+        from ara.storage.client import InteractionRepository
+
+        collection = MagicMock()
+        repository = InteractionRepository(collection)
+
+        ids = repository.save_many(_make_dto(i) for i in range(3))
+
+        collection.insert_one.assert_not_called()
+        collection.insert_many.assert_called_once()
+        docs = collection.insert_many.call_args.args[0]
+        assert ids == [str(doc["_id"]) for doc in docs]
+        assert [doc["input"]["transcript"] for doc in docs] == [f"question {i}" for i in range(3)]
+        assert all("created_at" in doc for doc in docs)
+
+    def test_save_many_retries_generator_batch(self) -> None:
+        """Test a retried save_many resends the whole batch from a generator."""
+        from pymongo.errors import ConnectionFailure
+
+        from ara.storage.client import InteractionRepository
+
+        collection = MagicMock()
+        collection.insert_many.side_effect = [ConnectionFailure("dropped"), None]
+        repository = InteractionRepository(collection)
+
+        with patch("ara.storage.client.time.sleep"):
+            ids = repository.save_many(_make_dto(i) for i in range(3))
+
+        assert len(ids) == 3
+        first, second = (call.args[0] for call in collection.insert_many.call_args_list)
+        assert second == first
+        assert [str(doc["_id"]) for doc in second] == ids
+
+    def test_save_many_ignores_duplicates_from_partial_attempt(self) -> None:
+        """Test documents already written by a failed attempt are not an error."""
+        from pymongo.errors import BulkWriteError
+
+        from ara.storage.client import InteractionRepository
+
+        collection = MagicMock()
+        collection.insert_many.side_effect = BulkWriteError(
+            {"writeErrors": [{"index": 0, "code": 11000}], "writeConcernErrors": []}
+        )
+        repository = InteractionRepository(collection)
+
+        assert len(repository.save_many([_make_dto(0), _make_dto(1)])) == 2
+
+    def test_save_many_raises_other_write_errors(self) -> None:
+        """Test write errors other than duplicate keys are surfaced."""
+        from pymongo.errors import BulkWriteError
+
+        from ara.storage.client import InteractionRepository
+
+        collection = MagicMock()
+        collection.insert_many.side_effect = BulkWriteError(
+            {"writeErrors": [{"index": 0, "code": 121}], "writeConcernErrors": []}
+        )
+        repository = InteractionRepository(collection)
+
+        with pytest.raises(BulkWriteError):
+            repository.save_many([_make_dto(0)])
+
+    def test_save_many_empty(self) -> None:
+        """Test save_many with nothing to save skips the database."""
+        from ara.storage.client import InteractionRepository
+
+        collection = MagicMock()
+        repository = InteractionRepository(collection)
+
+        assert repository.save_many([]) == []
+        collection.insert_many.assert_not_called()
+
+
 class TestEventDTO:
     """Tests for EventDTO serialization."""
 
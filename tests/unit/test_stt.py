@@ -3,6 +3,9 @@
 from ara.stt import TranscriptionResult, create_transcriber
 from ara.stt.mock import MockTranscriber
 
+# Shared zeroed PCM buffer for tests that only need some audio
+_SILENCE = bytes(1000)
+
 
 class TestTranscriptionResult:
     """Tests for TranscriptionResult dataclass."""
@@ -47,7 +50,7 @@ class TestMockTranscriber:
         transcriber = MockTranscriber()
         transcriber.set_response("hello world")
 
-        result = transcriber.transcribe(bytes(1000), sample_rate=16000)
+        result = transcriber.transcribe(_SILENCE, sample_rate=16000)
 
         assert result.text == "hello world"
         assert result.confidence > 0
@@ -56,7 +59,7 @@ class TestMockTranscriber:
         """Test default transcription response."""
         transcriber = MockTranscriber()
 
-        result = transcriber.transcribe(bytes(1000), sample_rate=16000)
+        result = transcriber.transcribe(_SILENCE, sample_rate=16000)
 
         assert result.text == ""
         assert result.confidence == 0.0
@@ -71,8 +74,8 @@ class TestMockTranscriber:
         """Test that transcribe records call history."""
         transcriber = MockTranscriber()
 
-        transcriber.transcribe(bytes(100), sample_rate=16000)
-        transcriber.transcribe(bytes(200), sample_rate=16000)
+        transcriber.transcribe(memoryview(_SILENCE)[:100], sample_rate=16000)
+        transcriber.transcribe(memoryview(_SILENCE)[:200], sample_rate=16000)
 
         assert transcriber.call_count == 2
 
@@ -1,11 +1,11 @@
 """Unit tests for daily summary generation."""
 
 import uuid
-from datetime import UTC, date, datetime
+from collections.abc import Iterator
+from datetime import UTC, date, datetime, timedelta
 
 import pytest
 
-from ara.logger.interaction import Interaction, OperationMode, ResponseSource
 from ara.logger.storage import InteractionStorage
 from ara.logger.summary import (
     ActionItem,
@@ -13,6 +13,7 @@ from ara.logger.summary import (
     SummaryGenerator,
     extract_action_items,
 )
+from tests.unit.conftest import InteractionFactory, UuidFactory
 
 
 class TestDailySummary:
@@ -134,12 +135,20 @@ class TestActionItem:
 class TestExtractActionItems:
     """Tests for action item extraction."""
 
-    def test_extract_from_reminder(self) -> None:
+    def test_extract_from_reminder(self, make_interaction: InteractionFactory) -> None:
         """Test extracting action items from reminder intents."""
         interactions = [
-            _make_interaction("remind me to call mom", "reminder_set"),
-            _make_interaction("what time is it", "general_question"),
-            _make_interaction("remind me to buy milk", "reminder_set"),
+            make_interaction(
+                transcript="remind me to call mom",
+                intent="reminder_set",
+                entities={"message": "call mom"},
+            ),
+            make_interaction(transcript="what time is it", intent="general_question"),
+            make_interaction(
+                transcript="remind me to buy milk",
+                intent="reminder_set",
+                entities={"message": "buy milk"},
+            ),
         ]
 
         items = extract_action_items(interactions)
@@ -148,10 +157,27 @@ class TestExtractActionItems:
         assert any("call mom" in item.text for item in items)
         assert any("buy milk" in item.text for item in items)
 
-    def test_extract_from_timer(self) -> None:
+    def test_extract_from_transcript_without_message(
+        self, make_interaction: InteractionFactory
+    ) -> None:
+        """Test falling back to the transcript when no message entity exists."""
+        interactions = [
+            make_interaction(transcript=phrase, intent="reminder_set")
+            for phrase in [
+                "Remind me to call mom at noon",
+                "don't forget to buy milk",
+                "set a reminder to water the plants at 5pm",
+            ]
+        ]
+
+        items = extract_action_items(interactions)
+
+        assert [item.text for item in items] == ["call mom", "buy milk", "water the plants"]
+
+    def test_extract_from_timer(self, make_interaction: InteractionFactory) -> None:
         """Test extracting action items from timer intents."""
         interactions = [
-            _make_interaction("set a timer for pasta", "timer_set"),
+            make_interaction(transcript="set a timer for pasta", intent="timer_set"),
         ]
 
         items = extract_action_items(interactions)
@@ -163,11 +189,11 @@ class TestExtractActionItems:
         items = extract_action_items([])
         assert items == []
 
-    def test_extract_no_actionable(self) -> None:
+    def test_extract_no_actionable(self, make_interaction: InteractionFactory) -> None:
         """Test extracting when no actionable intents."""
         interactions = [
-            _make_interaction("what time is it", "general_question"),
-            _make_interaction("what is the weather", "general_question"),
+            make_interaction(transcript="what time is it", intent="general_question"),
+            make_interaction(transcript="what is the weather", intent="general_question"),
         ]
 
         items = extract_action_items(interactions)
@@ -178,7 +204,9 @@ class TestSummaryGenerator:
     """Tests for SummaryGenerator."""
 
     @pytest.fixture
-    def storage(self, tmp_path) -> InteractionStorage:
+    def storage(
+        self, tmp_path, make_interaction: InteractionFactory, uid: UuidFactory
+    ) -> Iterator[InteractionStorage]:
         """Create storage with sample interactions."""
         storage = InteractionStorage(
             db_path=tmp_path / "test.db",
@@ -186,29 +214,23 @@ class TestSummaryGenerator:
         )
 
         # Add sample interactions
-        session_id = uuid.uuid4()
-        for i in range(10):
-            interaction = Interaction(
-                id=uuid.uuid4(),
+        session_id = uid()
+        now = datetime.now(UTC)
+        storage.save_many(
+            make_interaction(
                 session_id=session_id,
-                timestamp=datetime.now(UTC),
-                device_id="test-device",
-                wake_word_confidence=0.95,
-                audio_duration_ms=2000,
+                timestamp=now + timedelta(milliseconds=i),
                 transcript=f"question {i}",
-                transcript_confidence=0.9,
                 intent="general_question" if i % 2 == 0 else "timer_set",
-                intent_confidence=0.85,
-                entities={},
                 response=f"answer {i}",
-                response_source=ResponseSource.LOCAL_LLM,
                 latency_ms={"total": 1000 + i * 100},
-                mode=OperationMode.OFFLINE,
                 error=None if i != 5 else "Test error",
             )
-            storage.save(interaction)
+            for i in range(10)
+        )
 
-        return storage
+        yield storage
+        storage.close()
 
     @pytest.fixture
     def generator(self, storage: InteractionStorage) -> SummaryGenerator:
@@ -237,8 +259,8 @@ class TestSummaryGenerator:
         today = datetime.now(UTC).date()  # Use UTC date to match stored timestamps
         summary = generator.generate(today, device_id="test-device")
 
-        # With 10 interactions at 1000-1900ms, P95 should be high
-        assert summary.p95_latency_ms > 0
+        # With 10 interactions at 1000-1900ms, P95 is the slowest one
+        assert summary.p95_latency_ms == 1900
 
     def test_top_intents(self, generator: SummaryGenerator) -> None:
         """Test top intents calculation."""
@@ -249,6 +271,8 @@ class TestSummaryGenerator:
         # Should have both general_question and timer_set
         intent_names = [i["intent"] for i in summary.top_intents]
         assert "general_question" in intent_names or "timer_set" in intent_names
+        counts = {i["intent"]: i["count"] for i in summary.top_intents}
+        assert counts == {"general_question": 5, "timer_set": 5}
 
     def test_mode_breakdown(self, generator: SummaryGenerator) -> None:
         """Test mode breakdown calculation."""
@@ -258,6 +282,37 @@ class TestSummaryGenerator:
         assert "offline" in summary.mode_breakdown
         assert summary.mode_breakdown["offline"] == 10
 
+    def test_generate_all_matches_per_device(
+        self,
+        storage: InteractionStorage,
+        generator: SummaryGenerator,
+        make_interaction: InteractionFactory,
+    ) -> None:
+        """Test generate_all summarizes each device like generate does."""
+        now = datetime.now(UTC)
+        storage.save(
+            make_interaction(
+                timestamp=now,
+                device_id="other-device",
+                transcript="remind me to call mom",
+                intent="reminder_set",
+                entities={"message": "call mom"},
+            )
+        )
+        today = now.date()
+
+        summaries = generator.generate_all(today)
+
+        assert [s.device_id for s in summaries] == ["other-device", "test-device"]
+        for summary in summaries:
+            expected = generator.generate(today, device_id=summary.device_id)
+            assert summary.total_interactions == expected.total_interactions
+            assert summary.error_count == expected.error_count
+            assert summary.avg_latency_ms == expected.avg_latency_ms
+            assert summary.p95_latency_ms == expected.p95_latency_ms
+            assert summary.top_intents == expected.top_intents
+            assert summary.action_items == expected.action_items
+
     def test_save_summary(self, generator: SummaryGenerator, tmp_path) -> None:
         """Test saving summary to file."""
         today = datetime.now(UTC).date()  # Use UTC date to match stored timestamps
@@ -269,25 +324,3 @@ class TestSummaryGenerator:
         assert output_path.exists()
         content = output_path.read_text()
         assert "Daily Summary" in content
-
-
-def _make_interaction(transcript: str, intent: str) -> Interaction:
-    """Helper to create test interactions."""
-    return Interaction(
-        id=uuid.uuid4(),
-        session_id=uuid.uuid4(),
-        timestamp=datetime.now(UTC),
-        device_id="test-device",
-        wake_word_confidence=0.95,
-        audio_duration_ms=2000,
-        transcript=transcript,
-        transcript_confidence=0.9,
-        intent=intent,
-        intent_confidence=0.85,
-        entities={"message": transcript} if intent == "reminder_set" else {},
-        response="OK",
-        response_source=ResponseSource.LOCAL_LLM,
-        latency_ms={"total": 1000},
-        mode=OperationMode.OFFLINE,
-        error=None,
-    )
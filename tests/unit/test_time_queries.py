@@ -8,16 +8,21 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from ara.storage.models import ActivityDTO, ActivityStatus, EventDTO, EventType
+from ara.storage.queries import TimeQueryHandler
+
+
+@pytest.fixture(scope="module")
+def handler() -> TimeQueryHandler:
+    """Create a handler for tests that never reach storage."""
+    return TimeQueryHandler(MagicMock())
+
 
 class TestFormatDuration:
     """Tests for duration formatting."""
 
-    def test_format_seconds_only(self) -> None:
+    def test_format_seconds_only(self, handler: TimeQueryHandler) -> None:
         """Test formatting durations under 1 minute."""
-        from ara.storage.queries import TimeQueryHandler
-
-        handler = TimeQueryHandler(MagicMock())
-
         # 30 seconds
         result = handler.format_duration(30000)
         assert result == "about 30 seconds"
@@ -26,12 +31,8 @@ class TestFormatDuration:
         result = handler.format_duration(45000)
         assert result == "about 45 seconds"
 
-    def test_format_minutes_only(self) -> None:
+    def test_format_minutes_only(self, handler: TimeQueryHandler) -> None:
         """Test formatting durations of minutes."""
-        from ara.storage.queries import TimeQueryHandler
-
-        handler = TimeQueryHandler(MagicMock())
-
         # 5 minutes
         result = handler.format_duration(5 * 60 * 1000)
         assert result == "about 5 minutes"
@@ -40,12 +41,8 @@ class TestFormatDuration:
         result = handler.format_duration(60 * 1000)
         assert result == "about 1 minute"
 
-    def test_format_hours_and_minutes(self) -> None:
+    def test_format_hours_and_minutes(self, handler: TimeQueryHandler) -> None:
         """Test formatting durations with hours and minutes."""
-        from ara.storage.queries import TimeQueryHandler
-
-        handler = TimeQueryHandler(MagicMock())
-
         # 2 hours and 15 minutes
         result = handler.format_duration((2 * 60 + 15) * 60 * 1000)
         assert result == "about 2 hours and 15 minutes"
@@ -54,22 +51,14 @@ class TestFormatDuration:
         result = handler.format_duration(60 * 60 * 1000)
         assert result == "about 1 hour"
 
-    def test_format_exact_hours(self) -> None:
+    def test_format_exact_hours(self, handler: TimeQueryHandler) -> None:
         """Test formatting exact hour durations."""
-        from ara.storage.queries import TimeQueryHandler
-
-        handler = TimeQueryHandler(MagicMock())
-
         # Exactly 3 hours
         result = handler.format_duration(3 * 60 * 60 * 1000)
         assert result == "about 3 hours"
 
-    def test_format_over_24_hours(self) -> None:
+    def test_format_over_24_hours(self, handler: TimeQueryHandler) -> None:
         """Test formatting durations over 24 hours."""
-        from ara.storage.queries import TimeQueryHandler
-
-        handler = TimeQueryHandler(MagicMock())
-
         # 26 hours
         result = handler.format_duration(26 * 60 * 60 * 1000)
         assert result == "about 1 day and 2 hours"
@@ -78,12 +67,8 @@ class TestFormatDuration:
         result = handler.format_duration(48 * 60 * 60 * 1000)
         assert result == "about 2 days"
 
-    def test_format_zero_duration(self) -> None:
+    def test_format_zero_duration(self, handler: TimeQueryHandler) -> None:
         """Test formatting zero duration."""
-        from ara.storage.queries import TimeQueryHandler
-
-        handler = TimeQueryHandler(MagicMock())
-
         result = handler.format_duration(0)
         assert result == "less than a second"
 
@@ -91,12 +76,8 @@ class TestFormatDuration:
 class TestDurationCalculation:
     """Tests for duration calculation between events."""
 
-    def test_calculate_duration_from_timestamps(self) -> None:
+    def test_calculate_duration_from_timestamps(self, handler: TimeQueryHandler) -> None:
         """Test calculating duration from two timestamps."""
-        from ara.storage.queries import TimeQueryHandler
-
-        handler = TimeQueryHandler(MagicMock())
-
         start = datetime(2024, 1, 15, 10, 0, 0, tzinfo=UTC)
         end = datetime(2024, 1, 15, 10, 45, 0, tzinfo=UTC)
 
@@ -104,27 +85,28 @@ class TestDurationCalculation:
 
         assert duration_ms == 45 * 60 * 1000  # 45 minutes in ms
 
-    def test_calculate_duration_negative_raises(self) -> None:
+    def test_calculate_duration_negative_raises(self, handler: TimeQueryHandler) -> None:
         """Test that negative duration raises error."""
-        from ara.storage.queries import TimeQueryHandler
-
-        handler = TimeQueryHandler(MagicMock())
-
         start = datetime(2024, 1, 15, 11, 0, 0, tzinfo=UTC)
         end = datetime(2024, 1, 15, 10, 0, 0, tzinfo=UTC)
 
         with pytest.raises(ValueError, match="cannot be negative"):
             handler.calculate_duration(start, end)
 
+    def test_calculate_duration_truncates_sub_millisecond(self, handler: TimeQueryHandler) -> None:
+        """Test that spans under a millisecond truncate to zero in either direction."""
+        start = datetime(2024, 1, 15, 10, 0, 0, 400, tzinfo=UTC)
+        end = datetime(2024, 1, 15, 10, 0, 0, tzinfo=UTC)
+
+        assert handler.calculate_duration(start, end) == 0
+        assert handler.calculate_duration(end, start) == 0
+
 
 class TestQueryDuration:
     """Tests for querying duration of activities."""
 
     def test_query_duration_finds_matching_activity(self) -> None:
         """Test querying duration for a known activity."""
-        from ara.storage.models import ActivityDTO, ActivityStatus
-        from ara.storage.queries import TimeQueryHandler
-
         # Mock activity repository
         mock_activity_repo = MagicMock()
         mock_activity_repo.get_by_name.return_value = [
@@ -152,8 +134,6 @@ class TestQueryDuration:
 
     def test_query_duration_no_matching_activity(self) -> None:
         """Test querying duration when no activity found."""
-        from ara.storage.queries import TimeQueryHandler
-
         mock_activity_repo = MagicMock()
         mock_activity_repo.get_by_name.return_value = []
 
@@ -168,9 +148,6 @@ class TestQueryDuration:
 
     def test_query_duration_activity_in_progress(self) -> None:
         """Test querying duration for an in-progress activity."""
-        from ara.storage.models import ActivityDTO, ActivityStatus
-        from ara.storage.queries import TimeQueryHandler
-
         mock_activity_repo = MagicMock()
         mock_activity_repo.get_by_name.return_value = [
             ActivityDTO(
@@ -194,9 +171,6 @@ class TestQueryDuration:
 
     def test_query_duration_multiple_activities_uses_most_recent(self) -> None:
         """Test that most recent activity is used when multiple match."""
-        from ara.storage.models import ActivityDTO, ActivityStatus
-        from ara.storage.queries import TimeQueryHandler
-
         mock_activity_repo = MagicMock()
         # Repository returns most recent first (sorted by start_time DESC)
         mock_activity_repo.get_by_name.return_value = [
@@ -235,9 +209,6 @@ class TestQueryAroundTime:
 
     def test_query_around_time_returns_events(self) -> None:
         """Test querying events around a time point."""
-        from ara.storage.models import EventDTO, EventType
-        from ara.storage.queries import TimeQueryHandler
-
         mock_event_repo = MagicMock()
         mock_event_repo.get_around_time.return_value = [
             EventDTO(
@@ -272,8 +243,6 @@ class TestQueryAroundTime:
 
     def test_query_around_time_no_events(self) -> None:
         """Test querying around a time with no events."""
-        from ara.storage.queries import TimeQueryHandler
-
         mock_event_repo = MagicMock()
         mock_event_repo.get_around_time.return_value = []
 
@@ -293,9 +262,6 @@ class TestQueryRange:
 
     def test_query_range_returns_events(self) -> None:
         """Test querying events in a time range."""
-        from ara.storage.models import EventDTO, EventType
-        from ara.storage.queries import TimeQueryHandler
-
         mock_event_repo = MagicMock()
         mock_event_repo.get_in_range.return_value = [
             EventDTO(
@@ -320,13 +286,8 @@ class TestQueryRange:
         assert result.success is True
         assert len(result.events_found) == 1
 
-    def test_query_range_invalid_range_raises(self) -> None:
+    def test_query_range_invalid_range_raises(self, handler: TimeQueryHandler) -> None:
         """Test that invalid range raises error."""
-        from ara.storage.queries import TimeQueryHandler
-
-        mock_storage = MagicMock()
-        handler = TimeQueryHandler(mock_storage)
-
         start = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
         end = datetime(2024, 1, 15, 9, 0, 0, tzinfo=UTC)
 
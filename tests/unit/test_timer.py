@@ -11,6 +11,7 @@ from ara.commands.timer import (
     TimerStatus,
     parse_duration,
 )
+from tests.unit.conftest import ConcurrentRunner
 
 
 class TestTimerEntity:
@@ -194,6 +195,52 @@ class TestTimerManager:
         assert timer.status == TimerStatus.COMPLETED
         assert timer.alert_played is True
 
+    def test_check_expired_skips_cancelled_timer(self, manager: TimerManager) -> None:
+        """Test that a cancelled timer is not reported once its expiry passes."""
+        timer = manager.create(duration_seconds=0, interaction_id=uuid.uuid4())
+        manager.cancel(timer.id)
+
+        assert manager.check_expired() == []
+        assert timer.status == TimerStatus.CANCELLED
+
+    def test_check_expired_after_resume(self, manager: TimerManager) -> None:
+        """Test that a resumed timer expires at its rescheduled time."""
+        timer = manager.create(duration_seconds=0, interaction_id=uuid.uuid4())
+        manager.pause(timer.id)
+        assert manager.check_expired() == []
+
+        manager.resume(timer.id)
+        expired = manager.check_expired()
+        assert [t.id for t in expired] == [timer.id]
+
+    def test_check_expired_returns_due_timers_in_order(self, manager: TimerManager) -> None:
+        """Test that expired timers come back in expiry order and future ones stay."""
+        later = manager.create(duration_seconds=3600, interaction_id=uuid.uuid4())
+        due = [manager.create(duration_seconds=0, interaction_id=uuid.uuid4()) for _ in range(3)]
+
+        assert [t.id for t in manager.check_expired()] == [t.id for t in due]
+        assert manager.check_expired() == []
+        assert later.status == TimerStatus.RUNNING
+
+    def test_concurrent_create_and_check_expired(
+        self, manager: TimerManager, run_concurrently: ConcurrentRunner
+    ) -> None:
+        """Test timers created while other threads poll each expire exactly once."""
+        creators, per_creator = 4, 1000
+        created: list[Timer] = []
+        expired: list[Timer] = []
+
+        def create() -> None:
+            interaction_id = uuid.uuid4()
+            for _ in range(per_creator):
+                created.append(manager.create(duration_seconds=0, interaction_id=interaction_id))
+
+        run_concurrently([create] * creators, lambda: expired.extend(manager.check_expired()), 4)
+        expired.extend(manager.check_expired())
+
+        assert len(created) == creators * per_creator
+        assert sorted(t.id for t in expired) == sorted(t.id for t in created)
+
     def test_pause_timer(self, manager: TimerManager) -> None:
         """Test pausing a timer."""
         timer = manager.create(
@@ -254,3 +301,14 @@ class TestParseDuration:
         """Test parsing is case insensitive."""
         assert parse_duration("5 MINUTES") == 300
         assert parse_duration("1 Hour") == 3600
+
+    def test_parse_duration_is_cached(self) -> None:
+        """Test repeated phrases are served from the cache."""
+        parse_duration.cache_clear()
+
+        assert parse_duration("7 minutes") == 420
+        assert parse_duration("7 minutes") == 420
+
+        info = parse_duration.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
@@ -4,12 +4,25 @@ Tests user profile load, save, and name handling.
 """
 
 import json
-import tempfile
 from pathlib import Path
 
+import pytest
+
 from ara.config.user_profile import UserProfile, load_user_profile, save_user_profile
 
 
+@pytest.fixture(scope="module")
+def profile_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Shared directory for every profile file written by this module."""
+    return tmp_path_factory.mktemp("profiles")
+
+
+@pytest.fixture
+def profile_path(profile_dir: Path, request: pytest.FixtureRequest) -> Path:
+    """Profile path unique to the requesting test."""
+    return profile_dir / f"{request.node.name}.json"
+
+
 class TestUserProfileDataclass:
     """Tests for UserProfile dataclass."""
 
@@ -34,112 +47,95 @@ class TestUserProfileDataclass:
 class TestLoadUserProfile:
     """Tests for load_user_profile function (T018)."""
 
-    def test_load_returns_defaults_when_file_missing(self):
+    def test_load_returns_defaults_when_file_missing(self, profile_path: Path):
         """Test that missing file returns default profile."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            nonexistent = Path(tmpdir) / "nonexistent.json"
-            profile = load_user_profile(nonexistent)
-            assert profile.name is None
-            assert profile.version == 1
+        profile = load_user_profile(profile_path)
+        assert profile.name is None
+        assert profile.version == 1
 
-    def test_load_parses_valid_json(self):
+    def test_load_parses_valid_json(self, profile_path: Path):
         """Test loading valid profile JSON."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            profile_path = Path(tmpdir) / "profile.json"
-            data = {
-                "version": 1,
-                "name": "Ammar",
-                "preferences": {"countdown_enabled": True},
-            }
-            with open(profile_path, "w") as f:
-                json.dump(data, f)
-
-            profile = load_user_profile(profile_path)
-            assert profile.name == "Ammar"
-            assert profile.preferences == {"countdown_enabled": True}
-
-    def test_load_handles_invalid_json(self):
+        data = {
+            "version": 1,
+            "name": "Ammar",
+            "preferences": {"countdown_enabled": True},
+        }
+        with open(profile_path, "w") as f:
+            json.dump(data, f)
+
+        profile = load_user_profile(profile_path)
+        assert profile.name == "Ammar"
+        assert profile.preferences == {"countdown_enabled": True}
+
+    def test_load_handles_invalid_json(self, profile_path: Path):
         """Test graceful handling of invalid JSON."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            profile_path = Path(tmpdir) / "profile.json"
-            with open(profile_path, "w") as f:
-                f.write("not valid json {")
+        with open(profile_path, "w") as f:
+            f.write("not valid json {")
 
-            profile = load_user_profile(profile_path)
-            # Should return default profile on error
-            assert profile.name is None
-            assert profile.version == 1
+        profile = load_user_profile(profile_path)
+        # Should return default profile on error
+        assert profile.name is None
+        assert profile.version == 1
 
-    def test_load_trims_whitespace_from_name(self):
+    def test_load_trims_whitespace_from_name(self, profile_path: Path):
         """Test that name whitespace is trimmed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            profile_path = Path(tmpdir) / "profile.json"
-            data = {"version": 1, "name": "  Ammar  ", "preferences": {}}
-            with open(profile_path, "w") as f:
-                json.dump(data, f)
+        data = {"version": 1, "name": "  Ammar  ", "preferences": {}}
+        with open(profile_path, "w") as f:
+            json.dump(data, f)
 
-            profile = load_user_profile(profile_path)
-            assert profile.name == "Ammar"
+        profile = load_user_profile(profile_path)
+        assert profile.name == "Ammar"
 
-    def test_load_treats_empty_name_as_none(self):
+    def test_load_treats_empty_name_as_none(self, profile_path: Path):
         """Test that empty or whitespace-only name becomes None."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            profile_path = Path(tmpdir) / "profile.json"
-            data = {"version": 1, "name": "   ", "preferences": {}}
-            with open(profile_path, "w") as f:
-                json.dump(data, f)
+        data = {"version": 1, "name": "   ", "preferences": {}}
+        with open(profile_path, "w") as f:
+            json.dump(data, f)
 
-            profile = load_user_profile(profile_path)
-            assert profile.name is None
+        profile = load_user_profile(profile_path)
+        assert profile.name is None
 
 
 class TestSaveUserProfile:
     """Tests for save_user_profile function (T018)."""
 
-    def test_save_creates_file(self):
+    def test_save_creates_file(self, profile_path: Path):
         """Test that save creates the profile file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            profile_path = Path(tmpdir) / "profile.json"
-            profile = UserProfile(name="Test")
+        profile = UserProfile(name="Test")
 
-            result = save_user_profile(profile, profile_path)
-            assert result is True
-            assert profile_path.exists()
+        result = save_user_profile(profile, profile_path)
+        assert result is True
+        assert profile_path.exists()
 
-    def test_save_writes_correct_data(self):
+    def test_save_writes_correct_data(self, profile_path: Path):
         """Test that saved data is correct."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            profile_path = Path(tmpdir) / "profile.json"
-            profile = UserProfile(name="Ammar", preferences={"test": True})
+        profile = UserProfile(name="Ammar", preferences={"test": True})
 
-            save_user_profile(profile, profile_path)
+        save_user_profile(profile, profile_path)
 
-            with open(profile_path) as f:
-                data = json.load(f)
+        with open(profile_path) as f:
+            data = json.load(f)
 
-            assert data["name"] == "Ammar"
-            assert data["version"] == 1
-            assert data["preferences"] == {"test": True}
+        assert data["name"] == "Ammar"
+        assert data["version"] == 1
+        assert data["preferences"] == {"test": True}
 
-    def test_save_creates_parent_directories(self):
+    def test_save_creates_parent_directories(self, profile_path: Path):
         """Test that save creates parent directories if needed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            profile_path = Path(tmpdir) / "subdir" / "profile.json"
-            profile = UserProfile(name="Test")
+        profile_path = profile_path.parent / profile_path.stem / "profile.json"
+        profile = UserProfile(name="Test")
 
-            result = save_user_profile(profile, profile_path)
-            assert result is True
-            assert profile_path.exists()
+        result = save_user_profile(profile, profile_path)
+        assert result is True
+        assert profile_path.exists()
 
-    def test_roundtrip_preserves_data(self):
+    def test_roundtrip_preserves_data(self, profile_path: Path):
         """Test that save then load preserves all data."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            profile_path = Path(tmpdir) / "profile.json"
-            original = UserProfile(name="Ammar", preferences={"theme": "dark", "sound": True})
+        original = UserProfile(name="Ammar", preferences={"theme": "dark", "sound": True})
 
-            save_user_profile(original, profile_path)
-            loaded = load_user_profile(profile_path)
+        save_user_profile(original, profile_path)
+        loaded = load_user_profile(profile_path)
 
-            assert loaded.name == original.name
-            assert loaded.version == original.version
-            assert loaded.preferences == original.preferences
+        assert loaded.name == original.name
+        assert loaded.version == original.version
+        assert loaded.preferences == original.preferences
@@ -4,7 +4,6 @@ Tests the waiting indicator for Claude response feedback.
 """
 
 import threading
-import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,6 +11,20 @@ import pytest
 from ara.feedback import FeedbackType
 from ara.feedback.waiting import WaitingIndicator
 
+_WAIT_TIMEOUT = 1.0
+
+
+def _signal_on_play(mock_feedback: MagicMock, calls: int = 1) -> threading.Event:
+    """Return an event that is set once play() has been called ``calls`` times."""
+    played = threading.Event()
+
+    def _play(*_args: object, **_kwargs: object) -> None:
+        if mock_feedback.play.call_count >= calls:
+            played.set()
+
+    mock_feedback.play.side_effect = _play
+    return played
+
 
 class TestWaitingIndicatorStartStop:
     """Tests for WaitingIndicator start/stop behavior."""
@@ -25,38 +38,39 @@ class TestWaitingIndicatorStartStop:
 
     def test_start_begins_playing(self, mock_feedback: MagicMock) -> None:
         """Test that start() begins playing the waiting sound."""
+        played = _signal_on_play(mock_feedback)
         indicator = WaitingIndicator(mock_feedback)
         indicator.start()
 
-        # Give thread time to start
-        time.sleep(0.1)
-
+        assert played.wait(_WAIT_TIMEOUT)
         assert indicator.is_playing
         indicator.stop()
 
     def test_stop_ends_playing(self, mock_feedback: MagicMock) -> None:
         """Test that stop() ends the waiting sound."""
+        played = _signal_on_play(mock_feedback)
         indicator = WaitingIndicator(mock_feedback)
         indicator.start()
-        time.sleep(0.1)
+        thread = indicator._thread
+        assert played.wait(_WAIT_TIMEOUT)
 
         indicator.stop()
-        time.sleep(0.1)
 
         assert not indicator.is_playing
+        assert thread is not None and not thread.is_alive()
 
     def test_is_playing_reflects_state(self, mock_feedback: MagicMock) -> None:
         """Test that is_playing accurately reflects indicator state."""
+        played = _signal_on_play(mock_feedback)
         indicator = WaitingIndicator(mock_feedback)
 
         assert not indicator.is_playing
 
         indicator.start()
-        time.sleep(0.1)
+        assert played.wait(_WAIT_TIMEOUT)
         assert indicator.is_playing
 
         indicator.stop()
-        time.sleep(0.1)
         assert not indicator.is_playing
 
     def test_start_is_idempotent(self, mock_feedback: MagicMock) -> None:
@@ -64,10 +78,11 @@ class TestWaitingIndicatorStartStop:
         indicator = WaitingIndicator(mock_feedback)
 
         indicator.start()
+        thread = indicator._thread
         indicator.start()  # Should not raise or create multiple threads
         indicator.start()
 
-        time.sleep(0.1)
+        assert indicator._thread is thread
         assert indicator.is_playing
 
         indicator.stop()
@@ -77,7 +92,6 @@ class TestWaitingIndicatorStartStop:
         indicator = WaitingIndicator(mock_feedback)
 
         indicator.start()
-        time.sleep(0.1)
 
         indicator.stop()
         indicator.stop()  # Should not raise
@@ -93,11 +107,11 @@ class TestWaitingIndicatorStartStop:
 
     def test_plays_claude_waiting_feedback(self, mock_feedback: MagicMock) -> None:
         """Test that the correct feedback type is played."""
+        played = _signal_on_play(mock_feedback)
         indicator = WaitingIndicator(mock_feedback)
         indicator.start()
 
-        # Give time for at least one play
-        time.sleep(0.2)
+        assert played.wait(_WAIT_TIMEOUT)
 
         indicator.stop()
 
@@ -108,11 +122,11 @@ class TestWaitingIndicatorStartStop:
 
     def test_loops_until_stopped(self, mock_feedback: MagicMock) -> None:
         """Test that the sound loops until stopped."""
-        indicator = WaitingIndicator(mock_feedback, loop_interval=0.05)
+        played = _signal_on_play(mock_feedback, calls=2)
+        indicator = WaitingIndicator(mock_feedback, loop_interval=0.01)
         indicator.start()
 
-        # Let it loop a few times
-        time.sleep(0.2)
+        assert played.wait(_WAIT_TIMEOUT)
 
         indicator.stop()
 
@@ -134,13 +148,13 @@ class TestWaitingIndicatorContextManager:
         self, mock_feedback: MagicMock
     ) -> None:
         """Test that context manager properly starts and stops."""
+        played = _signal_on_play(mock_feedback)
         indicator = WaitingIndicator(mock_feedback)
 
         with indicator:
-            time.sleep(0.1)
+            assert played.wait(_WAIT_TIMEOUT)
             assert indicator.is_playing
 
-        time.sleep(0.1)
         assert not indicator.is_playing
 
     def test_context_manager_stops_on_exception(
@@ -151,10 +165,8 @@ class TestWaitingIndicatorContextManager:
 
         with pytest.raises(ValueError):
             with indicator:
-                time.sleep(0.1)
                 raise ValueError("Test error")
 
-        time.sleep(0.1)
         assert not indicator.is_playing
 
 
@@ -168,7 +180,7 @@ class TestWaitingIndicatorDisabled:
 
         indicator = WaitingIndicator(mock_feedback)
         indicator.start()
-        time.sleep(0.1)
+        assert indicator._thread is None
         indicator.stop()
 
         # Should not have called play since feedback is disabled